@@ -4,6 +4,7 @@ MultiQC modules base class, contains helper functions
 
 import dataclasses
 import fnmatch
+import functools
 import io
 import itertools
 import logging
@@ -13,14 +14,17 @@ import re
 import textwrap
 from collections import defaultdict
 from pathlib import Path
-from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional, Set, Tuple, Union, cast
+from typing import Any, Callable, Dict, Generator, Iterable, Iterator, List, Mapping, Optional, Set, Tuple, Union, cast
 
 import markdown
+import numpy as np
 import packaging.version
 
 from multiqc import config, report
 from multiqc.config import CleanPatternT
-from multiqc.core import software_versions
+from multiqc.core import compressed_files, parse_cache, sample_name_cleaning, software_versions, tracing
+from multiqc.core.loaded_file import READ_ERRORS, LoadedFile
+from multiqc.core.read_ahead import read_ahead
 from multiqc.plots.plotly.plot import Plot
 from multiqc.plots.table_object import (
     ColumnDict,
@@ -30,7 +34,7 @@ from multiqc.plots.table_object import (
     SampleName,
     ValueT,
 )
-from multiqc.types import Anchor, LoadedFileDict, ModuleId, SectionId
+from multiqc.types import Anchor, FileDict, LoadedFileDict, ModuleId, SectionId
 
 logger = logging.getLogger(__name__)
 
@@ -67,6 +71,34 @@ class Section:
 ExtraFunctionType = Callable[[InputRow, List[Tuple[Optional[str], SampleName, SampleName]]], None]
 
 
+@dataclasses.dataclass
+class ParsedData:
+    """
+    Result of the parse phase of a two-phase module, see `BaseMultiqcModule.parse()`.
+    Holds no references to the module object, so it can be pickled to pass it on from
+    a worker process, or to cache it.
+    """
+
+    # Parsed data, keyed in the way the module needs, e.g. by submodule or sample name
+    data: Dict[str, Any] = dataclasses.field(default_factory=dict)
+    # Data sources to add to the report: (section, sample name, source path)
+    data_sources: List[Tuple[Optional[str], SampleName, str]] = dataclasses.field(default_factory=list)
+    # Software versions to add to the report: (version, sample name, software name)
+    software_versions: List[Tuple[str, Optional[str], Optional[str]]] = dataclasses.field(default_factory=list)
+
+    def add_data_source(self, f: LoadedFileDict, s_name: Optional[str] = None, section: Optional[str] = None):
+        """Record the file that data for a sample came from, like `BaseMultiqcModule.add_data_source()`"""
+        source = os.path.abspath(os.path.join(f["root"], f["fn"]))
+        self.data_sources.append((section, SampleName(s_name if s_name is not None else f["s_name"]), source))
+
+    def add_software_version(
+        self, version: Optional[str] = None, sample: Optional[str] = None, software_name: Optional[str] = None
+    ):
+        """Record a software version, like `BaseMultiqcModule.add_software_version()`"""
+        if version is not None:
+            self.software_versions.append((version, sample, software_name))
+
+
 @dataclasses.dataclass
 class SampleGroupingConfig:
     cols_to_weighted_average: Optional[List[Tuple[ColumnKey, ColumnKey]]] = None
@@ -75,10 +107,50 @@ class SampleGroupingConfig:
     extra_functions: Optional[List[ExtraFunctionType]] = dataclasses.field(default_factory=list)
 
 
+class _PathFilters:
+    """
+    `path_filters` and `path_filters_exclude` of a module, each compiled to a single regex matching the
+    file paths as given and prefixed with the analysis paths, and the verdicts for the paths checked
+    """
+
+    EXCLUDED = 1
+    NOT_INCLUDED = 2
+    INCLUDED = 3
+    NOT_FILTERED = 4
+
+    def __init__(self, path_filters: Tuple[str, ...], path_filters_exclude: Tuple[str, ...], analysis_files: Tuple):
+        self.key = (path_filters, path_filters_exclude, analysis_files)
+        self.include = self._compile(path_filters, analysis_files)
+        self.exclude = self._compile(path_filters_exclude, analysis_files)
+        self.verdicts: Dict[str, int] = {}
+
+    @staticmethod
+    def _compile(patterns: Tuple[str, ...], analysis_files: Tuple) -> Optional[re.Pattern]:
+        if not patterns:
+            return None
+        # Same as fnmatch.fnmatch() for each pattern
+        globs = list(patterns) + [os.path.join(analysis_dir, pf) for analysis_dir in analysis_files for pf in patterns]
+        return re.compile("|".join(fnmatch.translate(os.path.normcase(glob)) for glob in globs))
+
+    def check(self, path: str) -> int:
+        path = os.path.normcase(path)
+        if self.exclude is not None and self.exclude.match(path):
+            return _PathFilters.EXCLUDED
+        if self.include is None:
+            return _PathFilters.NOT_FILTERED
+        return _PathFilters.INCLUDED if self.include.match(path) else _PathFilters.NOT_INCLUDED
+
+
 class BaseMultiqcModule:
     # Custom options from user config that can overwrite base module values
     mod_cust_config: Dict = {}
     mod_id: Optional[ModuleId] = None
+    # Set by the module executor to run the phases of a two-phase module separately: stop
+    # after the parse phase, or build the sections from data parsed in a worker process
+    parse_only: bool = False
+    preparsed_data: Optional[ParsedData] = None
+    # Compiled path filters of the module, with the verdicts for the files checked
+    _path_filters: Optional[_PathFilters] = None
 
     def __init__(
         self,
@@ -237,74 +309,193 @@ class BaseMultiqcModule:
         """
         return self.__saved_raw_data
 
-    def find_log_files(self, sp_key: str, filecontents=True, filehandles=False):
+    @classmethod
+    def is_two_phase(cls) -> bool:
+        """
+        Whether the module implements the two-phase API with `parse()` and `build_sections()`
+        """
+        return cls.parse is not BaseMultiqcModule.parse
+
+    def module_files(self) -> Dict[ModuleId, List[FileDict]]:
+        """
+        Files found for the search patterns of the module: the pattern with the module ID
+        as the key, and the patterns with keys starting with "<module ID>/"
+        """
+        return {
+            sp_key: files
+            for sp_key, files in report.files.items()
+            if sp_key == self.id or sp_key.startswith(f"{self.id}/")
+        }
+
+    def parse(self, files: Mapping[ModuleId, List[FileDict]]) -> ParsedData:
+        """
+        Parse phase of a two-phase module. Parses the log files in `files`, found for the
+        search patterns of the module, and returns all data needed to build the report sections.
+        It must not change the report, so it can run in a worker process or be skipped when the
+        parsed data is cached: data sources and software versions are recorded in the returned
+        `ParsedData` rather than added to the report. Raises `ModuleNoSamplesFound` if no data
+        was found.
+        """
+        raise NotImplementedError
+
+    def build_sections(self, parsed: ParsedData) -> None:
+        """
+        Build phase of a two-phase module, always run in the main process. Adds the general
+        stats columns, data files and report sections from the data returned by `parse()`.
+        """
+        raise NotImplementedError
+
+    def parse_and_build_sections(self) -> None:
+        """
+        Run both phases of a two-phase module. Called at the end of `__init__` of the module,
+        so that constructing the module object works the same as for other modules.
+        """
+        parsed = self.preparsed_data
+        if parsed is None:
+            parsed = self.parse(self.module_files())
+        if self.parse_only:
+            self.parsed_data = parsed
+            return
+
+        for section, s_name, source in parsed.data_sources:
+            if not self.is_ignore_sample(s_name):
+                report.data_sources[self.name][section or "all_sections"][s_name] = source
+        for version, sample, software_name in parsed.software_versions:
+            self.add_software_version(version, sample, software_name)
+        self.build_sections(parsed)
+
+    def find_log_files(
+        self,
+        sp_key: str,
+        filecontents=True,
+        filehandles=False,
+        files: Optional[Mapping[ModuleId, List[FileDict]]] = None,
+        lazy=False,
+    ):
         """
         Return matches log files of interest.
         :param sp_key: Search pattern key specified in config
         :param filecontents: f["f"] will contain raw file contents
         :param filehandles: f["f"] will be the file handle
+        :param lazy: f["f"] will be a `LoadedFile`, reading the file only when used: stream the lines
+                     with `f["f"].lines()` instead of `f["f"].splitlines()` to avoid loading large files
+                     into memory, or use `f["f"].text` for the same string as without `lazy`
+        :param files: Found files to pick from by search pattern key, e.g. the files passed to
+                      `parse()`. Defaults to all files found by the file search
         :return: Yields a dict with filename (fn), root directory (root), cleaned sample name
                  generated from the filename (s_name) and either the file contents or file handle
                  for the current matched file (f).
                  As yield is used, the results can be iterated over without loading all files at once
+                 Compressed files (.gz, .bz2, .zst) are decompressed on the fly for filecontents and filehandles.
+                 With `config.read_ahead_files` set, the next files are read in a thread pool while
+                 the current one is parsed.
+        """
+
+        if config.read_ahead_files > 0 and (filehandles or filecontents) and not lazy:
+            # Read the next files in a thread pool while the module parses the current one
+            if not mimetypes.inited:
+                mimetypes.init()  # not thread-safe
+            for f in read_ahead(
+                self._selected_log_files(sp_key, files),
+                functools.partial(self._open_log_file, filehandles=filehandles),
+                size=lambda f: len(f["f"]) if isinstance(f["f"], str) else 0,
+                max_items=config.read_ahead_files,
+                max_bytes=config.read_ahead_max_bytes,
+            ):
+                # The next files were selected already, so point to the one being parsed
+                report.last_found_file = os.path.join(f["root"], f["fn"])
+                yield f
+            return
+
+        for f in self._selected_log_files(sp_key, files):
+            if filehandles or filecontents or lazy:
+                yield from self._open_log_file(f, filehandles=filehandles, lazy=lazy)
+            else:
+                yield f
+
+    def parse_log_files(
+        self,
+        sp_key: str,
+        parse_file: Callable[[LoadedFileDict], Any],
+        filecontents=True,
+        filehandles=False,
+        files: Optional[Mapping[ModuleId, List[FileDict]]] = None,
+        lazy=False,
+    ) -> Iterator[Tuple[LoadedFileDict, Any]]:
+        """
+        Like `find_log_files()`, but also parses each file with `parse_file`, yielding the file
+        dicts together with the parse results. With `config.parse_cache` enabled, the results
+        are cached between runs, and unchanged files are not opened again: for these, f["f"] is None.
+        `parse_file` must take all it needs from the file contents, and return a picklable result,
+        without changing the module or the report. It must not use the sample name f["s_name"],
+        which is made again on every run, so that cached results survive sample name cleaning changes.
+        """
+        cache = parse_cache.get()
+        if cache is None:
+            for f in self.find_log_files(
+                sp_key, filecontents=filecontents, filehandles=filehandles, files=files, lazy=lazy
+            ):
+                with tracing.span("parse file", cat="parse", fn=f["fn"]):
+                    result = parse_file(f)
+                yield f, result
+            return
+
+        fingerprint = parse_cache.parse_fingerprint(self.id, sp_key, parse_file, self.mod_cust_config)
+        try:
+            for f in self._selected_log_files(sp_key, files):
+                key = cache.file_key(os.path.join(f["root"], f["fn"]))
+                result = cache.get(fingerprint, key) if key is not None else parse_cache.MISSING
+                if result is not parse_cache.MISSING:
+                    yield f, result
+                    continue
+                opened: Iterator[LoadedFileDict]
+                if filehandles or filecontents or lazy:
+                    opened = self._open_log_file(f, filehandles=filehandles, lazy=lazy)
+                else:
+                    opened = iter([f])
+                for f in opened:
+                    with tracing.span("parse file", cat="parse", fn=f["fn"]):
+                        result = parse_file(f)
+                    if key is not None:
+                        cache.add(fingerprint, key, result)
+                    yield f, result
+        finally:
+            cache.save()
+
+    def _selected_log_files(
+        self,
+        sp_key: str,
+        files: Optional[Mapping[ModuleId, List[FileDict]]] = None,
+    ) -> Iterator[LoadedFileDict]:
+        """
+        Files found for the search pattern that pass the path filters of the module, not opened yet
         """
 
         # Pick up path filters if specified.
         # Allows modules to be called multiple times with different sets of files
-        def get_path_filters(key: str) -> List[str]:
-            pfs: List[str] = []
-            val = self.mod_cust_config.get(key, [])
-            values = val if isinstance(val, list) else [val]
-            pf: str
-            for pf in values:
-                if pf.startswith("./"):
-                    pf = pf[2:]
-                pfs.append(pf)
-            return pfs
-
-        path_filters: List[str] = get_path_filters("path_filters")
-        path_filters_exclude: List[str] = get_path_filters("path_filters_exclude")
+        path_filters = self._compiled_path_filters()
 
-        for found_file in report.files.get(ModuleId(sp_key), []):
+        for found_file in (report.files if files is None else files).get(ModuleId(sp_key), []):
             # Make a note of the filename so that we can report it if something crashes
             last_found_file: str = os.path.join(found_file["root"], found_file["fn"])
             report.last_found_file = last_found_file
 
-            # Filter out files based on exclusion patterns
-            if path_filters_exclude and len(path_filters_exclude) > 0:
-                # Try both the given path and also the path prefixed with the analysis dirs
-                exclusion_hits = itertools.chain(
-                    (fnmatch.fnmatch(last_found_file, pfe) for pfe in path_filters_exclude),
-                    *(
-                        (
-                            fnmatch.fnmatch(last_found_file, os.path.join(analysis_dir, pfe))
-                            for pfe in path_filters_exclude
-                        )
-                        for analysis_dir in report.analysis_files
-                    ),
-                )
-                if any(exclusion_hits):
+            if path_filters is not None:
+                verdict = path_filters.verdicts.get(last_found_file)
+                if verdict is None:
+                    verdict = path_filters.check(last_found_file)
+                    path_filters.verdicts[last_found_file] = verdict
+                if verdict == _PathFilters.EXCLUDED:
                     logger.debug(
                         f"{sp_key} - Skipping '{report.last_found_file}' as it matched the path_filters_exclude for '{self.name}'"
                     )
                     continue
-
-            # Filter out files based on inclusion patterns
-            if path_filters and len(path_filters) > 0:
-                # Try both the given path and also the path prefixed with the analyis dirs
-                inclusion_hits = itertools.chain(
-                    (fnmatch.fnmatch(last_found_file, pf) for pf in path_filters),
-                    *(
-                        (fnmatch.fnmatch(last_found_file, os.path.join(analysis_dir, pf)) for pf in path_filters)
-                        for analysis_dir in report.analysis_files
-                    ),
-                )
-                if not any(inclusion_hits):
+                elif verdict == _PathFilters.NOT_INCLUDED:
                     logger.debug(
                         f"{sp_key} - Skipping '{report.last_found_file}' as it didn't match the path_filters for '{self.name}'"
                     )
                     continue
-                else:
+                elif verdict == _PathFilters.INCLUDED:
                     logger.debug(
                         f"{sp_key} - Selecting '{report.last_found_file}' as it matched the path_filters for '{self.name}'"
                     )
@@ -318,46 +509,85 @@ class BaseMultiqcModule:
                 "f": None,
             }
 
-            if filehandles or filecontents:
-                try:
-                    # Custom content module can now handle image files
-                    (ftype, encoding) = mimetypes.guess_type(os.path.join(f["root"], f["fn"]))
-                    fh: io.IOBase  # make mypy happy
-                    if ftype is not None and ftype.startswith("image"):
-                        with io.open(os.path.join(f["root"], f["fn"]), "rb") as fh:
-                            # always return file handles
-                            f["f"] = fh
-                            yield f
+            yield f
+
+    def _compiled_path_filters(self) -> Optional[_PathFilters]:
+        """
+        `path_filters` and `path_filters_exclude` of the module compiled to regexes, or None if not set.
+        Compiled again if the filters or the analysis paths change, e.g. between interactive runs
+        """
+
+        def get_path_filters(key: str) -> Tuple[str, ...]:
+            pfs: List[str] = []
+            val = self.mod_cust_config.get(key, [])
+            values = val if isinstance(val, list) else [val]
+            pf: str
+            for pf in values:
+                if pf.startswith("./"):
+                    pf = pf[2:]
+                pfs.append(pf)
+            return tuple(pfs)
+
+        key = (get_path_filters("path_filters"), get_path_filters("path_filters_exclude"), tuple(report.analysis_files))
+        if not key[0] and not key[1]:
+            return None
+        if self._path_filters is None or self._path_filters.key != key:
+            self._path_filters = _PathFilters(*key)
+        return self._path_filters
+
+    @staticmethod
+    def _open_log_file(f: LoadedFileDict, filehandles=False, lazy=False) -> Generator[LoadedFileDict, None, None]:
+        """
+        Yield the file with its contents or, if `filehandles` is set, its file handle in f["f"].
+        If `lazy` is set, f["f"] is a `LoadedFile` instead, which reads the file only when used.
+        Doesn't yield anything if the file can't be read
+        """
+        try:
+            # Custom content module can now handle image files
+            (ftype, encoding) = mimetypes.guess_type(os.path.join(f["root"], f["fn"]))
+            fh: io.IOBase  # make mypy happy
+            if ftype is not None and ftype.startswith("image"):
+                with io.open(os.path.join(f["root"], f["fn"]), "rb") as fh:
+                    # always return file handles
+                    f["f"] = fh
+                    yield f
+            elif lazy and not filehandles:
+                # Only check that the file can be read, the contents are read on demand
+                with io.open(os.path.join(f["root"], f["fn"]), "rb"):
+                    pass
+                with LoadedFile(os.path.join(f["root"], f["fn"])) as loaded:
+                    f["f"] = loaded
+                    yield f
+            else:
+                # Everything else - should be all text files, possibly compressed
+                with compressed_files.open_text(os.path.join(f["root"], f["fn"])) as fh:
+                    if filehandles:
+                        f["f"] = fh
+                        yield f
                     else:
-                        # Everything else - should be all text files
-                        with io.open(os.path.join(f["root"], f["fn"]), "r", encoding="utf-8") as fh:
-                            if filehandles:
-                                f["f"] = fh
-                                yield f
-                            elif filecontents:
+                        with tracing.span("read file", cat="find_log_files", fn=f["fn"]):
+                            try:
+                                f["f"] = fh.read()
+                            except UnicodeDecodeError as e:
+                                logger.debug(
+                                    f"Couldn't read file as utf-8: {f['fn']}, will attempt to skip non-unicode characters\n{e}"
+                                )
                                 try:
-                                    f["f"] = fh.read()
-                                except UnicodeDecodeError as e:
-                                    logger.debug(
-                                        f"Couldn't read file as utf-8: {f['fn']}, will attempt to skip non-unicode characters\n{e}"
-                                    )
-                                    try:
-                                        with io.open(
-                                            os.path.join(f["root"], f["fn"]), "r", encoding="utf-8", errors="ignore"
-                                        ) as fh_ignoring:
-                                            f["f"] = fh_ignoring.read()
-                                    except Exception as e:
-                                        logger.debug(f"Still couldn't read file: {f['fn']}\n{e}")
-                                        f["f"] = None
-                                    finally:
-                                        fh.close()
-                                yield f
-                except (IOError, OSError, ValueError, UnicodeDecodeError) as e:
-                    logger.debug(f"Couldn't open filehandle when returning file: {f['fn']}\n{e}")
-                    f["f"] = None
-            else:
-                yield f
-
+                                    with compressed_files.open_text(
+                                        os.path.join(f["root"], f["fn"]), errors="ignore"
+                                    ) as fh_ignoring:
+                                        f["f"] = fh_ignoring.read()
+                                except Exception as e:
+                                    logger.debug(f"Still couldn't read file: {f['fn']}\n{e}")
+                                    f["f"] = None
+                                finally:
+                                    fh.close()
+                        yield f
+        except READ_ERRORS as e:
+            logger.debug(f"Couldn't open filehandle when returning file: {f['fn']}\n{e}")
+            f["f"] = None
+
+    @tracing.traced("add_section", cat="section")
     def add_section(
         self,
         name: Optional[str] = None,
@@ -556,6 +786,8 @@ class BaseMultiqcModule:
         Group samples and merges numeric metrics by averaging them, optionally normalizing using `normalization_metric_name`
         """
 
+        # Merged groups: (group name, merged row, samples in the group)
+        merged_groups: List[Tuple[SampleGroup, InputRow, List[Tuple[Optional[str], SampleName, SampleName]]]] = []
         rows_by_grouped_samples: Dict[SampleGroup, List[InputRow]] = defaultdict(list)
         for g_name, labels_s_names in self.group_samples_names(list(data_by_sample.keys())).items():
             if len(labels_s_names) == 0:
@@ -571,88 +803,31 @@ class BaseMultiqcModule:
                 _, s_name, original_s_name = labels_s_names[0]
                 rows_by_grouped_samples[g_name] = [
                     InputRow(
-                        sample=s_name, data=cast(Dict[ColumnKey, Optional[ValueT]], data_by_sample[original_s_name])
+                        sample=s_name, data=cast("Dict[ColumnKey, Optional[ValueT]]", data_by_sample[original_s_name])
                     )
                 ]
                 continue
 
             merged_row = InputRow(sample=SampleName(g_name), data={})
+            merged_groups.append((g_name, merged_row, labels_s_names))
+            # Placeholder to keep the order of the groups
+            rows_by_grouped_samples[g_name] = []
 
-            # Init a dictionary of all cols that would be summed to serve as weights
-            sum_by_col: Dict[ColumnKey, float] = dict()
-
-            if grouping_config.cols_to_weighted_average:
-                for _, weight_col_key in grouping_config.cols_to_weighted_average:
-                    sum_by_col[weight_col_key] = 0
-
-                # Calculate the weights
-                for col in sum_by_col.keys():
-                    for _, _, original_s_name in labels_s_names:
-                        val = data_by_sample[original_s_name][col]
-                        if isinstance(val, int) or isinstance(val, float):
-                            sum_by_col[col] += float(val)
-
-                for col, weight_col in grouping_config.cols_to_weighted_average:
-                    weight = sum_by_col[weight_col]
-                    if weight > 0:
-                        merged_row.data[col] = (
-                            sum(
-                                [
-                                    float(data_by_sample[original_s_name][col])
-                                    * float(data_by_sample[original_s_name][weight_col])
-                                    if (
-                                        isinstance(data_by_sample[original_s_name][col], float)
-                                        or isinstance(data_by_sample[original_s_name][col], int)
-                                    )
-                                    and (
-                                        isinstance(data_by_sample[original_s_name][weight_col], float)
-                                        or isinstance(data_by_sample[original_s_name][weight_col], int)
-                                    )
-                                    else 0
-                                    for _, _, original_s_name in labels_s_names
-                                ]
-                            )
-                            / weight
-                        )
-
-            if grouping_config.cols_to_average:
-                for col in grouping_config.cols_to_average:
-                    merged_row.data[col] = sum(
-                        [
-                            float(data_by_sample[original_s_name][col])
-                            if (
-                                isinstance(data_by_sample[original_s_name][col], float)
-                                or isinstance(data_by_sample[original_s_name][col], int)
-                            )
-                            else 0
-                            for _, _, original_s_name in labels_s_names
-                        ]
-                    ) / len(labels_s_names)
-
-            if grouping_config.cols_to_sum:
-                for col in grouping_config.cols_to_sum:
-                    if col in sum_by_col:
-                        merged_row.data[col] = sum_by_col[col]
-                    else:
-                        merged_row.data[col] = sum(
-                            [
-                                float(data_by_sample[original_s_name][col])
-                                if (
-                                    isinstance(data_by_sample[original_s_name][col], float)
-                                    or isinstance(data_by_sample[original_s_name][col], int)
-                                )
-                                else 0
-                                for _, _, original_s_name in labels_s_names
-                            ]
-                        )
+        if merged_groups:
+            _merge_group_metrics(
+                data_by_sample,
+                [(merged_row, [s for _, _, s in labels_s_names]) for _, merged_row, labels_s_names in merged_groups],
+                grouping_config,
+            )
 
+        for g_name, merged_row, labels_s_names in merged_groups:
             # Add count of fail statuses
             if grouping_config.extra_functions:
                 for fn in grouping_config.extra_functions:
                     fn(merged_row, labels_s_names)
 
             rows_by_grouped_samples[g_name] = [merged_row] + [
-                InputRow(sample=s_name, data=cast(Dict[ColumnKey, Optional[ValueT]], data_by_sample[original_s_name]))
+                InputRow(sample=s_name, data=cast("Dict[ColumnKey, Optional[ValueT]]", data_by_sample[original_s_name]))
                 for _, s_name, original_s_name in labels_s_names
             ]
 
@@ -709,8 +884,7 @@ class BaseMultiqcModule:
             # Couldn't clean as FASTQ. Just concatenating the clean names.
             return "_".join(clean_names)
 
-        sn = SampleNameMeta(original_name=SampleName(s_name))
-        trimmed_name: SampleName = sn.original_name
+        original_name = SampleName(s_name)
 
         # Backwards compatability - if f is a string, it's probably the root (this used to be the second argument)
         if isinstance(f, str):
@@ -726,6 +900,17 @@ class BaseMultiqcModule:
             if "sp_key" in f and search_pattern_key is None:
                 search_pattern_key = f["sp_key"]
 
+        # The cleaning rules are compiled once for the config state, and cleaned names are memoized
+        program = sample_name_cleaning.get_program(str(self.anchor), fn_clean_exts, fn_clean_trim, prepend_dirs)
+        memo_key = (original_name, root, filename, search_pattern_key)
+        report.runtimes.clean_s_name_calls += 1
+        cached = program.names.get(memo_key)
+        if cached is not None:
+            report.runtimes.clean_s_name_hits += 1
+            return cached
+
+        trimmed_name: SampleName = original_name
+
         # For modules setting s_name from file contents, set s_name back to the filename
         # (if wanted in the config)
         if filename is not None and (
@@ -742,10 +927,6 @@ class BaseMultiqcModule:
         # For consistency with other modules, we keep just the basename
         trimmed_name = SampleName(os.path.basename(trimmed_name))
 
-        if fn_clean_exts is None:
-            fn_clean_exts = config.fn_clean_exts
-        if fn_clean_trim is None:
-            fn_clean_trim = config.fn_clean_trim
         if prepend_dirs is None:
             prepend_dirs = config.prepend_dirs
 
@@ -762,86 +943,9 @@ class BaseMultiqcModule:
             if len(dirs) > 0:
                 trimmed_name = SampleName(f"{sep.join(dirs)}{sep}{trimmed_name}")
 
-        if config.fn_clean_sample_names:
-            # Split then take first section to remove everything after these matches
-            _ext: Union[str, Dict[str, Union[str, List[str]]]]
-            ext: Dict[str, Union[str, List[str]]]
-            for _ext in fn_clean_exts:
-                # Go through different filter types
-                if isinstance(_ext, str):
-                    ext = {"type": "truncate", "pattern": _ext}
-                else:
-                    ext = _ext
-
-                # Check if this config is limited to a module
-                if "module" in ext:
-                    if isinstance(ext["module"], str):
-                        ext["module"] = [ext["module"]]
-                    if not any([m == self.anchor for m in ext["module"]]):
-                        continue
-
-                pattern = ext.get("pattern", "")
-                assert isinstance(pattern, str)
-                if ext.get("type") == "truncate":
-                    trimmed_name = SampleName(str(trimmed_name).split(pattern, 1)[0])
-                elif ext.get("type") in ("remove", "replace"):
-                    if ext["type"] == "replace":
-                        logger.warning(
-                            "use 'config.fn_clean_sample_names.remove' instead "
-                            "of 'config.fn_clean_sample_names.replace' [deprecated]"
-                        )
-                    trimmed_name = SampleName(str(trimmed_name).replace(pattern, ""))
-                elif ext.get("type") == "regex":
-                    trimmed_name = SampleName(re.sub(pattern, "", str(trimmed_name)))
-                elif ext.get("type") == "regex_keep":
-                    match = re.search(pattern, str(trimmed_name))
-                    trimmed_name = SampleName(match.group()) if match else trimmed_name
-                elif ext.get("type") is None:
-                    logger.error(f'config.fn_clean_exts config was missing "type" key: {ext}')
-                else:
-                    logger.error(f"Unrecognised sample name cleaning pattern: {ext.get('type')}")
-            # Trim off characters at the end of names
-            for characters in fn_clean_trim:
-                if trimmed_name.endswith(characters):
-                    trimmed_name = SampleName(str(trimmed_name)[: -len(characters)])
-                if trimmed_name.startswith(characters):
-                    trimmed_name = SampleName(str(trimmed_name)[len(characters) :])
-
-        # Remove trailing whitespace
-        trimmed_name = SampleName(str(trimmed_name).strip())
-
-        # If we cleaned back to an empty string, just use the original value
-        if trimmed_name == "":
-            trimmed_name = sn.original_name
-
-        # Do any hard replacements that are set with --replace-names
-        if config.sample_names_replace:
-            for s_name_search, s_name_replace in config.sample_names_replace.items():
-                try:
-                    # Skip if we're looking for exact matches only
-                    if config.sample_names_replace_exact:
-                        # Simple strings
-                        if not config.sample_names_replace_regex and str(trimmed_name) != s_name_search:
-                            continue
-                        # regexes
-                        if config.sample_names_replace_regex and not re.fullmatch(s_name_search, trimmed_name):
-                            continue
-                    # Replace - regex
-                    if config.sample_names_replace_regex:
-                        trimmed_name = SampleName(re.sub(s_name_search, s_name_replace, str(trimmed_name)))
-                    # Replace - simple string
-                    else:
-                        # Complete name swap
-                        if config.sample_names_replace_complete:
-                            if s_name_search in trimmed_name:
-                                trimmed_name = SampleName(s_name_replace)
-                        # Partial substring replace
-                        else:
-                            trimmed_name = SampleName(str(trimmed_name).replace(s_name_search, s_name_replace))
-                except re.error as e:
-                    logger.error(f"Error with sample name replacement regex: {e}")
-
-        sn.trimmed_name = trimmed_name
+        # Cleaning patterns, trimming and hard replacements that are set with --replace-names
+        trimmed_name = SampleName(program.clean(trimmed_name, original_name))
+        program.names[memo_key] = trimmed_name
         return trimmed_name
 
     def ignore_samples(self, data, sample_names_ignore=None, sample_names_ignore_re=None):
@@ -1015,3 +1119,76 @@ class BaseMultiqcModule:
 
         # Save the file
         report.write_data_file(data, fn, sort_cols, data_format)
+
+
+def _merge_group_metrics(
+    data_by_sample: Dict[SampleName, Dict[ColumnKey, ValueT]],
+    groups: List[Tuple[InputRow, List[SampleName]]],
+    grouping_config: SampleGroupingConfig,
+) -> None:
+    """
+    Set the weighted averages, averages and sums of the metrics of the samples in each group
+    on the merged rows. The metrics of all samples are put in one matrix, with non-numeric
+    values counting as 0, and the sums are computed for all groups and columns at once. The
+    values of the groups are added up one sample at a time, so that the sums are the same as
+    when adding them up one by one in Python.
+    """
+    weighted_cols = grouping_config.cols_to_weighted_average or []
+    avg_cols = grouping_config.cols_to_average or []
+    sum_cols = grouping_config.cols_to_sum or []
+    col_idx: Dict[ColumnKey, int] = {}
+    for col in itertools.chain(*weighted_cols, avg_cols, sum_cols):
+        col_idx.setdefault(col, len(col_idx))
+    if not col_idx:
+        return
+
+    # Matrix of the metric values, one row per sample in the groups, and a mask of numeric values
+    cols = list(col_idx)
+    shape = (sum(len(s_names) for _, s_names in groups), len(cols))
+    cells = list(
+        itertools.chain.from_iterable(
+            map(data_by_sample[s_name].get, cols) for _, s_names in groups for s_name in s_names
+        )
+    )
+    is_numeric = list(map(isinstance, cells, itertools.repeat((int, float))))
+    numeric = np.array(is_numeric, dtype=bool).reshape(shape)
+    values = np.zeros(shape)
+    values[numeric] = np.fromiter(itertools.compress(cells, is_numeric), dtype=float, count=int(numeric.sum()))
+
+    # Products of the values and their weights, for the weighted averages
+    products = np.zeros((shape[0], len(weighted_cols)))
+    for j, (col, weight_col) in enumerate(weighted_cols):
+        c, w = col_idx[col], col_idx[weight_col]
+        both_numeric = numeric[:, c] & numeric[:, w]
+        products[both_numeric, j] = values[both_numeric, c] * values[both_numeric, w]
+
+    # Row indices of the samples of each group, padded to the size of the largest group
+    sizes = np.array([len(s_names) for _, s_names in groups])
+    starts = np.concatenate(([0], np.cumsum(sizes)[:-1]))
+    positions = np.arange(sizes.max())
+    in_group = positions[None, :] < sizes[:, None]
+    row_idx = np.where(in_group, starts[:, None] + positions[None, :], 0)
+
+    sums = np.zeros((len(groups), len(col_idx)))
+    product_sums = np.zeros((len(groups), len(weighted_cols)))
+    numeric_counts = np.zeros((len(groups), len(col_idx)), dtype=int)
+    for k in positions:
+        where = in_group[:, k, None]
+        np.add(sums, values[row_idx[:, k]], out=sums, where=where)
+        np.add(product_sums, products[row_idx[:, k]], out=product_sums, where=where)
+        np.add(numeric_counts, numeric[row_idx[:, k]], out=numeric_counts, where=where)
+
+    # Sums of columns without numeric values stay an integer 0, as when adding them up in Python
+    sums_with_ints = sums.astype(object)
+    sums_with_ints[numeric_counts == 0] = 0
+    sums_list = sums_with_ints.tolist()
+    product_sums_list = product_sums.tolist()
+    for g, (merged_row, s_names) in enumerate(groups):
+        for j, (col, weight_col) in enumerate(weighted_cols):
+            weight = sums_list[g][col_idx[weight_col]]
+            if weight > 0:
+                merged_row.data[col] = product_sums_list[g][j] / weight
+        for col in avg_cols:
+            merged_row.data[col] = sums_list[g][col_idx[col]] / len(s_names)
+        for col in sum_cols:
+            merged_row.data[col] = sums_list[g][col_idx[col]]
@@ -11,6 +11,7 @@ import itertools
 # Default logger will be replaced by caller
 import logging
 import os
+import pickle
 import subprocess
 import sys
 from datetime import datetime
@@ -76,6 +77,10 @@ simple_output: bool
 template: str
 profile_runtime: bool
 profile_memory: bool
+profile_rss: bool
+trace: bool
+plot_data_compression: str
+plot_data_compression_level: Optional[int]
 pandoc_template: str
 read_count_multiplier: float
 read_count_prefix: str
@@ -167,6 +172,16 @@ versions_table_group_header: str
 data_format_extensions: Dict[str, str]
 export_plot_formats: List[str]
 filesearch_file_shared: List[str]
+search_workers: int
+search_walk_threads: int
+module_workers: int
+read_ahead_files: int
+read_ahead_max_bytes: int
+search_cache: bool
+search_cache_dir: Optional[str]
+search_cache_reset: bool
+parse_cache: bool
+parse_cache_reset: bool
 custom_content: Dict
 fn_clean_sample_names: bool
 use_filename_as_sample_name: bool
@@ -309,6 +324,11 @@ def reset():
     explicit_user_config_files.clear()
     load_defaults()
 
+    # Imported here, as the module depends on the config
+    from multiqc.core import sample_name_cleaning
+
+    sample_name_cleaning.clear()
+
 
 def find_user_files():
     """
@@ -597,6 +617,30 @@ def update(u):
     return update_dict(globals(), u)
 
 
+def snapshot() -> Dict:
+    """
+    Picklable copy of the current config values. Used to pass the config on to
+    worker processes, where it's restored with `restore()`.
+    """
+    state = {}
+    for k, v in globals().items():
+        if k.startswith("_") or k == "logger" or isinstance(v, type(sys)) or callable(v):
+            continue
+        try:
+            pickle.dumps(v)
+        except Exception:
+            continue
+        state[k] = v
+    return state
+
+
+def restore(state: Dict):
+    """
+    Restore config values saved with `snapshot()`
+    """
+    globals().update(state)
+
+
 def get_cov_thresholds(config_key: str) -> Tuple[List[int], List[int]]:
     """
     Reads coverage thresholds from the config, otherwise sets sensible defaults. Useful for modules like mosdepth, qualimap (BamQC), ngsbits
@@ -0,0 +1,68 @@
+"""
+Transparent reading of compressed log files
+"""
+
+import bz2
+import gzip
+import io
+import logging
+from pathlib import Path
+from typing import BinaryIO, List, Optional, Union
+
+try:
+    import zstandard  # type: ignore
+except ImportError:  # Optional dependency
+    zstandard = None  # type: ignore[assignment]
+
+logger = logging.getLogger(__name__)
+
+# Extensions of compressed files that are decompressed when searching and reading them
+COMPRESSION_EXTENSIONS = [".gz", ".bz2"] + ([".zst"] if zstandard is not None else [])
+
+# Encodings that `mimetypes.guess_type` returns for these extensions
+COMPRESSION_ENCODINGS = {"gzip", "bzip2"}
+
+
+def compression_extension(filename: str) -> Optional[str]:
+    """
+    Compression extension of the file name, if it's a compressed file that can be decompressed
+    """
+    for ext in COMPRESSION_EXTENSIONS:
+        if filename.endswith(ext) and len(filename) > len(ext):
+            return ext
+    return None
+
+
+def match_filenames(filename: str) -> List[str]:
+    """
+    File names to match search patterns against: the file name, and for compressed files,
+    also the name without the compression extension, so `*.stats` matches `sample.stats.gz`
+    """
+    ext = compression_extension(filename)
+    if ext is None:
+        return [filename]
+    return [filename, filename[: -len(ext)]]
+
+
+def open_binary(path: Union[str, Path]) -> BinaryIO:
+    """
+    Open a file for reading bytes, decompressing it on the fly if it's compressed.
+    Reads from plain files go straight to the file descriptor.
+    """
+    ext = compression_extension(str(path))
+    if ext == ".gz":
+        return gzip.open(path, "rb")  # type: ignore
+    if ext == ".bz2":
+        return bz2.open(path, "rb")  # type: ignore
+    if ext == ".zst":
+        return zstandard.open(path, "rb")
+    return io.open(path, "rb", buffering=0)  # type: ignore
+
+
+def open_text(path: Union[str, Path], errors: str = "strict") -> io.TextIOWrapper:
+    """
+    Open a file for reading UTF-8 text, decompressing it on the fly if it's compressed
+    """
+    if compression_extension(str(path)) is None:
+        return io.open(path, "r", encoding="utf-8", errors=errors)
+    return io.TextIOWrapper(open_binary(path), encoding="utf-8", errors=errors)
@@ -1,18 +1,30 @@
+import concurrent.futures
+import copy
+import dataclasses
 import logging
+import os
+import shutil
 import sys
+import tempfile
 import time
 import traceback
 import tracemalloc
-from typing import Callable, Dict, List, Union
+from collections import defaultdict
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Set, Union
 
 import rich
 from importlib_metadata import EntryPoint
 from rich.syntax import Syntax
 
 from multiqc import config, report
-from multiqc.base_module import BaseMultiqcModule, ModuleNoSamplesFound
-from multiqc.core import plugin_hooks, software_versions
+from multiqc.base_module import BaseMultiqcModule, ModuleNoSamplesFound, ParsedData
+from multiqc.core import memory_usage, parse_cache, plugin_hooks, software_versions, tmp_dir, tracing
 from multiqc.core.exceptions import NoAnalysisFound, RunError
+from multiqc.plots.plotly.plot import Plot
+from multiqc.plots.table_object import ColumnDict, InputRow
+from multiqc.report import MemoryUsage, TraceEvent
+from multiqc.types import Anchor, ColumnKey, SampleGroup
 
 logger = logging.getLogger(__name__)
 
@@ -43,128 +55,28 @@ def exec_modules(mod_dicts_in_order: List[Dict[str, Dict]]) -> None:
     if not required_logs_found(mod_names):
         raise RunError()
 
+    if config.parse_cache_reset:
+        parse_cache.reset()
+
     # Run the modules!
     plugin_hooks.mqc_trigger("before_modules")
     sys_exit_code = 0
     total_mods_starttime = time.time()
 
-    for mod_idx, mod_dict in enumerate(mod_dicts_in_order):
-        mod_starttime = time.time()
-        if config.profile_memory:
-            tracemalloc.start()
-
-        this_module: str = list(mod_dict.keys())[0]
-        logger.debug(f"Running module: {this_module}")
-        mod_cust_config: Dict = list(mod_dict.values())[0] or {}
-        # noinspection PyBroadException
-        try:
-            entry_point: EntryPoint = config.avail_modules[this_module]
-            module_initializer: Callable[[], Union[BaseMultiqcModule, List[BaseMultiqcModule]]] = entry_point.load()
-            setattr(module_initializer, "mod_cust_config", mod_cust_config)
-            setattr(module_initializer, "mod_id", this_module)
-
-            # *********************************************
-            # RUN MODULE. Heavy part. Run module logic to parse logs and prepare plot data.
-            these_modules: Union[BaseMultiqcModule, List[BaseMultiqcModule]] = module_initializer()
-            # END RUN MODULE
-            # *********************************************
-
-            # Single module initializer can create multiple module objects (see custom_content)
-            if not isinstance(these_modules, list):
-                these_modules = [these_modules]
-
-            # Clean up non-base attribute to save memory.
-            trace_memory("before cleaning up attributes")
-            for m in these_modules:
-                m.clean_child_attributes()
-            trace_memory("after cleaning up attributes")
-
-            # Override duplicated outputs
-            for prev_mod in report.modules:
-                if prev_mod.name in set(m.name for m in these_modules):
-                    logger.info(
-                        f'Previous "{prev_mod.name}" run will be overridden. It\'s not yet supported to add new samples to a module with multiqc.parse_logs()'
-                    )
-                    report.modules.remove(prev_mod)
-            report.modules.extend(these_modules)
-
-        except ModuleNoSamplesFound:
-            logger.debug(f"No samples found: {this_module}")
-        except UserWarning:  # UserWarning deprecated from 1.16
-            msg = f"DEPRECIATED: Please raise 'ModuleNoSamplesFound' instead of 'UserWarning' in module: {this_module}"
-            if config.strict:
-                logger.error(msg)
-                report.lint_errors.append(msg)
-            else:
-                logger.debug(msg)
-            logger.debug(f"No samples found: {this_module}")
-        except KeyboardInterrupt:
-            raise
-        except:  # noqa: E722
-            if config.strict:
-                # Crash quickly in the strict mode. This can be helpful for interactive debugging of modules.
-                raise
-
-            # Flag the error, but carry on
-            class CustomTraceback:
-                type, value, traceback = sys.exc_info()
-
-                def __rich_console__(self, console: rich.console.Console, options: rich.console.ConsoleOptions):
-                    issue_url = f"https://github.com/MultiQC/MultiQC/issues/new?template=bug_report.md&title={this_module}%20module%20-%20{type.__name__}"
-                    err_msg = (
-                        f"Please copy this log and report it at [bright_blue][link={issue_url}]"
-                        f"https://github.com/MultiQC/MultiQC/issues[/link][/] \n"
-                        f"[bold underline]Please attach a file that triggers the error.[/] "
-                    )
-                    if report.last_found_file:
-                        err_msg += f"The last file found was: [green]{report.last_found_file}[/]\n"
-
-                    yield err_msg
-                    yield Syntax(traceback.format_exc(), "python")
-
-                def __rich_measure__(self, console: rich.console.Console, options: rich.console.ConsoleOptions):
-                    tb_width = max([len(line) for line in traceback.format_exc().split("\n")])
-                    log_width = 71
-                    if report.last_found_file:
-                        log_width += len(report.last_found_file)
-                    panel_width = max(tb_width, log_width)
-                    return rich.console.Measurement(panel_width, panel_width)
-
-            from multiqc.core.log_and_rich import rich_console_print
-
-            rich_console_print(
-                rich.panel.Panel(
-                    CustomTraceback(),
-                    title=f"Oops! The '[underline]{this_module}[/]' MultiQC module broke...",
-                    expand=False,
-                    border_style="red",
-                    style="on #272822",
-                )
-            )
-            # Still log.debug this so that it ends up in the log file - above is just stderr for now
-            logger.debug(
-                f"Oops! The '{this_module}' MultiQC module broke...\n"
-                + ("=" * 80)
-                + "\n"
-                + traceback.format_exc()
-                + ("=" * 80)
-            )
-            # Exit code 1 for CI failures etc
-            sys_exit_code = 1
-
-        report.runtimes.mods[mod_names[mod_idx]] = time.time() - mod_starttime
-        if config.profile_memory:
-            mem_current, mem_peak = tracemalloc.get_traced_memory()
-            tracemalloc.stop()
-            report.peak_memory_bytes_per_module[mod_names[mod_idx]] = mem_peak
-            report.diff_memory_bytes_per_module[mod_names[mod_idx]] = mem_current
-            logger.warning(
-                f"{this_module}: memory change: {mem_current:,d}b, peak during module execution: {mem_peak:,d}b"
-            )
-        if config.profile_runtime:
-            logger.warning(f"{this_module}: module run time: {report.runtimes.mods[mod_names[mod_idx]]:.2f}s")
+    n_workers = min(config.module_workers or 1, len(mod_dicts_in_order))
+    if n_workers > 1 and config.profile_memory:
+        logger.debug("Running modules in a single process, as memory profiling is enabled")
+        n_workers = 1
+    with tracing.span("run modules", cat="module", n_workers=n_workers):
+        if n_workers > 1:
+            sys_exit_code = _exec_modules_parallel(mod_dicts_in_order, n_workers)
+        else:
+            for mod_dict in mod_dicts_in_order:
+                sys_exit_code = max(sys_exit_code, _exec_module(mod_dict))
 
     report.runtimes.total_mods = time.time() - total_mods_starttime
+    parse_cache.prune()
+    parse_cache.close()
 
     # Again, if config.require_logs is set, check if for all explicitly requested
     # modules samples were found.
@@ -181,6 +93,422 @@ def exec_modules(mod_dicts_in_order: List[Dict[str, Dict]]) -> None:
     plugin_hooks.mqc_trigger("after_modules")
 
 
+def _load_module(mod_dict: Dict[str, Dict]) -> Callable[[], Union[BaseMultiqcModule, List[BaseMultiqcModule]]]:
+    this_module: str = list(mod_dict.keys())[0]
+    mod_cust_config: Dict = list(mod_dict.values())[0] or {}
+    entry_point: EntryPoint = config.avail_modules[this_module]
+    module_initializer: Callable[[], Union[BaseMultiqcModule, List[BaseMultiqcModule]]] = entry_point.load()
+    setattr(module_initializer, "mod_cust_config", mod_cust_config)
+    setattr(module_initializer, "mod_id", this_module)
+    return module_initializer
+
+
+def _is_two_phase(module_initializer: Callable) -> bool:
+    return (
+        isinstance(module_initializer, type)
+        and issubclass(module_initializer, BaseMultiqcModule)
+        and module_initializer.is_two_phase()
+    )
+
+
+def _init_module(mod_dict: Dict[str, Dict], preparsed_data: Optional[ParsedData] = None) -> List[BaseMultiqcModule]:
+    """
+    Run the module initializer, which does the heavy part of parsing the logs and preparing
+    the plot data. Returns the module objects it created. For two-phase modules, `preparsed_data`
+    is the result of the parse phase run in a worker process, to build the sections from.
+    """
+    module_initializer = _load_module(mod_dict)
+    if _is_two_phase(module_initializer):
+        setattr(module_initializer, "parse_only", False)
+        setattr(module_initializer, "preparsed_data", preparsed_data)
+
+    # *********************************************
+    # RUN MODULE. Heavy part. Run module logic to parse logs and prepare plot data.
+    try:
+        these_modules: Union[BaseMultiqcModule, List[BaseMultiqcModule]] = module_initializer()
+    finally:
+        if preparsed_data is not None:
+            setattr(module_initializer, "preparsed_data", None)
+    # END RUN MODULE
+    # *********************************************
+
+    # Single module initializer can create multiple module objects (see custom_content)
+    if not isinstance(these_modules, list):
+        these_modules = [these_modules]
+
+    # Clean up non-base attribute to save memory.
+    trace_memory("before cleaning up attributes")
+    for m in these_modules:
+        m.clean_child_attributes()
+    trace_memory("after cleaning up attributes")
+    return these_modules
+
+
+def _add_modules(these_modules: List[BaseMultiqcModule]):
+    # Override duplicated outputs
+    for prev_mod in report.modules:
+        if prev_mod.name in set(m.name for m in these_modules):
+            logger.info(
+                f'Previous "{prev_mod.name}" run will be overridden. It\'s not yet supported to add new samples to a module with multiqc.parse_logs()'
+            )
+            report.modules.remove(prev_mod)
+    report.modules.extend(these_modules)
+
+
+def _log_no_samples(this_module: str, deprecated_user_warning: bool = False):
+    if deprecated_user_warning:  # UserWarning deprecated from 1.16
+        msg = f"DEPRECIATED: Please raise 'ModuleNoSamplesFound' instead of 'UserWarning' in module: {this_module}"
+        if config.strict:
+            logger.error(msg)
+            report.lint_errors.append(msg)
+        else:
+            logger.debug(msg)
+    logger.debug(f"No samples found: {this_module}")
+
+
+def _log_module_time(this_module: str):
+    if config.profile_runtime:
+        logger.warning(f"{this_module}: module run time: {report.runtimes.mods[this_module]:.2f}s")
+    if this_module in report.runtimes.memory_mods:
+        logger.warning(f"{this_module}: {memory_usage.format_usage(report.runtimes.memory_mods[this_module])}")
+
+
+def _finish_module_memory(
+    memory: MemoryUsage,
+    saved_raw_data_keys_before: Set[str],
+    plot_ids_before: Set[Anchor],
+) -> MemoryUsage:
+    """
+    Sample the memory after running a module, and measure the data and the plots it added
+    """
+    memory_usage.finish(memory)
+    memory_usage.measure_module_data(
+        memory,
+        (v for k, v in report.saved_raw_data.items() if k not in saved_raw_data_keys_before),
+        (v for k, v in report.plot_by_id.items() if k not in plot_ids_before),
+    )
+    return memory
+
+
+def _exec_module(mod_dict: Dict[str, Dict], preparsed: Optional["ModuleResult"] = None) -> int:
+    """
+    Run a module in the main process and add it to the report. Returns the exit code: 1 if
+    the module crashed, 0 otherwise. `preparsed` is the result of the parse phase of a
+    two-phase module run in a worker process.
+    """
+    sys_exit_code = 0
+    mod_starttime = time.time() - (preparsed.run_time if preparsed is not None else 0)
+    if config.profile_memory:
+        tracemalloc.start()
+    memory = memory_usage.start()
+    saved_raw_data_keys_before = set(report.saved_raw_data) if memory is not None else set()
+    plot_ids_before = set(report.plot_by_id) if memory is not None else set()
+
+    if preparsed is not None:
+        _add_clean_s_name_stats(preparsed)
+
+    this_module: str = list(mod_dict.keys())[0]
+    logger.debug(f"Running module: {this_module}")
+    # noinspection PyBroadException
+    try:
+        with tracing.span(this_module, cat="module"):
+            _add_modules(_init_module(mod_dict, preparsed.parsed_data if preparsed is not None else None))
+
+    except ModuleNoSamplesFound:
+        _log_no_samples(this_module)
+    except UserWarning:
+        _log_no_samples(this_module, deprecated_user_warning=True)
+    except KeyboardInterrupt:
+        raise
+    except:  # noqa: E722
+        if config.strict:
+            # Crash quickly in the strict mode. This can be helpful for interactive debugging of modules.
+            raise
+
+        # Flag the error, but carry on
+        class CustomTraceback:
+            type, value, traceback = sys.exc_info()
+
+            def __rich_console__(self, console: rich.console.Console, options: rich.console.ConsoleOptions):
+                issue_url = f"https://github.com/MultiQC/MultiQC/issues/new?template=bug_report.md&title={this_module}%20module%20-%20{type.__name__}"
+                err_msg = (
+                    f"Please copy this log and report it at [bright_blue][link={issue_url}]"
+                    f"https://github.com/MultiQC/MultiQC/issues[/link][/] \n"
+                    f"[bold underline]Please attach a file that triggers the error.[/] "
+                )
+                if report.last_found_file:
+                    err_msg += f"The last file found was: [green]{report.last_found_file}[/]\n"
+
+                yield err_msg
+                yield Syntax(traceback.format_exc(), "python")
+
+            def __rich_measure__(self, console: rich.console.Console, options: rich.console.ConsoleOptions):
+                tb_width = max([len(line) for line in traceback.format_exc().split("\n")])
+                log_width = 71
+                if report.last_found_file:
+                    log_width += len(report.last_found_file)
+                panel_width = max(tb_width, log_width)
+                return rich.console.Measurement(panel_width, panel_width)
+
+        from multiqc.core.log_and_rich import rich_console_print
+
+        rich_console_print(
+            rich.panel.Panel(
+                CustomTraceback(),
+                title=f"Oops! The '[underline]{this_module}[/]' MultiQC module broke...",
+                expand=False,
+                border_style="red",
+                style="on #272822",
+            )
+        )
+        # Still log.debug this so that it ends up in the log file - above is just stderr for now
+        logger.debug(
+            f"Oops! The '{this_module}' MultiQC module broke...\n"
+            + ("=" * 80)
+            + "\n"
+            + traceback.format_exc()
+            + ("=" * 80)
+        )
+        # Exit code 1 for CI failures etc
+        sys_exit_code = 1
+
+    report.runtimes.mods[this_module] = time.time() - mod_starttime
+    if config.profile_memory:
+        mem_current, mem_peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        report.peak_memory_bytes_per_module[this_module] = mem_peak
+        report.diff_memory_bytes_per_module[this_module] = mem_current
+        logger.warning(f"{this_module}: memory change: {mem_current:,d}b, peak during module execution: {mem_peak:,d}b")
+    if memory is not None:
+        report.runtimes.memory_mods[this_module] = _finish_module_memory(
+            memory, saved_raw_data_keys_before, plot_ids_before
+        )
+    _log_module_time(this_module)
+    return sys_exit_code
+
+
+@dataclasses.dataclass
+class ModuleResult:
+    """
+    Module objects created by running a module in a worker process, and the changes that
+    running it made to the global report state, to be merged in the main process. For
+    two-phase modules, only the result of the parse phase, to build the sections from in
+    the main process.
+    """
+
+    modules: List[BaseMultiqcModule]
+    no_samples: bool
+    deprecated_user_warning: bool
+    run_time: float
+    general_stats_data: List[Dict[SampleGroup, List[InputRow]]]
+    general_stats_headers: List[Dict[ColumnKey, ColumnDict]]
+    data_sources: Dict[str, Dict[str, Dict]]
+    software_versions: Dict[str, Dict[str, List]]
+    saved_raw_data: Dict[str, Any]
+    plot_by_id: Dict[Anchor, Plot]
+    plot_data: Dict[Anchor, Dict]
+    html_ids_by_scope: Dict[Optional[str], Set[Anchor]]  # Only the IDs added by the module
+    lint_errors: List[str]
+    parsed_data: Optional[ParsedData] = None
+    clean_s_name_calls: int = 0
+    clean_s_name_hits: int = 0
+    memory: Optional[MemoryUsage] = None  # Memory of the worker process, with `config.profile_rss`
+    trace_events: List[TraceEvent] = dataclasses.field(default_factory=list)  # With `config.trace`
+
+
+# Report state before running the modules, set in each worker process
+_worker_html_ids_by_scope: Dict[Optional[str], Set[Anchor]] = {}
+_worker_saved_raw_data_keys: Set[str] = set()
+
+
+def _init_module_worker(config_state: Dict, report_state: Dict):
+    """
+    Initialize a worker process with the config and the report state of the main process
+    """
+    global _worker_html_ids_by_scope, _worker_saved_raw_data_keys
+    config.restore(config_state)
+    report.files = report_state["files"]
+    report.analysis_files = report_state["analysis_files"]
+    _worker_html_ids_by_scope = report_state["html_ids_by_scope"]
+    _worker_saved_raw_data_keys = report_state["saved_raw_data_keys"]
+
+
+def _exec_module_in_worker(mod_dict: Dict[str, Dict], task_tmp_dir: Path) -> Optional[ModuleResult]:
+    """
+    Run a module in a worker process, starting from the report state before running the
+    modules. Data files are written to `task_tmp_dir`, to be moved to the report data directory
+    when the result is merged. Returns None if the module crashed, so the main process runs
+    it again to report the error.
+    """
+    # Start with empty report state, to collect just the changes made by this module
+    report.general_stats_data = []
+    report.general_stats_headers = []
+    report.data_sources = defaultdict(lambda: defaultdict(lambda: defaultdict()))
+    report.software_versions = defaultdict(lambda: defaultdict(list))
+    # Empty placeholders for the data file names taken by earlier modules, so that new names don't clash
+    report.saved_raw_data = {k: {} for k in _worker_saved_raw_data_keys}
+    report.plot_by_id = dict()
+    report.plot_data = dict()
+    report.html_ids_by_scope = copy.deepcopy(_worker_html_ids_by_scope)
+    report.lint_errors = []
+    report.modules = []
+    report.runtimes.clean_s_name_calls = report.runtimes.clean_s_name_hits = 0
+    report.runtimes.trace_events = []
+    tmp_dir.new_tmp_dir(task_tmp_dir)
+
+    this_module: str = list(mod_dict.keys())[0]
+    logger.debug(f"Running module: {this_module}")
+    mod_starttime = time.time()
+    memory = memory_usage.start()
+    these_modules: List[BaseMultiqcModule] = []
+    parsed_data: Optional[ParsedData] = None
+    no_samples = deprecated_user_warning = False
+    # noinspection PyBroadException
+    try:
+        with tracing.span(this_module, cat="module"):
+            module_initializer = _load_module(mod_dict)
+            if _is_two_phase(module_initializer):
+                # Only parse, the sections are built in the main process
+                setattr(module_initializer, "parse_only", True)
+                setattr(module_initializer, "preparsed_data", None)
+                parsed_data = getattr(module_initializer(), "parsed_data")
+            else:
+                these_modules = _init_module(mod_dict)
+    except ModuleNoSamplesFound:
+        no_samples = True
+    except UserWarning:
+        no_samples = deprecated_user_warning = True
+    except Exception:
+        return None
+
+    return ModuleResult(
+        modules=these_modules,
+        no_samples=no_samples,
+        deprecated_user_warning=deprecated_user_warning,
+        run_time=time.time() - mod_starttime,
+        general_stats_data=report.general_stats_data,
+        general_stats_headers=report.general_stats_headers,
+        # Nested defaultdicts with lambda factories can't be pickled, so passing back plain dicts
+        data_sources={m: {s: dict(d) for s, d in sections.items()} for m, sections in report.data_sources.items()},
+        software_versions={g: dict(versions) for g, versions in report.software_versions.items()},
+        saved_raw_data={k: v for k, v in report.saved_raw_data.items() if k not in _worker_saved_raw_data_keys},
+        plot_by_id=report.plot_by_id,
+        plot_data=report.plot_data,
+        html_ids_by_scope={
+            scope: ids - _worker_html_ids_by_scope.get(scope, set())
+            for scope, ids in report.html_ids_by_scope.items()
+            if ids - _worker_html_ids_by_scope.get(scope, set())
+        },
+        lint_errors=report.lint_errors,
+        parsed_data=parsed_data,
+        clean_s_name_calls=report.runtimes.clean_s_name_calls,
+        clean_s_name_hits=report.runtimes.clean_s_name_hits,
+        memory=_finish_module_memory(memory, _worker_saved_raw_data_keys, set()) if memory is not None else None,
+        trace_events=report.runtimes.trace_events,
+    )
+
+
+def _add_clean_s_name_stats(result: ModuleResult):
+    report.runtimes.clean_s_name_calls += result.clean_s_name_calls
+    report.runtimes.clean_s_name_hits += result.clean_s_name_hits
+
+
+def _add_module_result(this_module: str, result: ModuleResult, task_tmp_dir: Path) -> bool:
+    """
+    Merge the result of running a module in a worker process into the report. Returns False
+    if the module used HTML IDs or data file names that were taken by an earlier module
+    in the meantime, in which case the module has to be run again in the main process.
+    """
+    for scope, ids in result.html_ids_by_scope.items():
+        if scope in report.html_ids_by_scope and not report.html_ids_by_scope[scope].isdisjoint(ids):
+            logger.debug(f"{this_module}: HTML IDs clash with an earlier module, running the module again")
+            return False
+    if any(fn in report.saved_raw_data for fn in result.saved_raw_data):
+        logger.debug(f"{this_module}: data file names clash with an earlier module, running the module again")
+        return False
+
+    for scope, ids in result.html_ids_by_scope.items():
+        report.html_ids_by_scope[scope].update(ids)
+    report.saved_raw_data.update(result.saved_raw_data)
+    report.general_stats_data.extend(result.general_stats_data)
+    report.general_stats_headers.extend(result.general_stats_headers)
+    for module, sections in result.data_sources.items():
+        for section, sources in sections.items():
+            report.data_sources[module][section].update(sources)
+    for group, versions in result.software_versions.items():
+        report.software_versions[group].update(versions)
+    report.plot_by_id.update(result.plot_by_id)
+    report.plot_data.update(result.plot_data)
+    report.lint_errors.extend(result.lint_errors)
+    _add_clean_s_name_stats(result)
+
+    # Move the files written by the module, overwriting files with the same names as a serial run would
+    for src_dir, dst_dir in [
+        (task_tmp_dir / "multiqc_data", tmp_dir.data_tmp_dir()),
+        (task_tmp_dir / "multiqc_plots", tmp_dir.plots_tmp_dir()),
+    ]:
+        if src_dir.exists():
+            for path in src_dir.iterdir():
+                dst = dst_dir / path.name
+                if dst.is_dir():
+                    shutil.rmtree(dst)
+                os.replace(path, dst)
+
+    if result.no_samples:
+        _log_no_samples(this_module, result.deprecated_user_warning)
+    else:
+        _add_modules(result.modules)
+    report.runtimes.mods[this_module] = result.run_time
+    if result.memory is not None:
+        report.runtimes.memory_mods[this_module] = result.memory
+    _log_module_time(this_module)
+    return True
+
+
+def _exec_modules_parallel(mod_dicts_in_order: List[Dict[str, Dict]], n_workers: int) -> int:
+    """
+    Run modules in a pool of worker processes, and merge the results into the report in
+    the order of the modules, so the report is the same as when running them one by one.
+    Two-phase modules only parse the logs in the worker, and build their sections in the
+    main process. Modules that crashed, can't be passed back from the worker, or clash with
+    an earlier module are run again in the main process. Returns the exit code.
+    """
+    logger.debug(f"Running {len(mod_dicts_in_order)} modules in {n_workers} processes")
+    report_state = {
+        "files": report.files,
+        "analysis_files": report.analysis_files,
+        "html_ids_by_scope": report.html_ids_by_scope,
+        "saved_raw_data_keys": set(report.saved_raw_data),
+    }
+    sys_exit_code = 0
+    with concurrent.futures.ProcessPoolExecutor(
+        max_workers=n_workers,
+        initializer=_init_module_worker,
+        initargs=(config.snapshot(), report_state),
+    ) as executor:
+        tasks = []
+        for mod_dict in mod_dicts_in_order:
+            task_tmp_dir = Path(tempfile.mkdtemp(dir=tmp_dir.get_tmp_dir()))
+            tasks.append((mod_dict, task_tmp_dir, executor.submit(_exec_module_in_worker, mod_dict, task_tmp_dir)))
+
+        for mod_dict, task_tmp_dir, future in tasks:
+            this_module: str = list(mod_dict.keys())[0]
+            result: Optional[ModuleResult] = None
+            try:
+                result = future.result()
+            except Exception as e:
+                logger.debug(f"{this_module}: couldn't get the result from the worker process: {e}")
+            if result is not None:
+                # Keep the spans of the worker even if the module is run again in the main process
+                report.runtimes.trace_events.extend(result.trace_events)
+            if result is not None and result.parsed_data is not None:
+                sys_exit_code = max(sys_exit_code, _exec_module(mod_dict, preparsed=result))
+            elif result is None or not _add_module_result(this_module, result, task_tmp_dir):
+                sys_exit_code = max(sys_exit_code, _exec_module(mod_dict))
+            shutil.rmtree(task_tmp_dir, ignore_errors=True)
+    return sys_exit_code
+
+
 def required_logs_found(modules_with_logs):
     if config.require_logs:
         required_modules_with_no_logs = [
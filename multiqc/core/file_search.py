@@ -6,6 +6,7 @@ from typing import Dict, List, Tuple
 
 from multiqc.core.exceptions import RunError, NoAnalysisFound
 from multiqc import config, report
+from multiqc.core import tracing
 
 logger = logging.getLogger(__name__)
 
@@ -14,10 +15,11 @@ def file_search():
     """
     Search log files and set up the list of modules to run.
     """
-    _make_analysis_file_list()
+    with tracing.span("file search", cat="search"):
+        _make_analysis_file_list()
 
-    mod_dicts_in_order, sp_keys = _module_list_to_search()
-    report.search_files(sp_keys)
+        mod_dicts_in_order, sp_keys = _module_list_to_search()
+        report.search_files(sp_keys)
 
     return mod_dicts_in_order
 
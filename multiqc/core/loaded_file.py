@@ -0,0 +1,115 @@
+"""
+Lazy access to the contents of a log file, for modules reading large files
+"""
+
+import io
+import json
+import logging
+import mmap
+import os
+from pathlib import Path
+from typing import Any, Iterator, Optional, Union
+
+from multiqc.core import compressed_files
+
+logger = logging.getLogger(__name__)
+
+# Errors reading or decompressing a file, after which the file is skipped
+READ_ERRORS = (IOError, OSError, ValueError, UnicodeDecodeError, EOFError)
+
+
+class LoadedFile:
+    """
+    Contents of a log file found by `find_log_files(lazy=True)`, read from disk only when used:
+
+    - `lines()` streams the decoded lines, without keeping the whole file in memory
+    - `text` is the decoded contents, the same as f["f"] without `lazy=True`
+    - `bytes` is the raw contents, memory-mapped for uncompressed files
+    - `json()` parses the contents as JSON
+
+    Compressed files are decompressed on the fly. Text is decoded as UTF-8, skipping invalid characters.
+    A file that can't be read or decompressed, e.g. a truncated .gz file, is skipped as without `lazy=True`:
+    `lines()` stops, and `text` and `bytes` are empty.
+    """
+
+    def __init__(self, path: Union[str, Path]):
+        self.path = str(path)
+        self._text: Optional[str] = None
+        self._bytes: Optional[Union[bytes, mmap.mmap]] = None
+
+    def __enter__(self) -> "LoadedFile":
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def __repr__(self) -> str:
+        return f"LoadedFile({self.path!r})"
+
+    @property
+    def bytes(self) -> Union[bytes, mmap.mmap]:
+        """
+        Raw contents of the file, decompressed for compressed files. For plain files, a read-only
+        memory map of the file, so only the pages used are read
+        """
+        if self._bytes is None:
+            try:
+                if compressed_files.compression_extension(self.path) is not None:
+                    with compressed_files.open_binary(self.path) as fh:
+                        self._bytes = fh.read()
+                elif os.path.getsize(self.path) == 0:
+                    self._bytes = b""  # empty files can't be memory-mapped
+                else:
+                    with io.open(self.path, "rb") as fh:
+                        self._bytes = mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)
+            except READ_ERRORS as e:
+                logger.debug(f"Couldn't read file: {self.path}\n{e}")
+                self._bytes = b""
+        return self._bytes
+
+    @property
+    def text(self) -> str:
+        """
+        Decoded contents of the file. Decoded once and kept, so use `lines()` for large files
+        """
+        if self._text is None:
+            try:
+                self._text = str(self.bytes, "utf-8")
+            except UnicodeDecodeError as e:
+                logger.debug(f"Couldn't read file as utf-8: {self.path}, will skip non-unicode characters\n{e}")
+                self._text = str(self.bytes, "utf-8", errors="ignore")
+            if "\r" in self._text:
+                # Universal newlines, as when reading the file in text mode
+                self._text = self._text.replace("\r\n", "\n").replace("\r", "\n")
+        return self._text
+
+    def lines(self) -> Iterator[str]:
+        """
+        Iterate over the lines of the file, without the line endings, like `text.splitlines()`
+        """
+        fh: io.TextIOBase
+        try:
+            if self._text is not None:
+                fh = io.StringIO(self._text, newline=None)
+            else:
+                fh = compressed_files.open_text(self.path, errors="ignore")
+            with fh:
+                for line in fh:
+                    yield line[:-1] if line.endswith("\n") else line
+        except READ_ERRORS as e:
+            logger.debug(f"Couldn't read file: {self.path}\n{e}")
+
+    def json(self) -> Any:
+        """
+        Contents of the file parsed as JSON
+        """
+        return json.loads(self.text)
+
+    def close(self):
+        """
+        Release the memory map and the decoded contents. The file is read again if used after closing
+        """
+        if isinstance(self._bytes, mmap.mmap):
+            self._bytes.close()
+        self._bytes = None
+        self._text = None
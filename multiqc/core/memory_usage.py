@@ -0,0 +1,153 @@
+"""
+Lightweight memory profiling with `config.profile_rss`: the resident set size (RSS) of the process is
+sampled before and after each module and report writing step, and the size of the data kept by each
+module is measured once it finishes. Unlike `config.profile_memory`, which traces every allocation with
+`tracemalloc`, this doesn't slow down the run.
+"""
+
+import contextlib
+import logging
+import sys
+import types
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, Optional, Tuple
+
+from multiqc import config, report
+from multiqc.report import MemoryUsage
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None  # type: ignore
+
+logger = logging.getLogger(__name__)
+
+
+def rss() -> Tuple[Optional[int], Optional[int]]:
+    """
+    Current and peak RSS of the process
+    """
+    current = peak = None
+    try:
+        with open("/proc/self/status", "rb") as f:
+            for line in f:
+                if line.startswith(b"VmRSS:"):
+                    current = int(line.split()[1]) * 1024
+                elif line.startswith(b"VmHWM:"):
+                    peak = int(line.split()[1]) * 1024
+    except (OSError, ValueError, IndexError):
+        pass
+    if peak is None and resource is not None:
+        # Kilobytes on Linux, bytes on macOS
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * (1 if sys.platform == "darwin" else 1024)
+    return current, peak
+
+
+_ATOMIC_TYPES = (str, bytes, bytearray, int, float, complex, bool, type(None), range)
+_SKIPPED_TYPES = (type, types.ModuleType, types.FunctionType, types.BuiltinFunctionType, types.MethodType)
+
+
+def deep_size(obj: Any) -> int:
+    """
+    Size of an object and everything it references, counting shared objects once. Follows
+    containers and object attributes, but not classes, modules and functions
+    """
+    seen = set()
+    size = 0
+    stack = [obj]
+    while stack:
+        o = stack.pop()
+        if id(o) in seen or isinstance(o, _SKIPPED_TYPES):
+            continue
+        seen.add(id(o))
+        size += sys.getsizeof(o)  # includes the buffer of numpy arrays owning their data
+        if isinstance(o, _ATOMIC_TYPES):
+            continue
+        if isinstance(o, dict):
+            stack.extend(o.keys())
+            stack.extend(o.values())
+        elif isinstance(o, (list, tuple, set, frozenset)):
+            stack.extend(o)
+        elif hasattr(o, "__dict__"):
+            stack.append(vars(o))
+    return size
+
+
+def start() -> Optional[MemoryUsage]:
+    """
+    Start measuring a step. Returns None if `config.profile_rss` is disabled
+    """
+    if not config.profile_rss:
+        return None
+    return MemoryUsage(rss_before=rss()[0])
+
+
+def finish(usage: MemoryUsage) -> MemoryUsage:
+    usage.rss_after, usage.peak_rss = rss()
+    return usage
+
+
+def measure_module_data(usage: MemoryUsage, saved_raw_data: Iterable, plots: Iterable):
+    """
+    Record the size of the raw data saved and the plots added by a module
+    """
+    usage.data_bytes = deep_size(list(saved_raw_data))
+    usage.plot_bytes = deep_size(list(plots))
+
+
+@contextlib.contextmanager
+def track_step(name: str) -> Iterator[None]:
+    """
+    Measure a report writing step, if `config.profile_rss` is enabled
+    """
+    usage = start()
+    try:
+        yield
+    finally:
+        if usage is not None:
+            report.runtimes.memory_steps[name] = finish(usage)
+            logger.debug(f"{name}: {format_usage(usage)}")
+
+
+def format_usage(usage: MemoryUsage) -> str:
+    change = usage.rss_change
+    return (
+        (f"RSS change: {change / 1024 / 1024:+,.1f}MB, " if change is not None else "")
+        + (f"peak RSS: {usage.peak_rss / 1024 / 1024:,.1f}MB" if usage.peak_rss is not None else "peak RSS: unknown")
+        + (f", data: {usage.data_bytes / 1024 / 1024:,.1f}MB" if usage.data_bytes else "")
+        + (f", plots: {usage.plot_bytes / 1024 / 1024:,.1f}MB" if usage.plot_bytes else "")
+    )
+
+
+def table_data(usages: Dict[str, MemoryUsage]) -> Dict[str, Dict[str, float]]:
+    """
+    Memory usage in MB by module or step, for the profiling section and the data file
+    """
+    data: Dict[str, Dict[str, float]] = {}
+    for name, usage in usages.items():
+        row = {
+            "rss_before": usage.rss_before,
+            "rss_after": usage.rss_after,
+            "rss_change": usage.rss_change,
+            "peak_rss": usage.peak_rss,
+            "data_size": usage.data_bytes,
+            "plots_size": usage.plot_bytes,
+        }
+        data[name] = {k: v / 1024 / 1024 for k, v in row.items() if v is not None}
+    return data
+
+
+def write_data_file(data_dir: Path):
+    """
+    Write the memory usage of the modules and the report writing steps to the data directory. Called
+    after the report is written, to include the last steps, so the file is moved to the data directory
+    directly instead of with the other data files
+    """
+    data = {
+        **{f"module: {name}": row for name, row in table_data(report.runtimes.memory_mods).items()},
+        **{f"step: {name}": row for name, row in table_data(report.runtimes.memory_steps).items()},
+    }
+    report.write_data_file(data, "multiqc_memory_usage")
+    fn = f"multiqc_memory_usage.{config.data_format_extensions[config.data_format]}"
+    if (report.data_tmp_dir() / fn).exists():
+        (report.data_tmp_dir() / fn).replace(data_dir / fn)
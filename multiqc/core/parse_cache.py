@@ -0,0 +1,246 @@
+"""
+Persistent cache of the data parsed from log files by modules, so that reruns over the same
+files don't have to read and parse the unchanged files again.
+
+Results are stored in an SQLite database next to the file search cache (see `search_cache.cache_dir()`),
+keyed by the absolute file path, its size and modification time, and a fingerprint of the module code,
+the search pattern, the config options of the module, and the MultiQC version.
+Modules opt in by parsing their files with `BaseMultiqcModule.parse_log_files()`. Sample names
+are not cached: they are made from the file dicts on every run, so changing the sample name
+cleaning options keeps the cached results. As in the file search cache, results that haven't been
+used for `search_cache.MAX_AGE_DAYS` are removed, e.g. the results of older MultiQC versions.
+"""
+
+import functools
+import hashlib
+import json
+import logging
+import os
+import pickle
+import re
+import sqlite3
+import sys
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from multiqc import config
+from multiqc.core.search_cache import LAST_USED_RESOLUTION, MAX_AGE_DAYS, cache_dir
+
+logger = logging.getLogger(__name__)
+
+CACHE_FILENAME = "parse_cache.sqlite"
+
+# Marks a file missing from the cache, as None is a valid parse result
+MISSING = object()
+
+
+@functools.lru_cache(maxsize=None)
+def _package_source_hash(package: str) -> str:
+    """
+    Hash of the source files of a module package, standing in for the module version: a change
+    to any of the parsing code invalidates the cached results
+    """
+    h = hashlib.sha256()
+    package_file = getattr(sys.modules.get(package), "__file__", None)
+    if package_file:
+        for path in sorted(Path(package_file).parent.glob("*.py")):
+            h.update(path.name.encode())
+            h.update(path.read_bytes())
+    return h.hexdigest()
+
+
+def parse_fingerprint(
+    module_id: str,
+    sp_key: str,
+    parse_file: Callable,
+    mod_cust_config: Dict,
+) -> str:
+    """
+    Hash of everything apart from the file itself that decides the outcome of parsing a file
+    """
+
+    def _default(obj):
+        if isinstance(obj, re.Pattern):
+            return [obj.pattern, obj.flags]
+        if isinstance(obj, (set, frozenset)):
+            return sorted(json.dumps(v, default=_default, sort_keys=True) for v in obj)
+        return str(obj)
+
+    # Config options named after the module ID, e.g. `samtools_idxstats_xchr`
+    module_config = {
+        k: v
+        for k, v in vars(config).items()
+        if (k == module_id or k.startswith(f"{module_id}_")) and not callable(v) and not isinstance(v, type(sys))
+    }
+    data = {
+        "version": config.version,
+        "module": module_id,
+        "sp_key": sp_key,
+        "source": _package_source_hash(parse_file.__module__.rpartition(".")[0]),
+        "mod_cust_config": mod_cust_config,
+        "module_config": module_config,
+    }
+    return hashlib.sha256(json.dumps(data, default=_default, sort_keys=True).encode()).hexdigest()
+
+
+def reset():
+    """
+    Remove all cached parse results
+    """
+    close()
+    path = cache_dir() / CACHE_FILENAME
+    if path.exists():
+        logger.info(f"Removing the parsed data cache {path}")
+        path.unlink()
+
+
+class ParseCache:
+    """
+    Parse results of all modules. Results for a fingerprint are loaded on first use, and new
+    results are written in a single transaction on `save()`. Results that haven't been used for
+    `MAX_AGE_DAYS` are removed with `prune()` once all modules have run.
+    """
+
+    def __init__(self):
+        self.path = cache_dir() / CACHE_FILENAME
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._con = sqlite3.connect(self.path, timeout=30)
+        self._con.execute(
+            "CREATE TABLE IF NOT EXISTS parse_results ("
+            "fingerprint TEXT, path TEXT, size INTEGER, mtime_ns INTEGER, result BLOB, last_used INTEGER, "
+            "PRIMARY KEY (fingerprint, path))"
+        )
+        self._entries: Dict[str, Dict[str, Tuple[int, int, bytes, int]]] = {}
+        self._new_entries: List[Tuple[str, str, int, int, bytes, int]] = []
+        self._used: List[Tuple[str, str]] = []
+        self._now = int(time.time())
+        self.hits = 0
+        logger.debug(f"Using parsed data cache {self.path}")
+
+    @staticmethod
+    def file_key(path: str) -> Optional[Tuple[str, int, int]]:
+        """
+        Absolute path, size and modification time of the file, or None if it can't be accessed
+        """
+        try:
+            st = os.stat(path)
+        except OSError:
+            return None
+        return os.path.abspath(path), st.st_size, st.st_mtime_ns
+
+    def get(self, fingerprint: str, key: Tuple[str, int, int]) -> Any:
+        """
+        Cached parse result of the file, or `MISSING`
+        """
+        if fingerprint not in self._entries:
+            self._entries[fingerprint] = {
+                path: (size, mtime_ns, result, last_used)
+                for path, size, mtime_ns, result, last_used in self._con.execute(
+                    "SELECT path, size, mtime_ns, result, last_used FROM parse_results WHERE fingerprint = ?",
+                    (fingerprint,),
+                )
+            }
+        path, size, mtime_ns = key
+        entry = self._entries[fingerprint].get(path)
+        if entry is None or entry[0] != size or entry[1] != mtime_ns:
+            return MISSING
+        try:
+            result = pickle.loads(entry[2])
+        except Exception as e:
+            logger.debug(f"Couldn't load the cached parse result of {path}: {e}")
+            return MISSING
+        self.hits += 1
+        if entry[3] < self._now - LAST_USED_RESOLUTION:
+            self._used.append((fingerprint, path))
+        return result
+
+    def add(self, fingerprint: str, key: Tuple[str, int, int], result: Any):
+        path, size, mtime_ns = key
+        try:
+            blob = pickle.dumps(result, protocol=pickle.HIGHEST_PROTOCOL)
+        except Exception as e:
+            logger.debug(f"Couldn't cache the parse result of {path}: {e}")
+            return
+        self._new_entries.append((fingerprint, path, size, mtime_ns, blob, self._now))
+
+    def save(self):
+        """
+        Write the new results, and record the use of the cached ones
+        """
+        if not self._new_entries and not self._used:
+            return
+        try:
+            with self._con:
+                self._con.executemany(
+                    "INSERT OR REPLACE INTO parse_results (fingerprint, path, size, mtime_ns, result, last_used) "
+                    "VALUES (?, ?, ?, ?, ?, ?)",
+                    self._new_entries,
+                )
+                self._con.executemany(
+                    "UPDATE parse_results SET last_used = ? WHERE fingerprint = ? AND path = ?",
+                    [(self._now, fingerprint, path) for fingerprint, path in self._used],
+                )
+        except sqlite3.Error as e:
+            logger.warning(f"Couldn't save the parsed data cache: {e}")
+        self._new_entries = []
+        self._used = []
+
+    def prune(self):
+        """
+        Drop the results of any module and version that haven't been used for `MAX_AGE_DAYS`
+        """
+        try:
+            with self._con:
+                self._con.execute(
+                    "DELETE FROM parse_results WHERE last_used < ?", (self._now - MAX_AGE_DAYS * 24 * 60 * 60,)
+                )
+        except sqlite3.Error as e:
+            logger.warning(f"Couldn't prune the parsed data cache: {e}")
+
+    def close(self):
+        self._con.close()
+
+
+# Cache of the current process. Worker processes open their own connection
+_cache: Optional[Tuple[int, Optional[ParseCache]]] = None
+
+
+def get() -> Optional[ParseCache]:
+    """
+    Parsed data cache if enabled with `config.parse_cache`. Returns None if disabled or if
+    the cache can't be used, e.g. on a read-only file system
+    """
+    global _cache
+    if not config.parse_cache:
+        return None
+    if _cache is None or _cache[0] != os.getpid():
+        try:
+            _cache = (os.getpid(), ParseCache())
+        except (sqlite3.Error, OSError) as e:
+            logger.warning(f"Couldn't open the parsed data cache, parsing all files: {e}")
+            _cache = (os.getpid(), None)
+    return _cache[1]
+
+
+def prune():
+    """
+    Remove the cached results that haven't been used for `MAX_AGE_DAYS`. Called in the main process
+    after all modules have run, as the modules record the use of their cached results as they go,
+    also in worker processes
+    """
+    cache = get()
+    if cache is not None:
+        cache.prune()
+
+
+def close():
+    """
+    Close the cache of the current process, logging the number of files loaded from it
+    """
+    global _cache
+    if _cache is not None and _cache[0] == os.getpid() and _cache[1] is not None:
+        if _cache[1].hits:
+            logger.debug(f"Loaded the parsed data of {_cache[1].hits} files from the cache")
+        _cache[1].close()
+    _cache = None
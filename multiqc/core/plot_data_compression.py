@@ -0,0 +1,148 @@
+"""
+Compression of the plot data embedded in the report, set with `config.plot_data_compression` and
+`config.plot_data_compression_level`. Each codec must have a matching decoder in the report
+JavaScript, see `decompressPlotData` in `assets/js/decompress.js` of the default template.
+"""
+
+import functools
+import logging
+import zlib
+from typing import Callable, Dict, Optional, Protocol, Tuple
+
+from multiqc import config
+
+try:
+    import brotli  # type: ignore
+except ImportError:  # Optional dependency
+    brotli = None  # type: ignore[assignment]
+
+try:
+    import zstandard  # type: ignore
+except ImportError:  # Optional dependency
+    zstandard = None  # type: ignore[assignment]
+
+logger = logging.getLogger(__name__)
+
+
+class Compressor(Protocol):
+    def compress(self, data: bytes) -> bytes: ...
+
+    def flush(self) -> bytes: ...
+
+
+class _NoCompression:
+    """
+    Passes the data through, for reports that are compressed as a whole, or for debugging
+    """
+
+    def compress(self, data: bytes) -> bytes:
+        return data
+
+    def flush(self) -> bytes:
+        return b""
+
+
+class _BrotliCompression:
+    """
+    Wraps `brotli.Compressor`, which names the methods `process` and `finish`
+    """
+
+    def __init__(self, level: int):
+        self._compressor = brotli.Compressor(mode=brotli.MODE_TEXT, quality=level)
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.process(data)
+
+    def flush(self) -> bytes:
+        return self._compressor.finish()
+
+
+# Factory of the compressors of each codec, taking the compression level. The data of each plot is
+# compressed with a new compressor. wbits=31 writes a gzip container, and threads=-1 lets zstd compress
+# with as many threads as there are CPU cores, with a `ZstdCompressor` set up once for all plots
+CODECS: Dict[str, Callable[[int], Callable[[], Compressor]]] = {
+    "gzip": lambda level: functools.partial(zlib.compressobj, level, zlib.DEFLATED, 31),
+    "zstd": lambda level: zstandard.ZstdCompressor(level=level, threads=-1).compressobj,
+    "brotli": lambda level: functools.partial(_BrotliCompression, level),
+    "none": lambda level: _NoCompression,
+}
+
+# Python package that each codec needs, if any, and the extra that installs it
+_CODEC_PACKAGES: Dict[str, Tuple[object, str, str]] = {
+    "zstd": (zstandard, "zstandard", "zstd"),
+    "brotli": (brotli, "brotli", "brotli"),
+}
+
+DEFAULT_CODEC = "gzip"
+
+# Lowest level, highest level and default level of each codec. The gzip level 6 gives 10% speed
+# gain vs. 2% extra size, in contrast to the maximum level 9. The zstd level 3 and the brotli level 6
+# compress faster than gzip at level 6, and into smaller data
+LEVELS: Dict[str, Tuple[int, int, int]] = {
+    "gzip": (0, 9, 6),
+    "zstd": (1, 22, 3),
+    "brotli": (0, 11, 6),
+    "none": (0, 9, 6),
+}
+
+
+def codec() -> str:
+    """
+    The codec set in the config, or the default one if it's not supported or its package is not installed
+    """
+    name = config.plot_data_compression or DEFAULT_CODEC
+    if name not in CODECS:
+        logger.warning(
+            f"Plot data compression '{config.plot_data_compression}' is not supported, "
+            f"using '{DEFAULT_CODEC}'. Available: {', '.join(CODECS)}"
+        )
+        return DEFAULT_CODEC
+    if name in _CODEC_PACKAGES:
+        module, package, extra = _CODEC_PACKAGES[name]
+        if module is None:
+            logger.warning(
+                f"Plot data compression '{name}' requires the '{package}' package, using '{DEFAULT_CODEC}'. "
+                f"Install it with: pip install 'multiqc[{extra}]'"
+            )
+            return DEFAULT_CODEC
+    return name
+
+
+def check_level(name: str, value: int):
+    """
+    Raise a `ValueError` if the compression level is out of the range of the codec. Levels of
+    unsupported codecs are not checked, as these codecs are replaced by `codec()`
+    """
+    if name not in LEVELS:
+        return
+    min_level, max_level, _ = LEVELS[name]
+    if not isinstance(value, int) or not min_level <= value <= max_level:
+        raise ValueError(
+            f"Plot data compression level for '{name}' must be from {min_level} to {max_level}, got '{value}'"
+        )
+
+
+def level(name: Optional[str] = None) -> int:
+    """
+    The compression level set in the config, or the default one of the codec if it's not set or not valid
+    """
+    name = name or codec()
+    default_level = LEVELS[name][2]
+    value = config.plot_data_compression_level
+    if value is None:
+        return default_level
+    try:
+        check_level(name, value)
+    except ValueError as e:
+        logger.warning(f"{e}, using {default_level}")
+        return default_level
+    return value
+
+
+def compressor_factory() -> Callable[[], Compressor]:
+    """
+    Function making a new compressor with the codec and level set in the config. Call once for all plots,
+    after settling the codec and level in the config, so that a fallback is only reported once
+    """
+    name = codec()
+    return CODECS[name](level(name))
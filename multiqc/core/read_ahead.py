@@ -0,0 +1,83 @@
+"""
+Reading the files found for a module ahead in a thread pool, while the module parses the previous ones.
+Useful on file systems where the latency of opening and reading a file dominates the parse time.
+"""
+
+import collections
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, Deque, Generator, Iterable, Iterator, Tuple, TypeVar
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+# Marks a file that couldn't be opened, for which the open function didn't yield anything
+_NOTHING = object()
+
+
+def read_ahead(
+    items: Iterable[T],
+    open_item: Callable[[T], Generator[R, None, None]],
+    size: Callable[[R], int],
+    max_items: int,
+    max_bytes: int,
+) -> Iterator[R]:
+    """
+    Yield what `open_item` yields for each of the items, in the same order, while up to `max_items` of the
+    next items are opened in a thread pool. `open_item` is a generator: its first value is produced in a
+    thread, and the generator is finished in the calling thread after the value is yielded, so that any
+    file it opened is closed as when iterating over it directly.
+
+    No more items are opened while the results waiting to be yielded add up to `max_bytes`, as measured
+    by `size`. Items still being opened are counted with the average size of the items opened so far.
+    """
+    it = iter(items)
+    pending: Deque["Future[Tuple[Generator[R, None, None], object, int]]"] = collections.deque()
+    lock = threading.Lock()
+    # Bytes of the results waiting to be yielded, total bytes and number of the items opened so far
+    stats = {"buffered": 0, "total": 0, "opened": 0}
+
+    def _open(item: T) -> Tuple[Generator[R, None, None], object, int]:
+        gen = open_item(item)
+        first = next(gen, _NOTHING)
+        n_bytes = 0 if first is _NOTHING else size(first)  # type: ignore
+        with lock:
+            stats["buffered"] += n_bytes
+            stats["total"] += n_bytes
+            stats["opened"] += 1
+        return gen, first, n_bytes
+
+    def _buffered() -> float:
+        with lock:
+            in_flight = sum(not future.done() for future in pending)
+            return stats["buffered"] + in_flight * stats["total"] / max(stats["opened"], 1)
+
+    executor = ThreadPoolExecutor(max_workers=max_items, thread_name_prefix="multiqc_read_ahead")
+
+    def _fill():
+        # Always keep one item pending, so that an item larger than the limit is still read
+        while len(pending) < max_items and (not pending or _buffered() < max_bytes):
+            item = next(it, _NOTHING)
+            if item is _NOTHING:
+                return
+            pending.append(executor.submit(_open, item))  # type: ignore
+
+    try:
+        _fill()
+        while pending:
+            gen, first, n_bytes = pending.popleft().result()
+            with lock:
+                stats["buffered"] -= n_bytes
+            _fill()
+            try:
+                if first is not _NOTHING:
+                    yield first  # type: ignore
+                    yield from gen
+            finally:
+                gen.close()
+    finally:
+        # Close the files opened ahead, if the caller stopped iterating early
+        executor.shutdown(wait=True, cancel_futures=True)
+        for future in pending:
+            if not future.cancelled() and future.exception() is None:
+                future.result()[0].close()
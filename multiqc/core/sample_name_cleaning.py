@@ -0,0 +1,220 @@
+"""
+Sample name cleaning rules, compiled once per config state and module, and the names cleaned with them.
+
+`BaseMultiqcModule.clean_s_name()` is called for every file found, and again when grouping samples,
+so the `fn_clean_exts`, `fn_clean_trim` and `sample_names_replace` config options are turned into a
+list of rules with precompiled regexes, and the cleaned names are memoized. Programs are keyed by the
+config options they were compiled from. The contents of these options are frozen into the key once, and
+again only when one of them is replaced, so edits made in place take effect after `clear()`, which is
+called when the config is reset or updated.
+"""
+
+import logging
+import re
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+from multiqc import config
+from multiqc.config import CleanPatternT
+
+logger = logging.getLogger(__name__)
+
+# Operations of the compiled `fn_clean_exts` rules
+TRUNCATE = 0
+REMOVE = 1
+REGEX = 2
+REGEX_KEEP = 3
+
+
+def _freeze(obj: Any) -> Any:
+    """
+    Hashable copy of a config value made of dicts and lists
+    """
+    if isinstance(obj, dict):
+        return tuple(sorted((str(k), _freeze(v)) for k, v in obj.items()))
+    if isinstance(obj, (list, tuple)):
+        return tuple(_freeze(v) for v in obj)
+    return obj
+
+
+class CleaningProgram:
+    """
+    Sample name cleaning rules compiled for a module, along with the names cleaned with them
+    """
+
+    def __init__(
+        self,
+        anchor: str,
+        fn_clean_exts: List[CleanPatternT],
+        fn_clean_trim: List[str],
+    ):
+        self.fn_clean_sample_names = bool(config.fn_clean_sample_names)
+        self.ext_rules: List[Tuple[int, Union[str, re.Pattern]]] = []
+        for _ext in fn_clean_exts:
+            # Go through different filter types
+            ext = {"type": "truncate", "pattern": _ext} if isinstance(_ext, str) else _ext
+
+            # Check if this config is limited to a module
+            if "module" in ext:
+                modules = [ext["module"]] if isinstance(ext["module"], str) else ext["module"]
+                if not any([m == anchor for m in modules]):
+                    continue
+
+            pattern = ext.get("pattern", "")
+            assert isinstance(pattern, str)
+            if ext.get("type") == "truncate":
+                self.ext_rules.append((TRUNCATE, pattern))
+            elif ext.get("type") in ("remove", "replace"):
+                if ext["type"] == "replace":
+                    logger.warning(
+                        "use 'config.fn_clean_sample_names.remove' instead "
+                        "of 'config.fn_clean_sample_names.replace' [deprecated]"
+                    )
+                self.ext_rules.append((REMOVE, pattern))
+            elif ext.get("type") == "regex":
+                self.ext_rules.append((REGEX, re.compile(pattern)))
+            elif ext.get("type") == "regex_keep":
+                self.ext_rules.append((REGEX_KEEP, re.compile(pattern)))
+            elif ext.get("type") is None:
+                logger.error(f'config.fn_clean_exts config was missing "type" key: {ext}')
+            else:
+                logger.error(f"Unrecognised sample name cleaning pattern: {ext.get('type')}")
+        self.trim: List[str] = list(fn_clean_trim)
+
+        # Hard replacements that are set with --replace-names: (search, replacement, compiled search regex)
+        self.replace_rules: List[Tuple[str, str, Optional[re.Pattern]]] = []
+        self.replace_regex = bool(config.sample_names_replace_regex)
+        self.replace_exact = bool(config.sample_names_replace_exact)
+        self.replace_complete = bool(config.sample_names_replace_complete)
+        for s_name_search, s_name_replace in (config.sample_names_replace or {}).items():
+            compiled: Optional[re.Pattern] = None
+            if self.replace_regex:
+                try:
+                    compiled = re.compile(s_name_search)
+                except re.error as e:
+                    logger.error(f"Error with sample name replacement regex: {e}")
+                    continue
+            self.replace_rules.append((s_name_search, s_name_replace, compiled))
+
+        # Cleaned names by the arguments of `clean_s_name()`
+        self.names: Dict[Tuple, str] = {}
+
+    def clean(self, name: str, original_name: str) -> str:
+        """
+        Apply the rules to a name, after the directories were prepended to it
+        """
+        if self.fn_clean_sample_names:
+            # Split then take first section to remove everything after these matches
+            for op, pattern in self.ext_rules:
+                if op == TRUNCATE:
+                    name = name.split(pattern, 1)[0]  # type: ignore
+                elif op == REMOVE:
+                    name = name.replace(pattern, "")  # type: ignore
+                elif op == REGEX:
+                    name = pattern.sub("", name)  # type: ignore
+                else:
+                    match = pattern.search(name)  # type: ignore
+                    name = match.group() if match else name
+            # Trim off characters at the end of names
+            for characters in self.trim:
+                if name.endswith(characters):
+                    name = name[: -len(characters)]
+                if name.startswith(characters):
+                    name = name[len(characters) :]
+
+        # Remove trailing whitespace
+        name = name.strip()
+
+        # If we cleaned back to an empty string, just use the original value
+        if name == "":
+            name = original_name
+
+        for s_name_search, s_name_replace, compiled in self.replace_rules:
+            try:
+                # Skip if we're looking for exact matches only
+                if self.replace_exact:
+                    # Simple strings
+                    if compiled is None and name != s_name_search:
+                        continue
+                    # regexes
+                    if compiled is not None and not compiled.fullmatch(name):
+                        continue
+                # Replace - regex
+                if compiled is not None:
+                    name = compiled.sub(s_name_replace, name)
+                # Replace - simple string
+                else:
+                    # Complete name swap
+                    if self.replace_complete:
+                        if s_name_search in name:
+                            name = s_name_replace
+                    # Partial substring replace
+                    else:
+                        name = name.replace(s_name_search, s_name_replace)
+            except re.error as e:
+                logger.error(f"Error with sample name replacement regex: {e}")
+        return name
+
+
+_programs: Dict[Tuple, CleaningProgram] = {}
+
+# Frozen contents of the list and dict options, and the option objects they were frozen from
+_options_key: Optional[Tuple] = None
+_options: Tuple = ()
+
+
+def _get_options_key() -> Tuple:
+    """
+    Frozen `fn_clean_exts`, `fn_clean_trim` and `sample_names_replace`, frozen again only when one of
+    these options is replaced or `clear()` was called
+    """
+    global _options_key, _options
+    options = (config.fn_clean_exts, config.fn_clean_trim, config.sample_names_replace)
+    if _options_key is None or any(a is not b for a, b in zip(options, _options)):
+        _options_key = _freeze(options)
+        _options = options
+    return _options_key
+
+
+def get_program(
+    anchor: str,
+    fn_clean_exts: Optional[List[CleanPatternT]] = None,
+    fn_clean_trim: Optional[List[str]] = None,
+    prepend_dirs: Optional[bool] = None,
+) -> CleaningProgram:
+    """
+    Program for the current config state, compiling it on first use. `fn_clean_exts` and
+    `fn_clean_trim` override the config options, as in `clean_s_name()`.
+    """
+    key = (
+        anchor,
+        _get_options_key(),
+        config.fn_clean_sample_names,
+        config.prepend_dirs if prepend_dirs is None else prepend_dirs,
+        config.prepend_dirs_depth,
+        config.prepend_dirs_sep,
+        _freeze(config.use_filename_as_sample_name),
+        config.sample_names_replace_regex,
+        config.sample_names_replace_exact,
+        config.sample_names_replace_complete,
+        None if fn_clean_exts is None else _freeze(fn_clean_exts),
+        None if fn_clean_trim is None else _freeze(fn_clean_trim),
+    )
+    program = _programs.get(key)
+    if program is None:
+        program = CleaningProgram(
+            anchor,
+            config.fn_clean_exts if fn_clean_exts is None else fn_clean_exts,
+            config.fn_clean_trim if fn_clean_trim is None else fn_clean_trim,
+        )
+        _programs[key] = program
+    return program
+
+
+def clear():
+    """
+    Drop the compiled programs and the cleaned names, e.g. when the config is reset
+    """
+    global _options_key, _options
+    _programs.clear()
+    _options_key = None
+    _options = ()
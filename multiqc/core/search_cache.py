@@ -0,0 +1,193 @@
+"""
+Persistent cache of the file search results, so that reruns over the same directories
+only read files that are new or changed since the previous run.
+
+Results are stored in an SQLite database in the user cache directory (or in
+`config.search_cache_dir`), keyed by the absolute file path, its size and modification
+time, and a fingerprint of the search patterns, the search config and the MultiQC version.
+Results of several fingerprints are kept side by side, so that runs with different modules or
+search patterns don't evict each other. Results that haven't been used for `MAX_AGE_DAYS` are
+removed, so that upgrading MultiQC or changing the search patterns doesn't leave stale results
+behind for good.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import re
+import sqlite3
+import sys
+import time
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from multiqc import config
+from multiqc.core.compressed_files import COMPRESSION_EXTENSIONS
+
+logger = logging.getLogger(__name__)
+
+CACHE_FILENAME = "search_cache.sqlite"
+
+# Cached results not used for this many days are removed on save, also from the parsed data cache
+MAX_AGE_DAYS = 30
+# The last use of a cached result is only recorded again after this many seconds, so that a rerun
+# doesn't rewrite every row it reads
+LAST_USED_RESOLUTION = 24 * 60 * 60
+
+# Config options that change the outcome of a file search, on top of the search patterns
+SEARCH_CONFIG_KEYS = [
+    "log_filesize_limit",
+    "filesearch_lines_limit",
+    "filesearch_file_shared",
+    "fn_ignore_files",
+    "ignore_images",
+]
+
+# Result of searching a file: the search pattern keys that matched the file, in the order they
+# matched, and the keys in `report.file_search_stats` that the file was added to
+SearchResult = Tuple[List[str], List[str]]
+
+
+def cache_dir() -> Path:
+    """
+    Directory to keep the cache in: `config.search_cache_dir`, or the user cache directory
+    of the platform
+    """
+    if config.search_cache_dir:
+        return Path(config.search_cache_dir)
+    if sys.platform == "darwin":
+        return Path.home() / "Library" / "Caches" / "multiqc"
+    if sys.platform == "win32" and os.environ.get("LOCALAPPDATA"):
+        return Path(os.environ["LOCALAPPDATA"]) / "multiqc" / "Cache"
+    return Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache") / "multiqc"
+
+
+def search_fingerprint(spatterns: Iterable[Dict]) -> str:
+    """
+    Hash of everything apart from the file itself that decides the outcome of a file search
+    """
+
+    def _default(obj):
+        if isinstance(obj, re.Pattern):
+            return [obj.pattern, obj.flags]
+        if isinstance(obj, (set, frozenset)):
+            return sorted(json.dumps(v, default=_default, sort_keys=True) for v in obj)
+        raise TypeError(f"Can't serialize {type(obj)}")
+
+    data = {
+        "version": config.version,
+        "config": {k: getattr(config, k, None) for k in SEARCH_CONFIG_KEYS},
+        # Depends on the optional dependencies installed
+        "compression_extensions": COMPRESSION_EXTENSIONS,
+        "patterns": [
+            [[module_id, [sp.model_dump() for sp in sps]] for module_id, sps in patterns.items()]
+            for patterns in spatterns
+        ],
+    }
+    return hashlib.sha256(json.dumps(data, default=_default, sort_keys=True).encode()).hexdigest()
+
+
+def reset():
+    """
+    Remove all cached search results
+    """
+    path = cache_dir() / CACHE_FILENAME
+    if path.exists():
+        logger.info(f"Removing the file search cache {path}")
+        path.unlink()
+
+
+class SearchCache:
+    """
+    Search results of one search configuration. All results are loaded when opening the
+    cache, and new results are written in a single transaction on `save()`, which also
+    removes the results of any configuration that haven't been used for `MAX_AGE_DAYS`.
+    """
+
+    def __init__(self, fingerprint: str):
+        self.fingerprint = fingerprint
+        self.path = cache_dir() / CACHE_FILENAME
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._con = sqlite3.connect(self.path, timeout=30)
+        self._con.execute(
+            "CREATE TABLE IF NOT EXISTS search_results ("
+            "fingerprint TEXT, path TEXT, size INTEGER, mtime_ns INTEGER, result TEXT, last_used INTEGER, "
+            "PRIMARY KEY (fingerprint, path))"
+        )
+        self._entries: Dict[str, Tuple[int, int, str, int]] = {
+            path: (size, mtime_ns, result, last_used)
+            for path, size, mtime_ns, result, last_used in self._con.execute(
+                "SELECT path, size, mtime_ns, result, last_used FROM search_results WHERE fingerprint = ?",
+                (fingerprint,),
+            )
+        }
+        self._new_entries: List[Tuple[str, str, int, int, str, int]] = []
+        self._used_paths: List[str] = []
+        self._now = int(time.time())
+        self.hits = 0
+        logger.debug(f"Using file search cache {self.path} with {len(self._entries)} entries")
+
+    @staticmethod
+    def open(fingerprint: str) -> Optional["SearchCache"]:
+        """
+        Open the cache, or return None if it can't be used, e.g. on a read-only file system
+        """
+        try:
+            return SearchCache(fingerprint)
+        except (sqlite3.Error, OSError) as e:
+            logger.warning(f"Couldn't open the file search cache, searching all files: {e}")
+            return None
+
+    @staticmethod
+    def file_key(path: Path) -> Optional[Tuple[str, int, int]]:
+        """
+        Absolute path, size and modification time of the file, or None if it can't be accessed
+        """
+        try:
+            st = path.stat()
+        except OSError:
+            return None
+        return os.path.abspath(path), st.st_size, st.st_mtime_ns
+
+    def get(self, key: Tuple[str, int, int]) -> Optional[SearchResult]:
+        path, size, mtime_ns = key
+        entry = self._entries.get(path)
+        if entry is None or entry[0] != size or entry[1] != mtime_ns:
+            return None
+        self.hits += 1
+        if entry[3] < self._now - LAST_USED_RESOLUTION:
+            self._used_paths.append(path)
+        matched, stats = json.loads(entry[2])
+        return matched, stats
+
+    def add(self, key: Tuple[str, int, int], result: SearchResult):
+        path, size, mtime_ns = key
+        self._new_entries.append((self.fingerprint, path, size, mtime_ns, json.dumps(result), self._now))
+
+    def save(self):
+        """
+        Write the new results, record the use of the cached ones, and drop the results of any
+        search configuration that haven't been used for `MAX_AGE_DAYS`
+        """
+        try:
+            with self._con:
+                self._con.executemany(
+                    "INSERT OR REPLACE INTO search_results (fingerprint, path, size, mtime_ns, result, last_used) "
+                    "VALUES (?, ?, ?, ?, ?, ?)",
+                    self._new_entries,
+                )
+                self._con.executemany(
+                    "UPDATE search_results SET last_used = ? WHERE fingerprint = ? AND path = ?",
+                    [(self._now, self.fingerprint, path) for path in self._used_paths],
+                )
+                self._con.execute(
+                    "DELETE FROM search_results WHERE last_used < ?", (self._now - MAX_AGE_DAYS * 24 * 60 * 60,)
+                )
+        except sqlite3.Error as e:
+            logger.warning(f"Couldn't save the file search cache: {e}")
+        self._new_entries = []
+        self._used_paths = []
+
+    def close(self):
+        self._con.close()
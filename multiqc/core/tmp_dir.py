@@ -47,6 +47,9 @@ def plots_tmp_dir(create=True) -> Path:
     return path
 
 
-def new_tmp_dir():
+def new_tmp_dir(path: Optional[Path] = None):
+    """
+    Start using a new temporary directory: `path`, or a new directory created on first use
+    """
     global _tmp_dir
-    _tmp_dir = None
+    _tmp_dir = path
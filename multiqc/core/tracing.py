@@ -0,0 +1,166 @@
+"""
+Timeline tracing of a run with `config.trace`: nested spans are recorded for the file search, each
+module and the files it reads and parses, the sections and plots it adds, and the report writing
+steps. The spans are written to the data directory in the Chrome Trace Event format, which can be
+opened in chrome://tracing or https://ui.perfetto.dev, and in the speedscope format for
+https://www.speedscope.app.
+"""
+
+import contextlib
+import functools
+import json
+import logging
+import os
+import threading
+import time
+from collections import defaultdict
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Tuple, TypeVar
+
+from multiqc import config, report
+
+logger = logging.getLogger(__name__)
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+# Offset from `time.perf_counter_ns()` to the wall clock, so that spans recorded in worker processes
+# line up with the main process, while durations are measured with the precise counter
+_CLOCK_OFFSET_NS = time.time_ns() - time.perf_counter_ns()
+
+
+def _now_us() -> int:
+    return (time.perf_counter_ns() + _CLOCK_OFFSET_NS) // 1000
+
+
+@contextlib.contextmanager
+def span(name: str, cat: str = "multiqc", **args: Any) -> Iterator[None]:
+    """
+    Record the time spent in the block as a span, if `config.trace` is enabled. `args` are shown
+    with the span in the Chrome trace viewer
+    """
+    if not config.trace:
+        yield
+        return
+    start = _now_us()
+    try:
+        yield
+    finally:
+        report.runtimes.trace_events.append(
+            report.TraceEvent(
+                name=name,
+                cat=cat,
+                start=start,
+                duration=_now_us() - start,
+                pid=os.getpid(),
+                tid=threading.get_native_id(),
+                args={k: str(v) for k, v in args.items()},
+            )
+        )
+
+
+def traced(name: str, cat: str = "multiqc") -> Callable[[F], F]:
+    """
+    Decorator recording each call of the function as a span
+    """
+
+    def decorator(func: F) -> F:
+        @functools.wraps(func)
+        def wrapper(*a, **kw):
+            if not config.trace:
+                return func(*a, **kw)
+            with span(name, cat):
+                return func(*a, **kw)
+
+        return wrapper  # type: ignore
+
+    return decorator
+
+
+def chrome_trace(events: List["report.TraceEvent"]) -> Dict[str, Any]:
+    """
+    Spans in the Chrome Trace Event format, as complete ("X") events, with the processes named
+    """
+    main_pid = os.getpid()
+    trace_events: List[Dict[str, Any]] = []
+    for pid in sorted({e.pid for e in events}):
+        name = "multiqc" if pid == main_pid else f"multiqc worker {pid}"
+        trace_events.append({"name": "process_name", "ph": "M", "pid": pid, "args": {"name": name}})
+    for e in sorted(events, key=lambda e: (e.start, -e.duration)):
+        trace_events.append(
+            {
+                "name": e.name,
+                "cat": e.cat,
+                "ph": "X",
+                "ts": e.start,
+                "dur": e.duration,
+                "pid": e.pid,
+                "tid": e.tid,
+                "args": e.args,
+            }
+        )
+    return {"traceEvents": trace_events, "displayTimeUnit": "ms", "otherData": {"version": config.version}}
+
+
+def speedscope(events: List["report.TraceEvent"]) -> Dict[str, Any]:
+    """
+    Spans in the speedscope format, as an evented profile for each thread of each process
+    """
+    frames: List[Dict[str, str]] = []
+    frame_idx: Dict[str, int] = {}
+    by_thread: Dict[Tuple[int, int], List["report.TraceEvent"]] = defaultdict(list)
+    for e in events:
+        by_thread[(e.pid, e.tid)].append(e)
+        if e.name not in frame_idx:
+            frame_idx[e.name] = len(frames)
+            frames.append({"name": e.name})
+
+    main_pid = os.getpid()
+    profiles = []
+    for (pid, tid), thread_events in sorted(by_thread.items()):
+        start = min(e.start for e in thread_events)
+        end = max(e.start + e.duration for e in thread_events)
+        ss_events: List[Dict[str, Any]] = []
+        # Open and close the frames in order. Spans of a thread are nested, but the end of a span
+        # measured separately can overrun its parent by a microsecond, so it's clamped
+        stack: List[Tuple[int, int]] = []  # frame and end of the open spans
+        for e in sorted(thread_events, key=lambda e: (e.start, -e.duration)):
+            while stack and stack[-1][1] <= e.start:
+                frame, at = stack.pop()
+                ss_events.append({"type": "C", "frame": frame, "at": at})
+            e_end = min(e.start + e.duration, stack[-1][1]) if stack else e.start + e.duration
+            stack.append((frame_idx[e.name], e_end))
+            ss_events.append({"type": "O", "frame": frame_idx[e.name], "at": e.start})
+        while stack:
+            frame, at = stack.pop()
+            ss_events.append({"type": "C", "frame": frame, "at": at})
+        profiles.append(
+            {
+                "type": "evented",
+                "name": ("multiqc" if pid == main_pid else f"multiqc worker {pid}") + f", thread {tid}",
+                "unit": "microseconds",
+                "startValue": start,
+                "endValue": end,
+                "events": ss_events,
+            }
+        )
+    return {
+        "$schema": "https://www.speedscope.app/file-format-schema.json",
+        "shared": {"frames": frames},
+        "profiles": profiles,
+        "name": "MultiQC run",
+        "activeProfileIndex": 0,
+        "exporter": f"multiqc {config.version}",
+    }
+
+
+def write_trace_files(data_dir: Path):
+    """
+    Write the spans recorded so far to the data directory. Called after the report is written, to
+    include the last steps, so the files are written directly instead of with the other data files
+    """
+    events = report.runtimes.trace_events
+    with (data_dir / "multiqc_trace.json").open("w", encoding="utf-8") as f:
+        json.dump(chrome_trace(events), f)
+    with (data_dir / "multiqc_trace.speedscope.json").open("w", encoding="utf-8") as f:
+        json.dump(speedscope(events), f)
+    logger.debug(f"Wrote {len(events)} trace spans to {data_dir}")
@@ -8,7 +8,7 @@ from pydantic import BaseModel
 
 from multiqc import report, config
 from multiqc.core.exceptions import RunError
-from multiqc.core import log_and_rich, plugin_hooks
+from multiqc.core import log_and_rich, plot_data_compression, plugin_hooks, sample_name_cleaning
 
 logger = logging.getLogger(__name__)
 
@@ -50,6 +50,18 @@ class ClConfig(BaseModel):
     no_ansi: Optional[bool] = None
     profile_runtime: Optional[bool] = None
     profile_memory: Optional[bool] = None
+    profile_rss: Optional[bool] = None
+    trace: Optional[bool] = None
+    plot_data_compression: Optional[str] = None
+    plot_data_compression_level: Optional[int] = None
+    search_workers: Optional[int] = None
+    search_walk_threads: Optional[int] = None
+    module_workers: Optional[int] = None
+    read_ahead_files: Optional[int] = None
+    search_cache: Optional[bool] = None
+    search_cache_reset: Optional[bool] = None
+    parse_cache: Optional[bool] = None
+    parse_cache_reset: Optional[bool] = None
     no_version_check: Optional[bool] = None
     ignore: List[str] = []
     ignore_samples: List[str] = []
@@ -183,6 +195,34 @@ def update_config(*analysis_dir, cfg: Optional[ClConfig] = None, log_to_file=Fal
         config.profile_runtime = cfg.profile_runtime
     if cfg.profile_memory is not None:
         config.profile_runtime = config.profile_memory = cfg.profile_memory
+    if cfg.profile_rss is not None:
+        config.profile_runtime = config.profile_rss = cfg.profile_rss
+    if cfg.trace is not None:
+        config.trace = cfg.trace
+    if cfg.plot_data_compression is not None:
+        config.plot_data_compression = cfg.plot_data_compression
+    if cfg.plot_data_compression_level is not None:
+        try:
+            plot_data_compression.check_level(config.plot_data_compression, cfg.plot_data_compression_level)
+        except ValueError as e:
+            raise RunError(str(e))
+        config.plot_data_compression_level = cfg.plot_data_compression_level
+    if cfg.search_workers is not None:
+        config.search_workers = cfg.search_workers
+    if cfg.search_walk_threads is not None:
+        config.search_walk_threads = cfg.search_walk_threads
+    if cfg.module_workers is not None:
+        config.module_workers = cfg.module_workers
+    if cfg.read_ahead_files is not None:
+        config.read_ahead_files = cfg.read_ahead_files
+    if cfg.search_cache is not None:
+        config.search_cache = cfg.search_cache
+    if cfg.search_cache_reset is not None:
+        config.search_cache_reset = cfg.search_cache_reset
+    if cfg.parse_cache is not None:
+        config.parse_cache = cfg.parse_cache
+    if cfg.parse_cache_reset is not None:
+        config.parse_cache_reset = cfg.parse_cache_reset
     if cfg.no_version_check is not None:
         config.no_version_check = cfg.no_version_check
     if cfg.custom_css_files:
@@ -223,5 +263,8 @@ def update_config(*analysis_dir, cfg: Optional[ClConfig] = None, log_to_file=Fal
     if cfg.unknown_options:
         config.kwargs = cfg.unknown_options  # plug in command line options
 
+    # Drop the sample name cleaning rules compiled for the previous config
+    sample_name_cleaning.clear()
+
     plugin_hooks.mqc_trigger("config_loaded")
     plugin_hooks.mqc_trigger("execution_start")
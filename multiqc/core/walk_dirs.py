@@ -0,0 +1,130 @@
+"""
+Walk the analysis paths and collect the list of files to search
+"""
+
+import dataclasses
+import logging
+import os
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Set
+
+from multiqc import config
+
+logger = logging.getLogger(__name__)
+
+
+@dataclasses.dataclass
+class WalkResult:
+    files: List[Path] = dataclasses.field(default_factory=list)
+    skipped_symlinks: Set[Path] = dataclasses.field(default_factory=set)
+    skipped_dirs: Set[Path] = dataclasses.field(default_factory=set)  # Matching fn_ignore_dirs or fn_ignore_paths
+    dirs_visited: int = 0
+    entries_visited: int = 0
+
+
+def is_searching_in_source_dir(path: Path, filenames: Optional[List[str]] = None) -> bool:
+    """
+    Checks whether MultiQC is searching for files in the source code folder. Takes the
+    names of the files in the folder if they are already listed.
+    """
+    multiqc_installation_dir_files = [
+        "LICENSE",
+        "CHANGELOG.md",
+        "Dockerfile",
+        "MANIFEST.in",
+        ".gitmodules",
+        "README.md",
+        "pyproject.toml",
+        ".gitignore",
+    ]
+
+    if filenames is None:
+        filenames = [f.name for f in path.iterdir() if f.is_file()]
+
+    if len(filenames) > 0 and all([fn in filenames for fn in multiqc_installation_dir_files]):
+        logger.error(f"Error: MultiQC is running in source code directory! {path}")
+        logger.warning("Please see the docs for how to use MultiQC: https://multiqc.info/docs/#running-multiqc")
+        return True
+    else:
+        return False
+
+
+def _is_ignored_dir(path: Path) -> bool:
+    d_matches = any(d for d in config.fn_ignore_dirs if path.match(d.rstrip(os.sep)))
+    p_matches = any(p for p in config.fn_ignore_paths if path.match(p.rstrip(os.sep)))
+    return d_matches or p_matches
+
+
+def _list_dir(path: Path) -> List[os.DirEntry]:
+    with os.scandir(path) as it:
+        return list(it)
+
+
+def walk_analysis_paths(analysis_paths: List[str], threads: int = 1) -> WalkResult:
+    """
+    Collect files from the analysis paths, walking directories depth-first in the order they
+    are listed. Directories are listed with `os.scandir`, and the file type of the entries is
+    taken from the listing where the file system provides it, instead of a stat call for each
+    entry. Directories matching `fn_ignore_dirs` or `fn_ignore_paths` are not descended into.
+    The walk is iterative, so deep directory trees can't hit the recursion limit.
+
+    With `threads` above 1, the subdirectories of each directory entered are listed ahead
+    in a thread pool, so that listings on high-latency file systems overlap. The walk still
+    consumes the listings depth-first in the same order, so the result is the same as with
+    a single thread.
+    """
+    result = WalkResult()
+    # Stack with an iterator over the remaining entries of each directory being walked
+    stack: List[Iterator[os.DirEntry]] = []
+    executor = ThreadPoolExecutor(max_workers=threads, thread_name_prefix="multiqc_walk") if threads > 1 else None
+    # Listings of directories submitted to the thread pool, that haven't been walked yet
+    pending: Dict[str, "Future[List[os.DirEntry]]"] = {}
+
+    def _enter_dir(path: Path):
+        future = pending.pop(str(path), None)
+        # Directories with a pending listing were already checked against the ignore patterns
+        if future is None and _is_ignored_dir(path):
+            result.skipped_dirs.add(path)
+            return
+        entries = future.result() if future is not None else _list_dir(path)
+        result.dirs_visited += 1
+        # Check not running in install directory
+        if is_searching_in_source_dir(path, [e.name for e in entries if e.is_file()]):
+            return
+        if executor is not None:
+            for e in entries:
+                if e.is_dir() and not (config.ignore_symlinks and e.is_symlink()):
+                    subdir = Path(e.path)
+                    if not _is_ignored_dir(subdir):
+                        pending[str(subdir)] = executor.submit(_list_dir, subdir)
+        stack.append(iter(entries))
+
+    try:
+        for analysis_path in analysis_paths:
+            path = Path(analysis_path)
+            result.entries_visited += 1
+            if path.is_symlink() and config.ignore_symlinks:
+                result.skipped_symlinks.add(path)
+            elif path.is_file():
+                result.files.append(path)
+            elif path.is_dir():
+                _enter_dir(path)
+
+            while stack:
+                entry = next(stack[-1], None)
+                if entry is None:
+                    stack.pop()
+                    continue
+                result.entries_visited += 1
+                if entry.is_symlink() and config.ignore_symlinks:
+                    result.skipped_symlinks.add(Path(entry.path))
+                elif entry.is_file():
+                    result.files.append(Path(entry.path))
+                elif entry.is_dir():
+                    _enter_dir(Path(entry.path))
+    finally:
+        if executor is not None:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    return result
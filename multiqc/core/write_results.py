@@ -11,13 +11,13 @@ import sys
 import time
 import traceback
 from pathlib import Path
-from typing import Callable, Dict, List, Optional, Union, cast
+from typing import Callable, Dict, List, Optional, TextIO, Union, cast
 
 import jinja2
 
 from multiqc import config, report
 from multiqc.base_module import Section
-from multiqc.core import log_and_rich, plugin_hooks, tmp_dir
+from multiqc.core import log_and_rich, memory_usage, plot_data_compression, plugin_hooks, tmp_dir, tracing
 from multiqc.core.exceptions import NoAnalysisFound
 from multiqc.core.log_and_rich import iterate_using_progress_bar
 from multiqc.core.tmp_dir import rmtree_with_retries
@@ -67,15 +67,19 @@ def write_results() -> None:
 
     output_names: OutputNames = _set_output_names()
 
-    render_and_export_plots(plots_dir_name=output_names.plots_dir_name)
+    with memory_usage.track_step("Rendering plots"), tracing.span("render plots", cat="render"):
+        render_and_export_plots(plots_dir_name=output_names.plots_dir_name)
 
     if not config.skip_generalstats:
-        _render_general_stats_table(plots_dir_name=output_names.plots_dir_name)
+        with memory_usage.track_step("Rendering general stats table"):
+            with tracing.span("render general stats", cat="render"):
+                _render_general_stats_table(plots_dir_name=output_names.plots_dir_name)
 
     paths: OutputPaths = _create_or_override_dirs(output_names)
 
     if config.make_data_dir and not paths.to_stdout and paths.data_dir:
-        _write_data_files(paths.data_dir)
+        with memory_usage.track_step("Writing data files"), tracing.span("write data files", cat="render"):
+            _write_data_files(paths.data_dir)
         logger.info(
             "Data        : {}{}".format(
                 _maybe_relative_path(paths.data_dir),
@@ -111,6 +115,11 @@ def write_results() -> None:
             )
         )
 
+    if config.profile_rss and paths.data_dir is not None and paths.data_dir.exists():
+        memory_usage.write_data_file(paths.data_dir)
+    if config.trace and paths.data_dir is not None and paths.data_dir.exists():
+        tracing.write_trace_files(paths.data_dir)
+
     # Zip the data directory if requested
     if config.zip_data_dir and paths.data_dir is not None:
         shutil.make_archive(str(paths.data_dir), format="zip", root_dir=str(paths.data_dir))
@@ -254,7 +263,8 @@ def render_and_export_plots(plots_dir_name: str):
         if s.plot_anchor:
             _plot = report.plot_by_id[s.plot_anchor]
             if isinstance(_plot, Plot):
-                s.plot = _plot.add_to_report(plots_dir_name=plots_dir_name)
+                with tracing.span("add_to_report", cat="render", plot=_plot.id):
+                    s.plot = _plot.add_to_report(plots_dir_name=plots_dir_name)
             elif isinstance(_plot, str):
                 s.plot = _plot
             else:
@@ -513,25 +523,36 @@ def _write_html_report(to_stdout: bool, report_path: Optional[Path]):
     except:  # noqa: E722
         raise IOError(f"Could not load {config.template} template file '{template_mod.base_fn}'")
 
-    # Compress the report plot JSON data
-    runtime_compression_start = time.time()
-    logger.debug("Compressing plot data")
-    report.plot_compressed_json = report.compress_json(report.plot_data)
-    report.runtimes.total_compression = time.time() - runtime_compression_start
-
-    # Use jinja2 to render the template and overwrite
+    # Use jinja2 to render the template and overwrite. The template is rendered in pieces straight
+    # into the output, and the plot data is rendered as a placeholder, in place of which the data of
+    # each plot is compressed into the output, so the whole report is never held in memory
     report.analysis_files = [os.path.realpath(d) for d in report.analysis_files]
-    report_output = j_template.render(report=report, config=config)
-    if to_stdout:
-        print(report_output, file=sys.stdout)
-    else:
-        assert report_path is not None
-        try:
-            with io.open(report_path, "w", encoding="utf-8") as f:
-                print(report_output, file=f)
-        except IOError as e:
-            raise IOError(f"Could not print report to '{config.output_fn}' - {IOError(e)}")
+    report.plot_compressed_json = _COMPRESSED_PLOT_DATA_PLACEHOLDER
+    # Settle the codec and the level before rendering, so that the report tells the JavaScript the codec
+    # the data is compressed with and includes its decoder, also when the configured one falls back to
+    # gzip, and a fallback is reported once rather than for each plot
+    config.plot_data_compression = plot_data_compression.codec()
+    config.plot_data_compression_level = plot_data_compression.level()
+    new_compressor = plot_data_compression.compressor_factory()
+    report.runtimes.total_compression = 0.0
+    try:
+        if to_stdout:
+            _write_report_output(j_template, sys.stdout, new_compressor)
+        else:
+            assert report_path is not None
+            try:
+                with io.open(report_path, "w", encoding="utf-8") as f:
+                    _write_report_output(j_template, f, new_compressor)
+            except BaseException as e:
+                report_path.unlink(missing_ok=True)  # don't leave a partly written report
+                if isinstance(e, IOError):
+                    raise IOError(f"Could not print report to '{config.output_fn}' - {IOError(e)}")
+                raise
+    finally:
+        report.plot_compressed_json = ""
 
+    if not to_stdout:
+        assert report_path is not None
         # Copy over files if requested by the theme
         try:
             for copy_file in template_mod.copy_files:
@@ -542,6 +563,38 @@ def _write_html_report(to_stdout: bool, report_path: Optional[Path]):
             pass  # No files to copy
 
 
+# Rendered in place of `report.plot_compressed_json`, to be replaced with the compressed plot data
+_COMPRESSED_PLOT_DATA_PLACEHOLDER = "@@multiqc_compressed_plot_data@@"
+
+
+def _write_report_output(
+    j_template: jinja2.Template,
+    f: TextIO,
+    new_compressor: Callable[[], plot_data_compression.Compressor],
+):
+    """
+    Render the report into `f` piece by piece, streaming the plot data compressed by compressors made by
+    `new_compressor` in place of the placeholder
+    """
+    with memory_usage.track_step("Rendering report HTML"), tracing.span("render template", cat="template"):
+        for piece in j_template.generate(report=report, config=config):
+            if _COMPRESSED_PLOT_DATA_PLACEHOLDER not in piece:
+                f.write(piece)
+                continue
+            parts = piece.split(_COMPRESSED_PLOT_DATA_PLACEHOLDER)
+            f.write(parts[0])
+            for part in parts[1:]:
+                runtime_compression_start = time.time()
+                logger.debug("Compressing plot data")
+                with memory_usage.track_step("Compressing report data"):
+                    with tracing.span("compress report data", cat="compress"):
+                        for chunk in report.iter_compressed_plot_data(report.plot_data, new_compressor):
+                            f.write(chunk)
+                report.runtimes.total_compression += time.time() - runtime_compression_start
+                f.write(part)
+    f.write("\n")
+
+
 def _write_pdf(report_path: Path) -> Optional[Path]:
     pdf_path = report_path.with_suffix(".pdf")
     pandoc_call = [
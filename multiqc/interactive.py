@@ -401,6 +401,8 @@ def write_report(
     strict: Optional[bool] = None,
     development: Optional[bool] = None,
     make_pdf: Optional[bool] = None,
+    plot_data_compression: Optional[str] = None,
+    plot_data_compression_level: Optional[int] = None,
     no_megaqc_upload: Optional[bool] = None,
     quiet: Optional[bool] = None,
     verbose: Optional[bool] = None,
@@ -434,6 +436,8 @@ def write_report(
     @param strict: Don't catch exceptions, run additional code checks to help development
     @param development: Development mode. Do not compress and minimise JS, export uncompressed plot data
     @param make_pdf: Create PDF report. Requires Pandoc to be installed
+    @param plot_data_compression: Compression of the plot data embedded in the report: "gzip", "zstd", "brotli" or "none"
+    @param plot_data_compression_level: Compression level of the plot data: 0 to 9 for gzip, 1 to 22 for zstd, 0 to 11 for brotli
     @param no_megaqc_upload: Don't upload generated report to MegaQC, even if MegaQC options are found
     @param quiet: Only show log warnings
     @param verbose: Print more information to the console
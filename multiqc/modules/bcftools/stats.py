@@ -41,9 +41,9 @@ def parse_bcftools_stats(module: BaseMultiqcModule) -> int:
     bcftools_stats_vqc_transv: Dict = dict()
     bcftools_stats_vqc_indels: Dict = dict()
     bcftools_stats_depth_data: Dict = dict()
-    for f in module.find_log_files("bcftools/stats"):
+    for f in module.find_log_files("bcftools/stats", lazy=True):
         s_names = list()
-        for line in f["f"].splitlines():
+        for line in f["f"].lines():
             # Get version number from file contents
             if line.startswith("# This file was produced by bcftools stats"):
                 # Look for BCFtools version
@@ -1,7 +1,9 @@
 import logging
+from typing import List, Mapping
 
-from multiqc.base_module import BaseMultiqcModule, ModuleNoSamplesFound
+from multiqc.base_module import BaseMultiqcModule, ModuleNoSamplesFound, ParsedData
 from multiqc.modules.picard import MarkDuplicates
+from multiqc.types import FileDict, ModuleId
 
 log = logging.getLogger(__name__)
 
@@ -26,12 +28,18 @@ class MultiqcModule(BaseMultiqcModule):
             doi="10.1186/1751-0473-9-13",
         )
 
-        n = dict()
-        n["bamsormadup"] = MarkDuplicates.parse_reports(self, "biobambam2/bamsormadup")
-        if len(n["bamsormadup"]) > 0:
-            log.info(f"Found {len(n['bamsormadup'])} bamsormadup reports")
-        else:
+        self.parse_and_build_sections()
+
+    def parse(self, files: Mapping[ModuleId, List[FileDict]]) -> ParsedData:
+        parsed = ParsedData()
+        parsed.data["bamsormadup"] = MarkDuplicates.parse_reports(self, files, parsed, "biobambam2/bamsormadup")
+        if len(parsed.data["bamsormadup"]) == 0:
             raise ModuleNoSamplesFound
+        return parsed
+
+    def build_sections(self, parsed: ParsedData) -> None:
+        n = MarkDuplicates.add_sections(self, parsed.data["bamsormadup"])
+        log.info(f"Found {len(n)} bamsormadup reports")
 
     # Helper functions
     @staticmethod
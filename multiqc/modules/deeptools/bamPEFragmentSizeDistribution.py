@@ -12,7 +12,7 @@ class bamPEFragmentSizeDistributionMixin:
     def parse_bamPEFragmentSizeDistribution(self):
         """Find bamPEFragmentSize output. Supports the --outRawFragmentLengths option"""
         self.deeptools_bamPEFragmentSizeDistribution = dict()
-        for f in self.find_log_files("deeptools/bamPEFragmentSizeDistribution", filehandles=False):
+        for f in self.find_log_files("deeptools/bamPEFragmentSizeDistribution", lazy=True):
             parsed_data = self.parseBamPEFDistributionFile(f)
             for k, v in parsed_data.items():
                 if k in self.deeptools_bamPEFragmentSizeDistribution:
@@ -53,7 +53,7 @@ class bamPEFragmentSizeDistributionMixin:
     def parseBamPEFDistributionFile(self, f):
         d = dict()
         lastsample = []
-        for line in f["f"].splitlines():
+        for line in f["f"].lines():
             cols = line.rstrip().split("\t")
             if cols[0] == "#bamPEFragmentSize":
                 continue
@@ -12,7 +12,7 @@ class bamPEFragmentSizeTableMixin:
     def parse_bamPEFragmentSize(self):
         """Find bamPEFragmentSize output. Supports the --table option"""
         self.deeptools_bamPEFragmentSize = dict()
-        for f in self.find_log_files("deeptools/bamPEFragmentSizeTable"):
+        for f in self.find_log_files("deeptools/bamPEFragmentSizeTable", lazy=True):
             parsed_data = self.parseBamPEFile(f)
             for k, v in parsed_data.items():
                 if k in self.deeptools_bamPEFragmentSize:
@@ -236,7 +236,7 @@ class bamPEFragmentSizeTableMixin:
     def parseBamPEFile(self, f):
         d = {}
         headers = None
-        for line in f["f"].splitlines():
+        for line in f["f"].lines():
             cols = line.rstrip().split("\t")
             if headers is None:
                 headers = cols
@@ -12,7 +12,7 @@ class EstimateReadFilteringMixin:
     def parse_estimate_read_filtering(self):
         """Find estimateReadFiltering output. Only the output from --table is supported."""
         self.deeptools_estimateReadFiltering = dict()
-        for f in self.find_log_files("deeptools/estimateReadFiltering"):
+        for f in self.find_log_files("deeptools/estimateReadFiltering", lazy=True):
             parsed_data = self.parse_estimate_read_filtering_file(f)
             for k, v in parsed_data.items():
                 if k in self.deeptools_estimateReadFiltering:
@@ -141,7 +141,7 @@ class EstimateReadFilteringMixin:
     def parse_estimate_read_filtering_file(self, f):
         d = {}
         firstLine = True
-        for line in f["f"].splitlines():
+        for line in f["f"].lines():
             if firstLine:
                 firstLine = False
                 continue
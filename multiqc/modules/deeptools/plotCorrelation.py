@@ -12,7 +12,7 @@ class plotCorrelationMixin:
     def parse_plotCorrelation(self):
         """Find plotCorrelation output"""
         self.deeptools_plotCorrelationData = dict()
-        for f in self.find_log_files("deeptools/plotCorrelationData", filehandles=False):
+        for f in self.find_log_files("deeptools/plotCorrelationData", lazy=True):
             parsed_data = self.parsePlotCorrelationData(f)
             for sample, val_by_sample in parsed_data.items():
                 if sample in self.deeptools_plotCorrelationData:
@@ -63,7 +63,7 @@ class plotCorrelationMixin:
     def parsePlotCorrelationData(self, f):
         d = dict()
         x_samples = None
-        for line in f["f"].splitlines():
+        for line in f["f"].lines():
             cols = line.split("\t")
             if cols[0] == "#plotCorrelation --outFileCorMatrix":
                 continue
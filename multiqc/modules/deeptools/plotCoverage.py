@@ -12,7 +12,7 @@ class plotCoverageMixin:
     def parse_plotCoverage(self):
         """Find plotCoverage output. Both stdout and --outRawCounts"""
         self.deeptools_plotCoverageStdout = dict()
-        for f in self.find_log_files("deeptools/plotCoverageStdout"):
+        for f in self.find_log_files("deeptools/plotCoverageStdout", lazy=True):
             parsed_data = self.parsePlotCoverageStdout(f)
             for k, v in parsed_data.items():
                 if k in self.deeptools_plotCoverageStdout:
@@ -23,7 +23,7 @@ class plotCoverageMixin:
                 self.add_data_source(f, section="plotCoverage")
 
         self.deeptools_plotCoverageOutRawCounts = dict()
-        for f in self.find_log_files("deeptools/plotCoverageOutRawCounts"):
+        for f in self.find_log_files("deeptools/plotCoverageOutRawCounts", lazy=True):
             parsed_data = self.parsePlotCoverageOutRawCounts(f)
             for k, v in parsed_data.items():
                 if k in self.deeptools_plotCoverageOutRawCounts:
@@ -105,7 +105,7 @@ class plotCoverageMixin:
     def parsePlotCoverageStdout(self, f):
         d = {}
         firstLine = True
-        for line in f["f"].splitlines():
+        for line in f["f"].lines():
             if firstLine:
                 firstLine = False
                 continue
@@ -146,7 +146,7 @@ class plotCoverageMixin:
         d = {}
         nCols = 0
         nRows = 0
-        for line in f["f"].splitlines():
+        for line in f["f"].lines():
             if line.startswith("#plotCoverage"):
                 continue
 
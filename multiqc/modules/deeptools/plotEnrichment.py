@@ -12,7 +12,7 @@ class PlotEnrichmentMixin:
     def parse_plot_enrichment(self):
         """Find plotEnrichment output."""
         self.deeptools_plotEnrichment = dict()
-        for f in self.find_log_files("deeptools/plotEnrichment"):
+        for f in self.find_log_files("deeptools/plotEnrichment", lazy=True):
             parsed_data = self.parsePlotEnrichment(f)
             for k, v in parsed_data.items():
                 if k in self.deeptools_plotEnrichment:
@@ -65,7 +65,7 @@ class PlotEnrichmentMixin:
     def parsePlotEnrichment(self, f):
         d = {}
         firstLine = True
-        for line in f["f"].splitlines():
+        for line in f["f"].lines():
             if firstLine:
                 firstLine = False
                 continue
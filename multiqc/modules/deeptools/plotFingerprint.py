@@ -14,7 +14,7 @@ class PlotFingerprintMixin:
     def parse_plotFingerprint(self):
         """Find plotFingerprint output. Both --outQualityMetrics and --outRawCounts"""
         self.deeptools_plotFingerprintOutQualityMetrics = dict()
-        for f in self.find_log_files("deeptools/plotFingerprintOutQualityMetrics"):
+        for f in self.find_log_files("deeptools/plotFingerprintOutQualityMetrics", lazy=True):
             parsed_data = self.parsePlotFingerprintOutQualityMetrics(f)
             for k, v in parsed_data.items():
                 if k in self.deeptools_plotFingerprintOutQualityMetrics:
@@ -26,7 +26,7 @@ class PlotFingerprintMixin:
                 self.add_data_source(f, section="plotFingerprint")
 
         self.deeptools_plotFingerprintOutRawCounts = dict()
-        for f in self.find_log_files("deeptools/plotFingerprintOutRawCounts"):
+        for f in self.find_log_files("deeptools/plotFingerprintOutRawCounts", lazy=True):
             parsed_data = self.parsePlotFingerprintOutRawCounts(f)
             for k, v in parsed_data.items():
                 if k in self.deeptools_plotFingerprintOutRawCounts:
@@ -97,7 +97,7 @@ class PlotFingerprintMixin:
         d = {}
         firstLine = True
         header = []
-        for line in f["f"].splitlines():
+        for line in f["f"].lines():
             cols = line.strip().split("\t")
 
             if len(cols) < 7:
@@ -143,7 +143,7 @@ class PlotFingerprintMixin:
         d = dict()
         samples = []
         firstLine = True
-        for line in f["f"].splitlines():
+        for line in f["f"].lines():
             cols = line.strip().split("\t")
             if cols[0] == "#plotFingerprint --outRawCounts":
                 continue
@@ -12,7 +12,7 @@ class plotPCAMixin:
     def parse_plotPCA(self):
         """Find plotPCA output"""
         self.deeptools_plotPCAData = dict()
-        for f in self.find_log_files("deeptools/plotPCAData", filehandles=False):
+        for f in self.find_log_files("deeptools/plotPCAData", lazy=True):
             parsed_data = self.parsePlotPCAData(f)
             for k, v in parsed_data.items():
                 if k in self.deeptools_plotPCAData:
@@ -63,7 +63,7 @@ class plotPCAMixin:
     def parsePlotPCAData(self, f):
         d = dict()
         samples = []
-        for line in f["f"].splitlines():
+        for line in f["f"].lines():
             cols = line.strip().split("\t")
             if cols[0] == "#plotPCA --outFileNameData":
                 continue
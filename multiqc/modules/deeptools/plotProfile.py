@@ -12,7 +12,7 @@ class plotProfileMixin:
     def parse_plotProfile(self):
         """Find plotProfile output"""
         self.deeptools_plotProfile = dict()
-        for f in self.find_log_files("deeptools/plotProfile", filehandles=False):
+        for f in self.find_log_files("deeptools/plotProfile", lazy=True):
             parsed_data, bin_labels, converted_bin_labels = self.parsePlotProfileData(f)
             for k, v in parsed_data.items():
                 if k in self.deeptools_plotProfile:
@@ -116,7 +116,7 @@ class plotProfileMixin:
         bin_labels = []
         bins = []
         converted_bin_labels = []
-        for line in f["f"].splitlines():
+        for line in f["f"].lines():
             cols = line.rstrip().split("\t")
             if cols[0] == "bin labels":
                 for col in cols[2 : len(cols)]:
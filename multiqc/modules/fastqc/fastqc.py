@@ -14,14 +14,14 @@ import re
 import zipfile
 from collections import Counter
 from pathlib import Path
-from typing import Any, Dict, List, Literal, Optional, Set, Tuple, Union
+from typing import Any, Dict, List, Literal, Mapping, Optional, Set, Tuple, Union
 
 from multiqc import config, report
-from multiqc.base_module import BaseMultiqcModule, ModuleNoSamplesFound, SampleGroupingConfig
+from multiqc.base_module import BaseMultiqcModule, ModuleNoSamplesFound, ParsedData, SampleGroupingConfig
 from multiqc.plots import bargraph, heatmap, linegraph, table
 from multiqc.plots.plotly.line import LinePlotConfig, Series
 from multiqc.plots.table_object import ColumnKey, InputRow, SampleName
-from multiqc.types import Anchor
+from multiqc.types import Anchor, FileDict, ModuleId
 
 log = logging.getLogger(__name__)
 
@@ -200,11 +200,15 @@ class MultiqcModule(BaseMultiqcModule):
             # No publication / DOI // doi=
         )
 
+        self.parse_and_build_sections()
+
+    def parse(self, files: Mapping[ModuleId, List[FileDict]]) -> ParsedData:
+        parsed = ParsedData()
         self.fastqc_data: Dict[SampleName, Any] = dict()
         self.order_of_duplication_levels: List[float] = []
 
         # Find and parse unzipped FastQC reports
-        for f in self.find_log_files("fastqc/data"):
+        for f in self.find_log_files("fastqc/data", files=files):
             s_name = SampleName(
                 self.clean_s_name(
                     os.path.basename(f["root"]),
@@ -212,11 +216,11 @@ class MultiqcModule(BaseMultiqcModule):
                     root=os.path.dirname(f["root"]),
                 )
             )
-            s_name = self.parse_fastqc_report(f["f"], s_name=s_name, f=f)
-            self.add_data_source(f, str(s_name))
+            s_name = self.parse_fastqc_report(f["f"], parsed, s_name=s_name, f=f)
+            parsed.add_data_source(f, str(s_name))
 
         # Find and parse zipped FastQC reports
-        for f in self.find_log_files("fastqc/zip", filecontents=False):
+        for f in self.find_log_files("fastqc/zip", filecontents=False, files=files):
             fn = f["fn"]
             if fn.endswith("_fastqc.zip"):
                 fn = fn[:-11]
@@ -246,15 +250,29 @@ class MultiqcModule(BaseMultiqcModule):
                         except Exception as e:
                             log.warning(f"Error reading FastQC data file {path}: {e}. Skipping sample {s_name}.")
                             continue
-                    s_name = self.parse_fastqc_report(r_data, s_name=s_name, f=f)
-                    self.add_data_source(f, str(s_name))
+                    s_name = self.parse_fastqc_report(r_data, parsed, s_name=s_name, f=f)
+                    parsed.add_data_source(f, str(s_name))
             except KeyError:
                 log.warning(f"Error - can't find fastqc_raw_data.txt in {f}")
 
         # Filter to strip out ignored sample names
-        self.fastqc_data = self.ignore_samples(self.fastqc_data)
-        if len(self.fastqc_data) == 0:
+        parsed.data["fastqc_data"] = self.ignore_samples(self.fastqc_data)
+        if len(parsed.data["fastqc_data"]) == 0:
             raise ModuleNoSamplesFound
+        parsed.data["order_of_duplication_levels"] = self.order_of_duplication_levels
+
+        # Find a theoretical GC content file to plot
+        parsed.data["theoretical_gc"] = None
+        for f in self.find_log_files("fastqc/theoretical_gc", files=files):
+            if parsed.data["theoretical_gc"] is not None:
+                log.warning(f"Multiple FastQC Theoretical GC Content files found, now using {f['fn']}")
+            parsed.data["theoretical_gc"] = (f["f"], f["fn"])
+        return parsed
+
+    def build_sections(self, parsed: ParsedData) -> None:
+        self.fastqc_data = parsed.data["fastqc_data"]
+        self.order_of_duplication_levels = parsed.data["order_of_duplication_levels"]
+        self.theoretical_gc_file: Optional[Tuple[str, str]] = parsed.data["theoretical_gc"]
 
         log.info(f"Found {len(self.fastqc_data)} reports")
 
@@ -314,7 +332,7 @@ class MultiqcModule(BaseMultiqcModule):
             self.status_heatmap()
         del self.fastqc_data
 
-    def parse_fastqc_report(self, file_contents, s_name: SampleName, f=None) -> SampleName:
+    def parse_fastqc_report(self, file_contents, parsed: ParsedData, s_name: SampleName, f=None) -> SampleName:
         """Takes contents from a fastq_data.txt file and parses out required
         statistics and data. Returns a dict with keys 'stats' and 'data'.
         Data is for plotting graphs, stats are for top table."""
@@ -336,7 +354,7 @@ class MultiqcModule(BaseMultiqcModule):
             if line.startswith("##FastQC"):
                 version_match = re.search(VERSION_REGEX, line)
                 if version_match:
-                    self.add_software_version(version_match.group(1), s_name)
+                    parsed.add_software_version(version_match.group(1), s_name)
             if line == ">>END_MODULE":
                 section = None
                 s_headers = None
@@ -844,11 +862,8 @@ class MultiqcModule(BaseMultiqcModule):
         theoretical_gc = None
         theoretical_gc_raw = None
         theoretical_gc_name = None
-        for f in self.find_log_files("fastqc/theoretical_gc"):
-            if theoretical_gc_raw is not None:
-                log.warning(f"Multiple FastQC Theoretical GC Content files found, now using {f['fn']}")
-            theoretical_gc_raw = f["f"]
-            theoretical_gc_name = f["fn"]
+        if self.theoretical_gc_file is not None:
+            theoretical_gc_raw, theoretical_gc_name = self.theoretical_gc_file
         if theoretical_gc_raw is None:
             tgc = getattr(config, "fastqc_config", {}).get("fastqc_theoretical_gc")
             if tgc is not None and isinstance(tgc, str):
@@ -6,6 +6,7 @@ import logging
 from collections import OrderedDict
 from typing import Dict
 
+from multiqc.base_module import ParsedData
 from multiqc.modules.picard import util
 from multiqc.plots import bargraph
 from multiqc.plots.plotly.bar import BarPlotConfig
@@ -14,13 +15,13 @@ from multiqc.plots.plotly.bar import BarPlotConfig
 log = logging.getLogger(__name__)
 
 
-def parse_reports(module):
+def parse_reports(module, files, parsed: ParsedData) -> Dict[str, Dict]:
     """Find Picard AlignmentSummaryMetrics reports and parse their data"""
 
     data_by_sample: Dict[str, Dict] = dict()
 
     # Go through logs and find Metrics
-    for f in module.find_log_files("picard/alignment_metrics", filehandles=True):
+    for f in module.find_log_files("picard/alignment_metrics", filehandles=True, files=files):
         # Sample name from input file name by default.
         s_name = f["s_name"]
         keys = None
@@ -46,7 +47,7 @@ def parse_reports(module):
                 if s_name in data_by_sample:
                     log.debug(f"Duplicate sample name found in {f['fn']}! Overwriting: " f"{s_name}")
                 data_by_sample[s_name] = dict()
-                module.add_data_source(f, s_name, section="AlignmentSummaryMetrics")
+                parsed.add_data_source(f, s_name, section="AlignmentSummaryMetrics")
                 keys = f["f"].readline().strip("\n").split("\t")
 
             elif keys:
@@ -65,7 +66,12 @@ def parse_reports(module):
                         data_by_sample[s_name][k] = v
 
     # Filter to strip out ignored sample names
-    data_by_sample = module.ignore_samples(data_by_sample)
+    return module.ignore_samples(data_by_sample)
+
+
+def add_sections(module, data_by_sample: Dict[str, Dict]):
+    """Add the general stats columns and the report sections for Picard AlignmentSummaryMetrics"""
+
     if len(data_by_sample) == 0:
         return set()
 
@@ -4,6 +4,7 @@ import logging
 from collections import defaultdict
 from typing import Dict, List
 
+from multiqc.base_module import ParsedData
 from multiqc.modules.picard import util
 from multiqc.plots import linegraph
 
@@ -11,14 +12,14 @@ from multiqc.plots import linegraph
 log = logging.getLogger(__name__)
 
 
-def parse_reports(module):
+def parse_reports(module, files, parsed: ParsedData) -> Dict[str, Dict]:
     """Find Picard BaseDistributionByCycleMetrics reports and parse their data"""
 
     data_by_sample = dict()
     samplestats_by_sample = dict()
 
     # Go through logs and find Metrics
-    for f in module.find_log_files("picard/basedistributionbycycle", filehandles=True):
+    for f in module.find_log_files("picard/basedistributionbycycle", filehandles=True, files=files):
         # Sample name from input file name by default.
         s_name = f["s_name"]
 
@@ -44,7 +45,7 @@ def parse_reports(module):
                 data_by_sample[s_name] = data_by_cycle
                 if s_name in data_by_sample:
                     log.debug(f"Duplicate sample name found in {f['fn']}! Overwriting: {s_name}")
-                module.add_data_source(f, s_name, section="BaseDistributionByCycle")
+                parsed.add_data_source(f, s_name, section="BaseDistributionByCycle")
                 sample_stats = {
                     "sum_pct_a": 0,
                     "sum_pct_c": 0,
@@ -112,8 +113,17 @@ def parse_reports(module):
             _finalize_sample(data_by_read_end, s_name)
 
     # Filter to strip out ignored sample names
-    data_by_sample = module.ignore_samples(data_by_sample)
-    samplestats_by_sample = module.ignore_samples(samplestats_by_sample)
+    return {
+        "data_by_sample": module.ignore_samples(data_by_sample),
+        "samplestats_by_sample": module.ignore_samples(samplestats_by_sample),
+    }
+
+
+def add_sections(module, data: Dict[str, Dict]):
+    """Add the report sections for Picard BaseDistributionByCycleMetrics"""
+
+    data_by_sample = data["data_by_sample"]
+    samplestats_by_sample = data["samplestats_by_sample"]
     if len(data_by_sample) == 0:
         return set()
 
@@ -5,8 +5,10 @@ import re
 from collections import OrderedDict, defaultdict
 from csv import DictReader
 from itertools import chain, groupby
+from typing import Dict
 
 from multiqc import config
+from multiqc.base_module import ParsedData
 from multiqc.plots import table, heatmap
 from multiqc.utils.util_functions import strtobool
 
@@ -29,7 +31,7 @@ FIELD_DESCRIPTIONS = {
 }
 
 
-def parse_reports(module):
+def parse_reports(module, files, parsed: ParsedData) -> Dict:
     """
     Find Picard CrosscheckFingerprints reports and parse their data.
 
@@ -42,7 +44,7 @@ def parse_reports(module):
 
     # Go through logs and find Metrics
     row_number = 0
-    for f in module.find_log_files("picard/crosscheckfingerprints", filehandles=True):
+    for f in module.find_log_files("picard/crosscheckfingerprints", filehandles=True, files=files):
         # Parse an individual CrosscheckFingerprints Report
         (metrics, comments) = _take_till(f["f"], lambda line: line.startswith("#") or line == "\n")
         header = next(metrics).rstrip("\n").split("\t")
@@ -89,7 +91,16 @@ def parse_reports(module):
                 row["BEST_MATCH"] = best_match["RIGHT_SAMPLE"]
                 row["BEST_MATCH_LOD"] = float(best_match["LOD_SCORE"])
 
-            module.add_data_source(f, section="CrosscheckFingerprints")
+            parsed.add_data_source(f, section="CrosscheckFingerprints")
+
+    return {"row_by_number": row_by_number, "found_reports": found_reports}
+
+
+def add_sections(module, data: Dict):
+    """Add the general stats columns and the report sections for Picard CrosscheckFingerprints"""
+
+    row_by_number = data["row_by_number"]
+    found_reports = data["found_reports"]
 
     # Only add sections if we found data
     if not found_reports:
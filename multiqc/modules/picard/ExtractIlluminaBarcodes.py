@@ -4,6 +4,7 @@ import logging
 from collections import defaultdict
 from typing import Dict, List
 
+from multiqc.base_module import ParsedData
 from multiqc.modules.picard import util
 from multiqc.plots import bargraph
 from multiqc.plots.bargraph import CatDataDict
@@ -12,13 +13,13 @@ from multiqc.plots.bargraph import CatDataDict
 log = logging.getLogger(__name__)
 
 
-def parse_reports(module):
+def parse_reports(module, files, parsed: ParsedData) -> Dict[str, Dict]:
     """Find Picard ExtractIlluminaBarcodes reports and parse their data"""
 
     data_by_lane: Dict[str, Dict] = defaultdict(dict)
 
     # Go through logs and find Metrics
-    for f in module.find_log_files("picard/extractilluminabarcodes", filehandles=True):
+    for f in module.find_log_files("picard/extractilluminabarcodes", filehandles=True, files=files):
         # Sample name from input file name by default
         lane = f["s_name"]
         keys = None
@@ -34,7 +35,7 @@ def parse_reports(module):
 
             if util.is_line_right_before_table(line, picard_class=["ExtractIlluminaBarcodes", "BarcodeMetric"]):
                 keys = f["f"].readline().strip("\n").split("\t")
-                module.add_data_source(f, s_name=lane, section="ExtractIlluminaBarcodes")
+                parsed.add_data_source(f, s_name=lane, section="ExtractIlluminaBarcodes")
 
             elif keys:
                 vals = line.strip("\n").split("\t")
@@ -46,7 +47,12 @@ def parse_reports(module):
                 data["LANE"] = lane
                 data_by_lane[lane][data["BARCODE"]] = data
 
-    data_by_lane = module.ignore_samples(data_by_lane)
+    return module.ignore_samples(data_by_lane)
+
+
+def add_sections(module, data_by_lane: Dict[str, Dict]):
+    """Add the report sections for Picard ExtractIlluminaBarcodes"""
+
     if len(data_by_lane) == 0:
         return set()
 
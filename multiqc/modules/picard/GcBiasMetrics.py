@@ -3,6 +3,7 @@
 import logging
 from typing import Dict
 
+from multiqc.base_module import ParsedData
 from multiqc.modules.picard import util
 from multiqc.plots import linegraph
 
@@ -10,7 +11,7 @@ from multiqc.plots import linegraph
 log = logging.getLogger(__name__)
 
 
-def parse_reports(module):
+def parse_reports(module, files, parsed: ParsedData) -> Dict[str, Dict]:
     """
     Find Picard GcBiasMetrics reports and parse their data. There are two types of
     GC bias files:
@@ -26,7 +27,7 @@ def parse_reports(module):
     summary_data_by_sample: Dict[str, Dict] = dict()
 
     # Go through logs and find Metrics
-    for f in module.find_log_files("picard/gcbias", filehandles=True):
+    for f in module.find_log_files("picard/gcbias", filehandles=True, files=files):
         # Sample name from input file name by default.
         s_name = f["s_name"]
         gc_col = None
@@ -87,7 +88,7 @@ def parse_reports(module):
                     cov_col = None
 
         for s_name in set(data_by_sample.keys()) | set(summary_data_by_sample.keys()):
-            module.add_data_source(f, s_name, section="GcBiasMetrics")
+            parsed.add_data_source(f, s_name, section="GcBiasMetrics")
 
     for s_name in list(data_by_sample.keys()):
         if len(data_by_sample[s_name]) == 0:
@@ -100,9 +101,17 @@ def parse_reports(module):
             log.debug(f"Removing {s_name} as no data parsed")
 
     # Filter to strip out ignored sample names
-    data_by_sample = module.ignore_samples(data_by_sample)
-    summary_data_by_sample = module.ignore_samples(summary_data_by_sample)
+    return {
+        "data_by_sample": module.ignore_samples(data_by_sample),
+        "summary_data_by_sample": module.ignore_samples(summary_data_by_sample),
+    }
 
+
+def add_sections(module, data: Dict[str, Dict]):
+    """Add the report sections for Picard GcBiasMetrics"""
+
+    data_by_sample = data["data_by_sample"]
+    summary_data_by_sample = data["summary_data_by_sample"]
     samples = data_by_sample.keys() | summary_data_by_sample.keys()
     if not samples:
         return set()
@@ -7,6 +7,7 @@ import re
 from typing import Dict
 
 from multiqc import config
+from multiqc.base_module import ParsedData
 from multiqc.modules.picard import util
 from multiqc.plots import linegraph, table
 
@@ -61,13 +62,13 @@ FIELD_DESCRIPTIONS = {
 }
 
 
-def parse_reports(module):
+def parse_reports(module, files, parsed: ParsedData) -> Dict:
     """Find Picard HsMetrics reports and parse their data"""
 
     data_by_bait_by_sample: Dict[str, Dict[str, Dict]] = dict()
 
     # Go through logs and find Metrics
-    for f in module.find_log_files("picard/hsmetrics", filehandles=True):
+    for f in module.find_log_files("picard/hsmetrics", filehandles=True, files=files):
         s_name = f["s_name"]
         keys = None
         commadecimal = None
@@ -139,10 +140,15 @@ def parse_reports(module):
             if s_bait_name in data_by_sample:
                 log.debug(f"Duplicate sample name found in {f['fn']}! Overwriting: {s_bait_name}")
             data_by_sample[s_bait_name] = data_by_bait_by_sample[s_name][bait]
-            module.add_data_source(f, s_bait_name, section="HsMetrics")
+            parsed.add_data_source(f, s_bait_name, section="HsMetrics")
 
     # Filter to strip out ignored sample names
-    data_by_sample = module.ignore_samples(data_by_sample)
+    return module.ignore_samples(data_by_sample)
+
+
+def add_sections(module, data_by_sample: Dict):
+    """Add the report sections for Picard HsMetrics"""
+
     if len(data_by_sample) == 0:
         return set()
 
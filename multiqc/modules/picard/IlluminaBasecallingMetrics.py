@@ -1,7 +1,9 @@
 """MultiQC submodule to parse output from Picard IlluminaBasecallingMetrics"""
 
 import logging
+from typing import Dict
 
+from multiqc.base_module import ParsedData
 from multiqc.modules.picard import util
 from multiqc.plots import bargraph, table
 
@@ -9,13 +11,13 @@ from multiqc.plots import bargraph, table
 log = logging.getLogger(__name__)
 
 
-def parse_reports(module):
+def parse_reports(module, files, parsed: ParsedData) -> Dict:
     """Find Picard IlluminaBasecallingMetrics reports and parse their data"""
 
     data_by_sample = dict()
 
     # Go through logs and find Metrics
-    for f in module.find_log_files("picard/collectilluminabasecallingmetrics", filehandles=True):
+    for f in module.find_log_files("picard/collectilluminabasecallingmetrics", filehandles=True, files=files):
         keys = None
 
         for line in f["f"]:
@@ -36,10 +38,16 @@ def parse_reports(module):
                     s_name = data["LANE"]
                     if s_name in data_by_sample:
                         log.debug(f"Duplicate sample name found in {f['fn']}! Overwriting: {s_name}")
-                    module.add_data_source(f, s_name=s_name, section="IlluminaBasecallingMetrics")
+                    parsed.add_data_source(f, s_name=s_name, section="IlluminaBasecallingMetrics")
                     data_by_sample[s_name] = data
 
-    data_by_sample = module.ignore_samples(data_by_sample)
+    # Filter to strip out ignored sample names
+    return module.ignore_samples(data_by_sample)
+
+
+def add_sections(module, data_by_sample: Dict):
+    """Add the report sections for Picard IlluminaBasecallingMetrics"""
+
     if len(data_by_sample) == 0:
         return set()
 
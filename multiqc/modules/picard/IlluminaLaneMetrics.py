@@ -4,6 +4,7 @@ import logging
 from collections import defaultdict
 from typing import Dict
 
+from multiqc.base_module import ParsedData
 from multiqc.modules.picard import util
 from multiqc.plots import table
 
@@ -51,7 +52,7 @@ def lane_metrics_table(module, data):
     return table.plot(tdata, headers, table_config)
 
 
-def parse_reports(module):
+def parse_reports(module, files, parsed: ParsedData) -> Dict:
     """Find Picard IlluminaLaneMetrics reports and parse their data"""
 
     # There can be two types of these files for the same sample: one with IlluminaLaneMetrics,
@@ -60,7 +61,7 @@ def parse_reports(module):
     data_by_lane_by_run: Dict[str, Dict[str, Dict]] = defaultdict(lambda: defaultdict(dict))
 
     # Go through logs and find Metrics
-    for f in module.find_log_files("picard/collectilluminalanemetrics", filehandles=True):
+    for f in module.find_log_files("picard/collectilluminalanemetrics", filehandles=True, files=files):
         # Sample name from input file name by default
         run_name = f["s_name"]
         keys = None
@@ -84,7 +85,7 @@ def parse_reports(module):
                 keys = f["f"].readline().strip("\n").split("\t")
                 if run_name in data_by_lane_by_run:
                     log.debug(f"Duplicate sample name found in {f['fn']}! Overwriting: {run_name}")
-                module.add_data_source(f, s_name=run_name, section="IlluminaLaneMetrics")
+                parsed.add_data_source(f, s_name=run_name, section="IlluminaLaneMetrics")
 
             elif keys:
                 vals = line.strip("\n").split("\t")
@@ -96,7 +97,13 @@ def parse_reports(module):
                 lane = d["LANE"]
                 data_by_lane_by_run[run_name][lane].update(d)
 
-    data_by_lane_by_run = module.ignore_samples(data_by_lane_by_run)
+    # Filter to strip out ignored sample names
+    return module.ignore_samples(data_by_lane_by_run)
+
+
+def add_sections(module, data_by_lane_by_run: Dict):
+    """Add the report sections for Picard IlluminaLaneMetrics"""
+
     if len(data_by_lane_by_run) == 0:
         return set()
 
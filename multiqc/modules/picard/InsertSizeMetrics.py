@@ -4,6 +4,7 @@ import logging
 from typing import Dict
 
 from multiqc import config
+from multiqc.base_module import ParsedData
 from multiqc.modules.picard import util
 from multiqc.plots import linegraph
 
@@ -11,7 +12,7 @@ from multiqc.plots import linegraph
 log = logging.getLogger(__name__)
 
 
-def parse_reports(module):
+def parse_reports(module, files, parsed: ParsedData) -> Dict:
     """Find Picard InsertSizeMetrics reports and parse their data"""
 
     data_by_sample: Dict = dict()
@@ -19,7 +20,7 @@ def parse_reports(module):
     samplestats_by_sample: Dict = dict()
 
     # Go through logs and find Metrics
-    for f in module.find_log_files("picard/insertsize", filehandles=True):
+    for f in module.find_log_files("picard/insertsize", filehandles=True, files=files):
         # Sample name from input file name by default
         s_name = f["s_name"]
         in_hist = False
@@ -62,7 +63,7 @@ def parse_reports(module):
                 if s_name in data_by_sample:
                     log.debug(f"Duplicate sample name found in {f['fn']}! Overwriting: {s_name}")
 
-                module.add_data_source(f, s_name, section="InsertSizeMetrics")
+                parsed.add_data_source(f, s_name, section="InsertSizeMetrics")
                 samplestats_by_sample[s_name] = {"total_count": 0, "meansum": 0, "total_pairs": 0}
                 orientation_idx = keys.index("PAIR_ORIENTATION")
 
@@ -116,7 +117,19 @@ def parse_reports(module):
                 break
 
     # Filter to strip out ignored sample names
-    data_by_sample = module.ignore_samples(data_by_sample)
+    return {
+        "data_by_sample": module.ignore_samples(data_by_sample),
+        "histogram_by_sample": histogram_by_sample,
+        "samplestats_by_sample": samplestats_by_sample,
+    }
+
+
+def add_sections(module, data: Dict):
+    """Add the report sections for Picard InsertSizeMetrics"""
+
+    data_by_sample = data["data_by_sample"]
+    histogram_by_sample = data["histogram_by_sample"]
+    samplestats_by_sample = data["samplestats_by_sample"]
     if len(data_by_sample) == 0:
         return set()
 
@@ -7,6 +7,7 @@ import math
 from collections import defaultdict
 
 from multiqc import config
+from multiqc.base_module import ParsedData
 from multiqc.modules.picard import util
 from multiqc.plots import bargraph
 
@@ -16,8 +17,10 @@ log = logging.getLogger(__name__)
 
 def parse_reports(
     module,
+    files,
+    parsed: ParsedData,
     sp_key="picard/markdups",
-):
+) -> Dict:
     """
     Find Picard MarkDuplicates reports and parse their data.
     Note that this function is also used by the biobambam2 module, that's why
@@ -59,7 +62,7 @@ def parse_reports(
         if s_name in data_by_sample:
             log.debug(f"Duplicate sample name found in {f['fn']}! Overwriting: {s_name}")
         data_by_sample[s_name] = parsed_data
-        module.add_data_source(f, s_name, section="DuplicationMetrics")
+        parsed.add_data_source(f, s_name, section="DuplicationMetrics")
 
         # End of metrics table - reset for next sample
         if len(vals) < 6:
@@ -70,7 +73,7 @@ def parse_reports(
             return False
 
     # Go through logs and find Metrics
-    for f in module.find_log_files(sp_key, filehandles=True):
+    for f in module.find_log_files(sp_key, filehandles=True, files=files):
         s_name = f["s_name"]
         parsed_lists: Dict[str, List] = defaultdict(list)
         keys = None
@@ -141,7 +144,12 @@ def parse_reports(
             save_table_results(s_name, keys, parsed_data, recompute_merged_metrics)
 
     # Filter to strip out ignored sample names
-    data_by_sample = module.ignore_samples(data_by_sample)
+    return module.ignore_samples(data_by_sample)
+
+
+def add_sections(module, data_by_sample: Dict):
+    """Add the report sections for Picard MarkDuplicates, also used by the biobambam2 module"""
+
     if len(data_by_sample) == 0:
         return set()
 
@@ -1,7 +1,9 @@
 """MultiQC submodule to parse output from Picard MarkIlluminaAdapters"""
 
 import logging
+from typing import Dict
 
+from multiqc.base_module import ParsedData
 from multiqc.plots import linegraph
 
 from .util import read_histogram
@@ -10,13 +12,15 @@ from .util import read_histogram
 log = logging.getLogger(__name__)
 
 
-def parse_reports(self):
+def parse_reports(self, files, parsed: ParsedData) -> Dict:
     """Find Picard MarkIlluminaAdapters reports and parse their data"""
 
     headers = ["clipped_bases", "read_count"]
     formats = [int, int]
     data_by_sample = read_histogram(
         self,
+        files,
+        parsed,
         program_key="picard/markilluminaadapters",
         headers=headers,
         formats=formats,
@@ -24,7 +28,15 @@ def parse_reports(self):
     )
 
     # Filter to strip out ignored sample names
-    data_by_sample = self.ignore_samples(data_by_sample)
+    return self.ignore_samples(data_by_sample)
+
+
+def add_sections(self, data_by_sample: Dict):
+    """Add the report sections for Picard MarkIlluminaAdapters"""
+
+    # Write histogram data to file
+    self.write_data_file(data_by_sample, f"{self.anchor}_histogram")
+
     if not data_by_sample:
         return set()
 
@@ -4,20 +4,21 @@ import logging
 from collections import defaultdict
 from typing import Dict
 
+from multiqc.base_module import ParsedData
 from multiqc.modules.picard import util
 
 # Initialise the logger
 log = logging.getLogger(__name__)
 
 
-def parse_reports(module):
+def parse_reports(module, files, parsed: ParsedData) -> Dict:
     """Find Picard OxoGMetrics reports and parse their data"""
 
     # Set up vars
     data_by_sample: Dict = dict()
 
     # Go through logs and find Metrics
-    for f in module.find_log_files("picard/oxogmetrics", filehandles=True):
+    for f in module.find_log_files("picard/oxogmetrics", filehandles=True, files=files):
         # Sample name from input file name by default.
         s_name = f["s_name"]
         keys = None
@@ -45,7 +46,7 @@ def parse_reports(module):
                 if s_name in data_by_sample:
                     log.debug(f"Duplicate sample name found in {f['fn']}! Overwriting: " f"{s_name}")
                 data_by_sample[s_name] = defaultdict()
-                module.add_data_source(f, s_name, section="OxoGMetrics")
+                parsed.add_data_source(f, s_name, section="OxoGMetrics")
 
             elif keys:
                 vals = line.strip("\n").split("\t")
@@ -65,7 +66,13 @@ def parse_reports(module):
                         val = vals[i].strip()
                     data_by_sample[s_name][context][k] = val
 
-    data_by_sample = module.ignore_samples(data_by_sample)
+    # Filter to strip out ignored sample names
+    return module.ignore_samples(data_by_sample)
+
+
+def add_sections(module, data_by_sample: Dict):
+    """Add the report sections for Picard OxoGMetrics"""
+
     if len(data_by_sample) == 0:
         return set()
 
@@ -1,7 +1,9 @@
 """MultiQC submodule to parse output from Picard MeanQualityByCycle"""
 
 import logging
+from typing import Dict
 
+from multiqc.base_module import ParsedData
 from multiqc.plots import linegraph
 
 from .util import read_histogram
@@ -10,13 +12,15 @@ from .util import read_histogram
 log = logging.getLogger(__name__)
 
 
-def parse_reports(self):
+def parse_reports(self, files, parsed: ParsedData) -> Dict:
     """Find Picard QualityByCycleMetrics reports and parse their data"""
 
     headers = ["CYCLE", "MEAN_QUALITY"]
     formats = [int, float]
-    all_data = read_histogram(
+    return read_histogram(
         self,
+        files,
+        parsed,
         "picard/quality_by_cycle",
         headers,
         formats,
@@ -24,6 +28,13 @@ def parse_reports(self):
         sentieon_algo="MeanQualityByCycle",
     )
 
+
+def add_sections(self, all_data: Dict):
+    """Add the report sections for Picard QualityByCycleMetrics"""
+
+    # Write histogram data to file
+    self.write_data_file(all_data, f"{self.anchor}_histogram")
+
     if not all_data:
         return set()
 
@@ -1,8 +1,10 @@
 """MultiQC submodule to parse output from Picard QualityScoreDistribution"""
 
 import logging
+from typing import Dict
 from collections import OrderedDict
 
+from multiqc.base_module import ParsedData
 from multiqc.plots import linegraph
 
 from .util import read_histogram
@@ -11,13 +13,15 @@ from .util import read_histogram
 log = logging.getLogger(__name__)
 
 
-def parse_reports(self):
+def parse_reports(self, files, parsed: ParsedData) -> Dict:
     """Find Picard QualityScoreDistribution reports and parse their data"""
 
     headers = ["QUALITY", "COUNT_OF_Q"]
     formats = [int, int]
-    all_data = read_histogram(
+    return read_histogram(
         self,
+        files,
+        parsed,
         "picard/quality_score_distribution",
         headers,
         formats,
@@ -25,6 +29,13 @@ def parse_reports(self):
         sentieon_algo="QualDistribution",
     )
 
+
+def add_sections(self, all_data: Dict):
+    """Add the report sections for Picard QualityScoreDistributionMetrics"""
+
+    # Write histogram data to file
+    self.write_data_file(all_data, f"{self.anchor}_histogram")
+
     if not all_data:
         return set()
 
@@ -1,9 +1,11 @@
 """MultiQC submodule to parse output from Picard QualityYieldMetrics"""
 
 import logging
+from typing import Dict
 from collections import OrderedDict
 
 from multiqc import config
+from multiqc.base_module import ParsedData
 from multiqc.modules.picard import util
 
 # Initialise the logger
@@ -26,7 +28,7 @@ DESC = OrderedDict(
 )
 
 
-def parse_reports(module):
+def parse_reports(module, files, parsed: ParsedData) -> Dict:
     """Find Picard QualityYieldMetrics reports and parse their data"""
 
     # Set up vars
@@ -34,7 +36,7 @@ def parse_reports(module):
     expected_header = list(DESC.keys())
 
     # Go through logs and find Metrics
-    for f in module.find_log_files("picard/quality_yield_metrics", filehandles=True):
+    for f in module.find_log_files("picard/quality_yield_metrics", filehandles=True, files=files):
         # Sample name from input file name by default.
         s_name = f["s_name"]
 
@@ -58,7 +60,7 @@ def parse_reports(module):
 
                 if s_name in data_by_sample:
                     log.debug(f"Duplicate sample name found in {f['fn']}! Overwriting: {s_name}")
-                module.add_data_source(f, s_name, section="QualityYieldMetrics")
+                parsed.add_data_source(f, s_name, section="QualityYieldMetrics")
 
                 vals = []
                 for v in f["f"].readline().strip("\n").split("\t"):
@@ -70,7 +72,13 @@ def parse_reports(module):
                 data_by_sample[s_name] = dict(zip(keys, vals))
                 s_name = None
 
-    data_by_sample = module.ignore_samples(data_by_sample)
+    # Filter to strip out ignored sample names
+    return module.ignore_samples(data_by_sample)
+
+
+def add_sections(module, data_by_sample: Dict):
+    """Add the report sections for Picard QualityYieldMetrics"""
+
     if not data_by_sample:
         return set()
 
@@ -3,6 +3,7 @@
 import logging
 from typing import Dict
 
+from multiqc.base_module import ParsedData
 from multiqc.modules.picard import util
 from multiqc.plots import bargraph, linegraph
 
@@ -10,14 +11,14 @@ from multiqc.plots import bargraph, linegraph
 log = logging.getLogger(__name__)
 
 
-def parse_reports(module):
+def parse_reports(module, files, parsed: ParsedData) -> Dict:
     """Find Picard RnaSeqMetrics reports and parse their data"""
 
     data_by_sample: Dict = dict()
     histogram_by_sample: Dict = dict()
 
     # Go through logs and find Metrics
-    for f in module.find_log_files("picard/rnaseqmetrics", filehandles=True):
+    for f in module.find_log_files("picard/rnaseqmetrics", filehandles=True, files=files):
         # Sample name from input file name by default.
         s_name = f["s_name"]
         in_hist = False
@@ -56,7 +57,7 @@ def parse_reports(module):
                 if s_name in data_by_sample:
                     log.debug(f"Duplicate sample name found in {f['fn']}! Overwriting: {s_name}")
 
-                module.add_data_source(f, s_name, section="RnaSeqMetrics")
+                parsed.add_data_source(f, s_name, section="RnaSeqMetrics")
                 data_by_sample[s_name] = dict()
                 histogram_by_sample[s_name] = dict()
 
@@ -86,8 +87,17 @@ def parse_reports(module):
                 histogram_by_sample[s_name] = dict()
 
     # Filter to strip out ignored sample names
-    data_by_sample = module.ignore_samples(data_by_sample)
-    histogram_by_sample = module.ignore_samples(histogram_by_sample)
+    return {
+        "data_by_sample": module.ignore_samples(data_by_sample),
+        "histogram_by_sample": module.ignore_samples(histogram_by_sample),
+    }
+
+
+def add_sections(module, data: Dict):
+    """Add the report sections for Picard RnaSeqMetrics"""
+
+    data_by_sample = data["data_by_sample"]
+    histogram_by_sample = data["histogram_by_sample"]
     if len(data_by_sample) == 0:
         return set()
 
@@ -4,6 +4,7 @@ import logging
 from collections import OrderedDict
 from typing import Dict
 
+from multiqc.base_module import ParsedData
 from multiqc.modules.picard import util
 from multiqc.plots import bargraph
 
@@ -11,13 +12,13 @@ from multiqc.plots import bargraph
 log = logging.getLogger(__name__)
 
 
-def parse_reports(module):
+def parse_reports(module, files, parsed: ParsedData) -> Dict:
     """Find Picard RrbsSummaryMetrics reports and parse their data"""
 
     data_by_sample: Dict = dict()
 
     # Go through logs and find Metrics
-    for f in module.find_log_files("picard/rrbs_metrics", filehandles=True):
+    for f in module.find_log_files("picard/rrbs_metrics", filehandles=True, files=files):
         s_name = None
         for line in f["f"]:
             maybe_s_name = util.extract_sample_name(
@@ -36,7 +37,7 @@ def parse_reports(module):
             if util.is_line_right_before_table(line, picard_class="RrbsSummaryMetrics"):
                 if s_name in data_by_sample:
                     log.debug(f"Duplicate sample name found in {f['fn']}! Overwriting: {s_name}")
-                module.add_data_source(f, s_name, section="RnaSeqMetrics")
+                parsed.add_data_source(f, s_name, section="RnaSeqMetrics")
                 data_by_sample[s_name] = dict()
 
                 keys = f["f"].readline().strip("\n").split("\t")
@@ -55,7 +56,12 @@ def parse_reports(module):
                     data_by_sample[s_name][k] = v
 
     # Filter to strip out ignored sample names
-    data_by_sample = module.ignore_samples(data_by_sample)
+    return module.ignore_samples(data_by_sample)
+
+
+def add_sections(module, data_by_sample: Dict):
+    """Add the report sections for Picard RrbsSummaryMetrics"""
+
     if len(data_by_sample) == 0:
         return set()
 
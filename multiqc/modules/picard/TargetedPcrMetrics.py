@@ -3,6 +3,7 @@
 import logging
 from typing import Dict
 
+from multiqc.base_module import ParsedData
 from multiqc.modules.picard import util
 from multiqc.plots import bargraph
 from multiqc import config
@@ -11,7 +12,7 @@ from multiqc import config
 log = logging.getLogger(__name__)
 
 
-def parse_reports(module):
+def parse_reports(module, files, parsed: ParsedData) -> Dict:
     """Find Picard TargetedPcrMetrics reports and parse their data"""
 
     data_by_sample: Dict = dict()
@@ -21,7 +22,7 @@ def parse_reports(module):
     skip_histo = picard_config.get("targeted_pcr_skip_histogram", False)
 
     # Go through logs and find Metrics
-    for f in module.find_log_files("picard/pcr_metrics", filehandles=True):
+    for f in module.find_log_files("picard/pcr_metrics", filehandles=True, files=files):
         # Sample name from input file name by default.
         s_name = f["s_name"]
         in_hist = False
@@ -60,7 +61,7 @@ def parse_reports(module):
                 if s_name in data_by_sample:
                     log.debug(f"Duplicate sample name found in {f['fn']}! Overwriting: {s_name}")
 
-                module.add_data_source(f, s_name, section="TargetedPcrMetrics")
+                parsed.add_data_source(f, s_name, section="TargetedPcrMetrics")
                 data_by_sample[s_name] = dict()
                 histogram_by_sample[s_name] = dict()
 
@@ -80,8 +81,12 @@ def parse_reports(module):
                 histogram_by_sample[s_name] = dict()
 
     # Filter to strip out ignored sample names
-    data_by_sample = module.ignore_samples(data_by_sample)
-    histogram_by_sample = module.ignore_samples(histogram_by_sample)
+    return module.ignore_samples(data_by_sample)
+
+
+def add_sections(module, data_by_sample: Dict):
+    """Add the report sections for Picard TargetedPcrMetrics"""
+
     if len(data_by_sample) == 0:
         return set()
 
@@ -1,8 +1,9 @@
 """MultiQC submodule to parse output from Picard ValidateSamFile"""
 
 import logging
-from typing import List, Tuple, Union
+from typing import Dict, List, Tuple, Union
 
+from multiqc.base_module import ParsedData
 from multiqc.plots import table
 from multiqc.plots.plotly.plot import Plot
 
@@ -85,19 +86,26 @@ def _default_data_entry():
     return {"WARNING_count": 0, "ERROR_count": 0, "file_validation_status": "pass"}
 
 
-def parse_reports(module):
+def parse_reports(module, files, parsed: ParsedData) -> Dict:
     """
     Find Picard ValidateSamFile reports and parse their data based on wether we
     think it's a VERBOSE or SUMMARY report
     """
 
     # Get data
-    data = _parse_reports_by_type(module)
+    data = _parse_reports_by_type(module, files, parsed)
 
     if data:
         #  Filter to strip out ignored sample names (REQUIRED)
         data = module.ignore_samples(data)
 
+    return data
+
+
+def add_sections(module, data: Dict):
+    """Add the general stats columns and the report sections for Picard ValidateSamFile"""
+
+    if data:
         # Populate the general stats table
         module.general_stats_addcols(data, _get_general_stats_headers(), namespace="ValidateSamFile")
 
@@ -110,7 +118,7 @@ def parse_reports(module):
     return data.keys()
 
 
-def _parse_reports_by_type(module):
+def _parse_reports_by_type(module, files, parsed: ParsedData):
     """Returns a data dictionary
 
     Goes through logs and parses them based on 'No errors found', VERBOSE or SUMMARY
@@ -119,8 +127,8 @@ def _parse_reports_by_type(module):
 
     data_by_sample = dict()
 
-    for f in module.find_log_files("picard/sam_file_validation", filehandles=True):
-        module.add_data_source(f, "ValidateSamFile")
+    for f in module.find_log_files("picard/sam_file_validation", filehandles=True, files=files):
+        parsed.add_data_source(f, "ValidateSamFile")
 
         s_name = f["s_name"]
 
@@ -142,7 +150,7 @@ def _parse_reports_by_type(module):
 
         # Superfluous function call to confirm that it is used in this module
         # Replace None with actual version if it is available
-        module.add_software_version(None, s_name)
+        parsed.add_software_version(None, s_name)
 
     return data_by_sample
 
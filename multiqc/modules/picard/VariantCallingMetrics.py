@@ -3,20 +3,26 @@
 import logging
 from typing import Dict
 
+from multiqc.base_module import ParsedData
 from multiqc.plots import bargraph
 
 # Initialise the logger
 log = logging.getLogger(__name__)
 
 
-def parse_reports(module):
+def parse_reports(module, files, parsed: ParsedData) -> Dict:
     """Find Picard VariantCallingMetrics reports and process their data"""
 
     # get data
-    data_by_sample = collect_data(module)
+    data_by_sample = collect_data(module, files)
 
     # Filter to strip out ignored sample names
-    data_by_sample = module.ignore_samples(data_by_sample)
+    return module.ignore_samples(data_by_sample)
+
+
+def add_sections(module, data_by_sample: Dict):
+    """Add the general stats columns and the report sections for Picard VariantCallingMetrics"""
+
     if len(data_by_sample) == 0:
         return set()
 
@@ -107,11 +113,11 @@ def parse_reports(module):
     return data_by_sample.keys()
 
 
-def collect_data(module):
+def collect_data(module, files):
     """Find Picard VariantCallingMetrics reports and parse their data"""
 
     data: Dict = dict()
-    for f in module.find_log_files("picard/variant_calling_metrics", filehandles=True):
+    for f in module.find_log_files("picard/variant_calling_metrics", filehandles=True, files=files):
         s_name = None
         for header, value in table_in(f["f"], pre_header_string="## METRICS CLASS"):
             if header == "SAMPLE_ALIAS":
@@ -4,6 +4,7 @@ import logging
 from typing import Dict
 
 from multiqc import config
+from multiqc.base_module import ParsedData
 from multiqc.modules.picard import util
 from multiqc.plots import bargraph, linegraph
 
@@ -11,7 +12,7 @@ from multiqc.plots import bargraph, linegraph
 log = logging.getLogger(__name__)
 
 
-def parse_reports(module):
+def parse_reports(module, files, parsed: ParsedData) -> Dict:
     """Find Picard WgsMetrics reports and parse their data"""
 
     # Set up vars
@@ -22,7 +23,7 @@ def parse_reports(module):
     skip_histo = picard_config.get("wgsmetrics_skip_histogram", False)
 
     # Go through logs and find Metrics
-    for f in module.find_log_files("picard/wgs_metrics", filehandles=True):
+    for f in module.find_log_files("picard/wgs_metrics", filehandles=True, files=files):
         # Sample name from input file name by default
         s_name = f["s_name"]
         in_hist = False
@@ -61,7 +62,7 @@ def parse_reports(module):
                 if s_name in data_by_sample:
                     log.debug(f"Duplicate sample name found in {f['fn']}! Overwriting: {s_name}")
 
-                module.add_data_source(f, s_name, section="WgsMetrics")
+                parsed.add_data_source(f, s_name, section="WgsMetrics")
                 data_by_sample[s_name] = dict()
 
                 for k, v in zip(keys, vals):
@@ -78,7 +79,17 @@ def parse_reports(module):
                 histogram_by_sample[s_name] = dict()
 
     # Filter to strip out ignored sample names
-    data_by_sample = module.ignore_samples(data_by_sample)
+    return {
+        "data_by_sample": module.ignore_samples(data_by_sample),
+        "histogram_by_sample": histogram_by_sample,
+    }
+
+
+def add_sections(module, data: Dict):
+    """Add the report sections for Picard WgsMetrics"""
+
+    data_by_sample = data["data_by_sample"]
+    histogram_by_sample = data["histogram_by_sample"]
     if len(data_by_sample) == 0:
         return set()
 
@@ -116,6 +127,7 @@ def parse_reports(module):
     }
     # user configurable coverage level
     picard_config = getattr(config, "picard_config", {})
+    skip_histo = picard_config.get("wgsmetrics_skip_histogram", False)
     covs = picard_config.get("general_stats_target_coverage", [])
     if isinstance(covs, list) and len(covs) > 0:
         covs = [str(i) for i in covs]
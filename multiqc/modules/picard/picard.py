@@ -1,6 +1,8 @@
 import logging
+from typing import List, Mapping
 
-from multiqc.base_module import BaseMultiqcModule, ModuleNoSamplesFound
+from multiqc.base_module import BaseMultiqcModule, ModuleNoSamplesFound, ParsedData
+from multiqc.types import FileDict, ModuleId
 
 # Import the Picard submodules, each one matching a picard tool
 from . import (
@@ -292,18 +294,31 @@ class MultiqcModule(BaseMultiqcModule):
         )
 
         # Set up class objects to hold parsed data
+        self.tools = tools
         self.general_stats_headers = dict()
         self.general_stats_data = dict()
         self.samples_parsed_by_tool = dict()
 
-        for tool in tools:
+        self.parse_and_build_sections()
+
+    def parse(self, files: Mapping[ModuleId, List[FileDict]]) -> ParsedData:
+        parsed = ParsedData()
+
+        for tool in self.tools:
             log.debug(f"Running picard tool {tool}")
-            mod = globals()[tool]
-            func = getattr(mod, "parse_reports", None)
-            if func is not None:
-                self.samples_parsed_by_tool[tool] = func(self)
-                if len(self.samples_parsed_by_tool[tool]) > 0:
-                    log.info(f"Found {len(self.samples_parsed_by_tool[tool])} {tool} reports")
+            parsed.data[tool] = globals()[tool].parse_reports(self, files, parsed)
+
+        # Exit early if we didn't find anything. Tools that parse several datasets are
+        # only known to be empty once their sections are built
+        if all(len(data) == 0 for data in parsed.data.values()):
+            raise ModuleNoSamplesFound
+        return parsed
+
+    def build_sections(self, parsed: ParsedData) -> None:
+        for tool in self.tools:
+            self.samples_parsed_by_tool[tool] = globals()[tool].add_sections(self, parsed.data[tool])
+            if len(self.samples_parsed_by_tool[tool]) > 0:
+                log.info(f"Found {len(self.samples_parsed_by_tool[tool])} {tool} reports")
 
         # Exit if we didn't find anything
         if all(len(v) == 0 for v in self.samples_parsed_by_tool.values()):
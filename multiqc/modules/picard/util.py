@@ -9,12 +9,14 @@ from multiqc import config
 log = logging.getLogger(__name__)
 
 
-def read_histogram(module, program_key, headers, formats, picard_tool, sentieon_algo=None):
+def read_histogram(module, files, parsed, program_key, headers, formats, picard_tool, sentieon_algo=None):
     """
     Reads a Picard HISTOGRAM file.
 
     Args:
         module: the Picard QC module
+        files: the found files to pick the log files from
+        parsed: the parsed data of the module, to record the data sources in
         program_key: the key used to find the program (ex. picard/quality_by_cycle)
         headers: the list of expected headers for the histogram
         formats: the list of methods to apply to re-format each field (on a given row)
@@ -26,7 +28,7 @@ def read_histogram(module, program_key, headers, formats, picard_tool, sentieon_
     sample_data: Optional[Dict] = None
 
     # Go through logs and find Metrics
-    for f in module.find_log_files(program_key, filehandles=True):
+    for f in module.find_log_files(program_key, filehandles=True, files=files):
         s_name = f["s_name"]
         for line in f["f"]:
             maybe_s_name = extract_sample_name(
@@ -62,17 +64,12 @@ def read_histogram(module, program_key, headers, formats, picard_tool, sentieon_
                 log.debug(f"Duplicate sample name found in {f['fn']}! Overwriting: {s_name}")
             all_data[s_name] = sample_data
 
-            module.add_data_source(f, s_name, section="Histogram")
+            parsed.add_data_source(f, s_name, section="Histogram")
             # Superfluous function call to confirm that it is used in this module
             # Replace None with actual version if it is available
-            module.add_software_version(None, s_name)
+            parsed.add_software_version(None, s_name)
 
-    data = module.ignore_samples(all_data)
-
-    # Write data to file
-    module.write_data_file(data, f"{module.anchor}_histogram")
-
-    return data
+    return module.ignore_samples(all_data)
 
 
 def is_line_right_before_table(
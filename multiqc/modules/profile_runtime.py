@@ -2,11 +2,13 @@
 Super Special-Case MultiQC module to produce report section on MultiQC performance
 """
 
+import dataclasses
 import logging
 from typing import Dict, Union
 
 from multiqc import config, report
 from multiqc.base_module import BaseMultiqcModule
+from multiqc.core import memory_usage
 from multiqc.plots import bargraph, table
 from multiqc.plots.plotly.bar import BarPlotConfig
 from multiqc.plots.table_object import TableConfig
@@ -24,7 +26,7 @@ class MultiqcModule(BaseMultiqcModule):
             and fastest configuration possible. For more information, see the
             <a href="https://multiqc.info/docs/#optimising-run-time" target="_blank">MultiQC documentation</a>"""
         super(MultiqcModule, self).__init__(
-            name="Run time " + ("and memory " if config.profile_memory else "") + "profiling",
+            name="Run time " + ("and memory " if config.profile_memory or config.profile_rss else "") + "profiling",
             anchor=Anchor("multiqc_runtime"),
             info=info,
         )
@@ -34,8 +36,13 @@ class MultiqcModule(BaseMultiqcModule):
             self.alert = (
                 "<div class='alert alert-info'>Note that memory profiling can slow down run times of each module</div>"
             )
-        else:
-            self.alert = "Note: to enable memory profiling, run MultiQC with <code>--profile-memory</code>. Note that it can skew the run time of each module."
+        elif not config.profile_rss:
+            self.alert = "Note: to enable memory profiling, run MultiQC with <code>--profile-memory</code>. Note that it can skew the run time of each module. Run with <code>--profile-rss</code> to only record the resident memory after each module, without slowing it down."
+        if config.profile_rss:
+            self.alert += (
+                " The resident memory (RSS) of the process is also saved for the report writing steps, "
+                "in the <code>multiqc_memory_usage</code> file in the data directory."
+            )
 
         log.info("Running profiling module")
         self.module_table()
@@ -43,6 +50,7 @@ class MultiqcModule(BaseMultiqcModule):
             self.module_memory_section()
         self.module_times_section()
         self.search_pattern_times_section()
+        self.search_pattern_stats_section()
         self.file_search_counts_section()
 
     def module_table(self):
@@ -63,6 +71,9 @@ class MultiqcModule(BaseMultiqcModule):
                         "mem_change": report.diff_memory_bytes_per_module[key] / 1024 / 1024,
                     }
                 )
+        for key, row in memory_usage.table_data(report.runtimes.memory_mods).items():
+            row.pop("rss_before", None)
+            table_data.setdefault(key, {}).update(row)
 
         self.add_section(
             name="Per module",
@@ -92,6 +103,41 @@ class MultiqcModule(BaseMultiqcModule):
                         "format": "{:.2f}",
                         "scale": "Blues",
                     },
+                    ColumnKey("rss_after"): {
+                        "title": "RSS",
+                        "description": "Resident memory of the process after running the module",
+                        "suffix": " MB",
+                        "format": "{:,.1f}",
+                        "scale": "Greys",
+                    },
+                    ColumnKey("rss_change"): {
+                        "title": "RSS change",
+                        "description": "Change in the resident memory of the process while running the module",
+                        "suffix": " MB",
+                        "format": "{:,.1f}",
+                        "scale": "Blues",
+                    },
+                    ColumnKey("peak_rss"): {
+                        "title": "Peak RSS",
+                        "description": "Highest resident memory of the process so far, after running the module",
+                        "suffix": " MB",
+                        "format": "{:,.1f}",
+                        "scale": "Greys",
+                    },
+                    ColumnKey("data_size"): {
+                        "title": "Data size",
+                        "description": "Size in memory of the raw data saved by the module for the data directory",
+                        "suffix": " MB",
+                        "format": "{:,.2f}",
+                        "scale": "Purples",
+                    },
+                    ColumnKey("plots_size"): {
+                        "title": "Plots size",
+                        "description": "Size in memory of the plots added by the module",
+                        "suffix": " MB",
+                        "format": "{:,.2f}",
+                        "scale": "Purples",
+                    },
                 },
                 pconfig=TableConfig(
                     id="per_module_benchmark_table",
@@ -126,8 +172,12 @@ class MultiqcModule(BaseMultiqcModule):
             anchor="multiqc_runtime_files_searched",
             description="""
                 Number of files searched by MultiQC, categorised by what happened to them.
-                **Total file searches: {}**.
-            """.format(sum(file_search_counts.values())),
+                **Total file searches: {}**. Walked {} directories with {} entries.
+            """.format(
+                sum(file_search_counts.values()),
+                report.file_walk_stats.get("dirs_visited", 0),
+                report.file_walk_stats.get("entries_visited", 0),
+            ),
             helptext="""
                 Note that only files are considered in this plot - skipped directories are not shown.
 
@@ -135,6 +185,7 @@ class MultiqcModule(BaseMultiqcModule):
                 that some files may be double-counted in this plot.
 
                 * `Skipped: No match` - File was searched, but didn't match any search patterns
+                * `Skipped: No filename match` - File name didn't match any search pattern, so the file wasn't opened
                 * `Skipped: Ignore pattern` - File matched a MultiQC ignore pattern (see `-x` / `--ignore` / `config.fn_ignore_paths`)
                 * `Skipped: Filesize limit` - File was skipped because it was too large (see `config.log_filesize_limit`)
                 * `Skipped: Symlinks` - File was a symlink and skipped (see `config.ignore_symlinks`)
@@ -195,6 +246,93 @@ class MultiqcModule(BaseMultiqcModule):
             plot=bargraph.plot(pdata, None, pconfig),
         )
 
+    def search_pattern_stats_section(self):
+        """Section with a table of the work done by the file search for each search pattern"""
+
+        if not report.runtimes.sp_stats:
+            return
+
+        table_data: Dict[str, Dict[str, Union[int, float]]] = {}
+        for key in sorted(report.runtimes.sp_stats, key=lambda k: report.runtimes.sp.get(k, 0), reverse=True):
+            stats = report.runtimes.sp_stats[key]
+            table_data[key] = {
+                "run_time": report.runtimes.sp.get(key, 0),
+                **dataclasses.asdict(stats),
+                "hit_rate": stats.matches / stats.files_tested * 100 if stats.files_tested else 0,
+            }
+        filesizes: Dict[str, Dict[str, Union[int, float]]] = {
+            label: {"files": report.runtimes.sp_filesizes.get(label, 0)} for _, label in report.FILESIZE_BUCKETS
+        }
+        self.write_data_file(table_data, "multiqc_search_pattern_stats")
+        self.write_data_file(filesizes, "multiqc_search_filesizes")
+
+        self.add_section(
+            name="Search patterns statistics",
+            anchor="multiqc_runtime_search_pattern_stats",
+            description="""
+                Work done by the file search for each search pattern key. Use it to tune the `num_lines`
+                and `max_filesize` of the search patterns.
+            """,
+            helptext="""
+                Only files with a name matching a search pattern are tested for it. A file is read once
+                and the line blocks read are cached, so reading is counted for the search pattern key
+                that needed it first, and other keys reading the same lines get the blocks from cache.
+
+                * `Tested` - Files with a name matching the search pattern, tested further
+                * `Opened` - Files opened to search their contents
+                * `Bytes read` / `Lines read` - Read from the files, after decompression for compressed files
+                * `Blocks from disk` / `Blocks from cache` - Line blocks read from the file, or from the cache
+                * `Matches` / `Hit rate` - Files found for the module, and their share of the tested files
+            """,
+            plot=table.plot(
+                table_data,
+                headers={
+                    ColumnKey("run_time"): {"title": "Run time", "suffix": "s", "format": "{:.2f}", "scale": "Oranges"},
+                    ColumnKey("files_tested"): {"title": "Tested", "format": "{:,.0f}", "scale": "Blues"},
+                    ColumnKey("files_opened"): {"title": "Opened", "format": "{:,.0f}", "scale": "Blues"},
+                    ColumnKey("bytes_read"): {
+                        "title": "Bytes read",
+                        "modify": lambda x: x / 1024 / 1024,
+                        "suffix": " MB",
+                        "format": "{:,.2f}",
+                        "scale": "Purples",
+                    },
+                    ColumnKey("lines_read"): {"title": "Lines read", "format": "{:,.0f}", "scale": "Purples"},
+                    ColumnKey("blocks_from_disk"): {"title": "Blocks from disk", "format": "{:,.0f}", "scale": "Greys"},
+                    ColumnKey("blocks_from_cache"): {
+                        "title": "Blocks from cache",
+                        "format": "{:,.0f}",
+                        "scale": "Greys",
+                    },
+                    ColumnKey("matches"): {"title": "Matches", "format": "{:,.0f}", "scale": "Greens"},
+                    ColumnKey("hit_rate"): {"title": "Hit rate", "suffix": "%", "max": 100, "scale": "RdYlGn"},
+                },
+                pconfig=TableConfig(
+                    id="multiqc_runtime_search_pattern_stats_table",
+                    title="MultiQC: Search pattern statistics",
+                    col1_header="Search pattern",
+                ),
+            ),
+        )
+
+        self.add_section(
+            name="Sizes of files read",
+            anchor="multiqc_runtime_search_filesizes",
+            description="Number of files opened by the file search to look through their contents, by file size.",
+            plot=bargraph.plot(
+                filesizes,
+                None,
+                BarPlotConfig(
+                    id="multiqc_runtime_search_filesizes_plot",
+                    title="MultiQC: Sizes of files read by the file search",
+                    ylab="Number of files",
+                    use_legend=False,
+                    cpswitch=False,
+                    sort_samples=False,
+                ),
+            ),
+        )
+
     def module_times_section(self):
         """Section with a bar plot showing the time spent on each search pattern"""
 
@@ -211,9 +349,16 @@ class MultiqcModule(BaseMultiqcModule):
             "suffix": "s",
         }
 
+        clean_s_name_stats = ""
+        if report.runtimes.clean_s_name_calls:
+            clean_s_name_stats = f"""
+            Sample names were cleaned {report.runtimes.clean_s_name_calls:,d} times,
+            {report.runtimes.clean_s_name_hits / report.runtimes.clean_s_name_calls:.0%} of which from the cache.
+            """
         description = f"""
             Time spent running each module.
             **Total modules run time: {report.runtimes.total_mods:.2f} seconds**.
+            {clean_s_name_stats}
             <br><br>{self.alert}
         """
 
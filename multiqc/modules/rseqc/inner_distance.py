@@ -17,13 +17,13 @@ def parse_reports(module: BaseMultiqcModule) -> int:
     inner_distance_pct: Dict = dict()
 
     # Go through files and parse data
-    for f in module.find_log_files("rseqc/inner_distance"):
+    for f in module.find_log_files("rseqc/inner_distance", lazy=True):
         if f["s_name"] in inner_distance:
             log.debug(f"Duplicate sample name found! Overwriting: {f['s_name']}")
         module.add_data_source(f, section="inner_distance")
         # saving to temporary variable for SE checking later
         parsed_data = dict()
-        for line in f["f"].splitlines():
+        for line in f["f"].lines():
             s = line.split()
             try:
                 avg_pos = (float(s[0]) + float(s[1])) / 2.0
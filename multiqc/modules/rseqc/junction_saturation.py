@@ -20,9 +20,9 @@ def parse_reports(module: BaseMultiqcModule):
     junction_saturation_novel: Dict = dict()
 
     # Go through files and parse data
-    for f in module.find_log_files("rseqc/junction_saturation"):
+    for f in module.find_log_files("rseqc/junction_saturation", lazy=True):
         parsed = dict()
-        for line in f["f"].splitlines():
+        for line in f["f"].lines():
             r = re.search(r"^([xyzw])=c\(([\d,]+)\)$", line)
             if r:
                 parsed[r.group(1)] = [float(i) for i in r.group(2).split(",")]
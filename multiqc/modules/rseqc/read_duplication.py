@@ -16,13 +16,13 @@ def parse_reports(module: BaseMultiqcModule) -> int:
     read_dups: Dict = dict()
 
     # Go through files and parse data
-    for f in module.find_log_files("rseqc/read_duplication_pos"):
-        if f["f"].startswith("Occurrence	UniqReadNumber"):
+    for f in module.find_log_files("rseqc/read_duplication_pos", lazy=True):
+        if next(f["f"].lines(), "").startswith("Occurrence	UniqReadNumber"):
             if f["s_name"] in read_dups:
                 log.debug(f"Duplicate sample name found! Overwriting: {f['s_name']}")
             module.add_data_source(f, section="read_duplication")
             read_dups[f["s_name"]] = dict()
-            for line in f["f"].splitlines():
+            for line in f["f"].lines():
                 s = line.split()
                 try:
                     if int(s[0]) <= 500:
@@ -18,11 +18,11 @@ def parse_reports(module: BaseMultiqcModule) -> int:
     read_gc_pct: Dict = dict()
 
     # Go through files and parse data
-    for f in module.find_log_files("rseqc/read_gc"):
-        if f["f"].startswith("GC%	read_count"):
+    for f in module.find_log_files("rseqc/read_gc", lazy=True):
+        if next(f["f"].lines(), "").startswith("GC%	read_count"):
             gc = list()
             counts = list()
-            for line in f["f"].splitlines():
+            for line in f["f"].lines():
                 s = line.split()
                 try:
                     gc.append(float(s[0]))
@@ -4,28 +4,30 @@ import logging
 from typing import Dict, Union
 
 from multiqc import BaseMultiqcModule, config
+from multiqc.base_module import ParsedData
 from multiqc.plots import linegraph, table
 from multiqc.plots.table_object import TableConfig
 
 log = logging.getLogger(__name__)
 
 
-def parse_samtools_coverage(module: BaseMultiqcModule):
+def parse_samtools_coverage(module: BaseMultiqcModule, files, parsed: ParsedData) -> Dict:
     """Find Samtools coverage logs and parse their data"""
 
     data_by_sample = dict()
-    for f in module.find_log_files("samtools/coverage"):
-        metrics_by_chrom = parse_single_report(f)
+    for f, metrics_by_chrom in module.parse_log_files("samtools/coverage", parse_single_report, files=files):
         if len(metrics_by_chrom) > 0:
             if f["s_name"] in data_by_sample:
                 log.debug(f"Duplicate sample name found! Overwriting: {f['s_name']}")
-            module.add_data_source(f, section="coverage")
+            parsed.add_data_source(f, section="coverage")
             data_by_sample[f["s_name"]] = metrics_by_chrom
 
     # Filter to strip out ignored sample names
-    data_by_sample = module.ignore_samples(data_by_sample)
-    if len(data_by_sample) == 0:
-        return 0
+    return module.ignore_samples(data_by_sample)
+
+
+def build_samtools_coverage_sections(module: BaseMultiqcModule, data_by_sample: Dict):
+    """Add the report sections for Samtools coverage"""
 
     # Superfluous function call to confirm that it is used in this module
     # Replace None with actual version if it is available
@@ -40,9 +42,6 @@ def parse_samtools_coverage(module: BaseMultiqcModule):
     # Make a line plot showing coverage stats per region, with a tab switch between stats
     lineplot_per_region(module, data_by_sample)
 
-    # Return the number of logs that were found
-    return len(data_by_sample)
-
 
 def summary_table(module, data_by_sample):
     table_data: Dict[str, Dict[str, float]] = {sname: {} for sname in data_by_sample}
@@ -3,29 +3,32 @@ import re
 from typing import Dict
 
 from multiqc import config, BaseMultiqcModule
+from multiqc.base_module import ParsedData
 from multiqc.plots import violin
 
 # Initialise the logger
 log = logging.getLogger(__name__)
 
 
-def parse_samtools_flagstat(module: BaseMultiqcModule):
+def parse_samtools_flagstat(module: BaseMultiqcModule, files, parsed: ParsedData) -> Dict:
     """Find Samtools flagstat logs and parse their data"""
 
     samtools_flagstat: Dict = dict()
-    for f in module.find_log_files("samtools/flagstat"):
-        parsed_data = parse_single_report(f["f"])
+    for f, parsed_data in module.parse_log_files(
+        "samtools/flagstat", lambda f: parse_single_report(f["f"]), files=files
+    ):
         if len(parsed_data) > 0:
             if f["s_name"] in samtools_flagstat:
                 log.debug(f"Duplicate sample name found! Overwriting: {f['s_name']}")
-            module.add_data_source(f, section="flagstat")
+            parsed.add_data_source(f, section="flagstat")
             samtools_flagstat[f["s_name"]] = parsed_data
 
     # Filter to strip out ignored sample names
-    samtools_flagstat = module.ignore_samples(samtools_flagstat)
+    return module.ignore_samples(samtools_flagstat)
 
-    if len(samtools_flagstat) == 0:
-        return 0
+
+def build_samtools_flagstat_sections(module: BaseMultiqcModule, samtools_flagstat: Dict):
+    """Add the general stats columns and the report section for Samtools flagstat"""
 
     # Superfluous function call to confirm that it is used in this module
     # Replace None with actual version if it is available
@@ -127,9 +130,6 @@ def parse_samtools_flagstat(module: BaseMultiqcModule):
         ),
     )
 
-    # Return the number of logs that were found
-    return len(samtools_flagstat)
-
 
 # flagstat has one thing per line, documented here (search for flagstat):
 # http://www.htslib.org/doc/samtools.html
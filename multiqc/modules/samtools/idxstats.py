@@ -2,7 +2,8 @@ import logging
 from collections import defaultdict
 from typing import Dict
 
-from multiqc import config
+from multiqc import BaseMultiqcModule, config
+from multiqc.base_module import ParsedData
 from multiqc.plots import bargraph, linegraph
 from multiqc.plots.plotly.bar import BarPlotConfig
 
@@ -10,26 +11,28 @@ from multiqc.plots.plotly.bar import BarPlotConfig
 log = logging.getLogger(__name__)
 
 
-def parse_samtools_idxstats(module):
+def parse_samtools_idxstats(module: BaseMultiqcModule, files, parsed: ParsedData) -> Dict:
     """Find Samtools idxstats logs and parse their data"""
 
-    module.samtools_idxstats = dict()
-    for f in module.find_log_files("samtools/idxstats"):
-        parsed_data = parse_single_report(f["f"])
+    samtools_idxstats: Dict = dict()
+    for f, parsed_data in module.parse_log_files(
+        "samtools/idxstats", lambda f: parse_single_report(f["f"]), files=files
+    ):
         if len(parsed_data) > 0:
-            if f["s_name"] in module.samtools_idxstats:
+            if f["s_name"] in samtools_idxstats:
                 log.debug(f"Duplicate sample name found! Overwriting: {f['s_name']}")
-            module.add_data_source(f, section="idxstats")
-            module.samtools_idxstats[f["s_name"]] = parsed_data
+            parsed.add_data_source(f, section="idxstats")
+            samtools_idxstats[f["s_name"]] = parsed_data
 
     # Filter to strip out ignored sample names
-    module.samtools_idxstats = module.ignore_samples(module.samtools_idxstats)
+    return module.ignore_samples(samtools_idxstats)
 
-    if len(module.samtools_idxstats) == 0:
-        return 0
+
+def build_samtools_idxstats_sections(module: BaseMultiqcModule, samtools_idxstats: Dict):
+    """Add the report sections for Samtools idxstats"""
 
     # Write parsed report data to a file (restructure first)
-    module.write_data_file(module.samtools_idxstats, "multiqc_samtools_idxstats")
+    module.write_data_file(samtools_idxstats, "multiqc_samtools_idxstats")
 
     # Superfluous function call to confirm that it is used in this module
     # Replace None with actual version if it is available
@@ -49,11 +52,11 @@ def parse_samtools_idxstats(module):
     cutoff = float(getattr(config, "samtools_idxstats_fraction_cutoff", 0.001))
     if cutoff != 0.001:
         log.info(f"Setting idxstats cutoff to: {cutoff * 100.0}%")
-    for s_name in module.samtools_idxstats:
-        for chrom in module.samtools_idxstats[s_name]:
-            chrs_mapped[chrom] += module.samtools_idxstats[s_name][chrom][0]
-            sample_mapped[s_name] += module.samtools_idxstats[s_name][chrom][0]
-            total_mapped += module.samtools_idxstats[s_name][chrom][0]
+    for s_name in samtools_idxstats:
+        for chrom in samtools_idxstats[s_name]:
+            chrs_mapped[chrom] += samtools_idxstats[s_name][chrom][0]
+            sample_mapped[s_name] += samtools_idxstats[s_name][chrom][0]
+            total_mapped += samtools_idxstats[s_name][chrom][0]
     req_reads = float(total_mapped) * cutoff
     chr_always = getattr(config, "samtools_idxstats_always", [])
     if len(chr_always) > 0:
@@ -69,15 +72,15 @@ def parse_samtools_idxstats(module):
         log.info(f'Using "{ychr}" as Y chromosome name')
     # Go through again and collect all the keys that have enough counts
     # Also get the X/Y counts if we find them
-    for s_name in module.samtools_idxstats:
+    for s_name in samtools_idxstats:
         x_count = False
         y_count = False
-        for chrom in module.samtools_idxstats[s_name]:
+        for chrom in samtools_idxstats[s_name]:
             if float(chrs_mapped[chrom]) > req_reads or chrom in chr_always:
                 if chrom not in chr_ignore and chrom not in keys:
                     keys.append(chrom)
             # Collect X and Y counts if we have them
-            mapped = module.samtools_idxstats[s_name][chrom][0]
+            mapped = samtools_idxstats[s_name][chrom][0]
             if xchr:
                 if str(xchr) == str(chrom):
                     x_count = mapped
@@ -95,16 +98,16 @@ def parse_samtools_idxstats(module):
             xy_counts[s_name] = {"x": x_count, "y": y_count}
     # Ok, one last time. We have the chromosomes that we want to plot,
     # now collect the counts
-    for s_name in module.samtools_idxstats:
+    for s_name in samtools_idxstats:
         pdata[s_name] = dict()
         pdata_norm[s_name] = dict()
         pdata_obs_exp[s_name] = dict()
-        genome_size = float(sum([stats[1] for stats in module.samtools_idxstats[s_name].values()]))
+        genome_size = float(sum([stats[1] for stats in samtools_idxstats[s_name].values()]))
         for k in keys:
             try:
-                pdata[s_name][k] = module.samtools_idxstats[s_name][k][0]
-                pdata_norm[s_name][k] = float(module.samtools_idxstats[s_name][k][0]) / sample_mapped[s_name]
-                chrom_size = float(module.samtools_idxstats[s_name][k][1])
+                pdata[s_name][k] = samtools_idxstats[s_name][k][0]
+                pdata_norm[s_name][k] = float(samtools_idxstats[s_name][k][0]) / sample_mapped[s_name]
+                chrom_size = float(samtools_idxstats[s_name][k][1])
                 expected_count = (chrom_size / genome_size) * float(sample_mapped[s_name])
                 pdata_obs_exp[s_name][k] = float(pdata[s_name][k]) / expected_count
             except (KeyError, ZeroDivisionError):
@@ -158,9 +161,6 @@ def parse_samtools_idxstats(module):
         plot=linegraph.plot([pdata_norm, pdata_obs_exp, pdata], pconfig),
     )
 
-    # Return the number of logs that were found
-    return len(module.samtools_idxstats)
-
 
 def parse_single_report(f):
     """Parse a samtools idxstats idxstats"""
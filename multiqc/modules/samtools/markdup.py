@@ -5,23 +5,26 @@ import re
 from typing import Dict
 from typing import Union
 
+from multiqc import BaseMultiqcModule
+from multiqc.base_module import ParsedData
 from multiqc.plots import bargraph
 from multiqc.plots import table
 
 log = logging.getLogger(__name__)
 
 
-def parse_samtools_markdup(module) -> int:
+def parse_samtools_markdup(module: BaseMultiqcModule, files, parsed: ParsedData) -> Dict:
+    """Find Samtools markdup logs and parse their data"""
     raw_by_sample: Dict = dict()
 
-    for f in module.find_log_files("samtools/markdup_json", filehandles=True):
+    for f in module.find_log_files("samtools/markdup_json", filehandles=True, files=files):
         raw_d = json.load(f["f"])
         if f["s_name"] in raw_by_sample:
             log.debug(f"Duplicate sample name found in {f['fn']}! Overwriting: {f['s_name']}")
-        module.add_data_source(f, section="markdup")
+        parsed.add_data_source(f, section="markdup")
         raw_by_sample[f["s_name"]] = raw_d
 
-    for f in module.find_log_files("samtools/markdup_txt"):
+    for f in module.find_log_files("samtools/markdup_txt", files=files):
         raw_d = dict()
         for line in f["f"].splitlines():
             if ":" in line:
@@ -33,15 +36,10 @@ def parse_samtools_markdup(module) -> int:
                 raw_d[key.strip()] = value
         if f["s_name"] in raw_by_sample:
             log.debug(f"Duplicate sample name found in {f['fn']}! Overwriting: {f['s_name']}")
-        module.add_data_source(f, section="markdup")
+        parsed.add_data_source(f, section="markdup")
         raw_by_sample[f["s_name"]] = raw_d
 
     raw_by_sample = module.ignore_samples(raw_by_sample)
-    if len(raw_by_sample) == 0:
-        return 0
-
-    # Superfluous function call to confirm that it is used in this module
-    module.add_software_version(None)
 
     val_by_metric_by_sample: Dict[str, Dict[str, Union[int, float]]] = {}
     for s_name, raw_d in raw_by_sample.items():
@@ -85,6 +83,15 @@ def parse_samtools_markdup(module) -> int:
         d["duplicate_non_primary_non_optical"] = d["duplicate_non_primary"] - d["duplicate_non_primary_optical"]
         d["non_duplicate"] = d["paired"] + d["single"] - d["duplicate_total"]
 
+    return val_by_metric_by_sample
+
+
+def build_samtools_markdup_sections(module: BaseMultiqcModule, val_by_metric_by_sample: Dict):
+    """Add the general stats columns and the report sections for Samtools markdup"""
+
+    # Superfluous function call to confirm that it is used in this module
+    module.add_software_version(None)
+
     module.write_data_file(val_by_metric_by_sample, fn="multiqc_samtools_markdup")
 
     genstats_headers = {
@@ -183,5 +190,3 @@ def parse_samtools_markdup(module) -> int:
         ),
         plot=bargraph.plot(data=val_by_metric_by_sample, cats=keys, pconfig=pconfig),
     )
-
-    return len(val_by_metric_by_sample)
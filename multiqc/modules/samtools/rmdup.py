@@ -3,17 +3,18 @@ import re
 from typing import Dict
 
 from multiqc import BaseMultiqcModule
+from multiqc.base_module import ParsedData
 from multiqc.plots import bargraph
 
 # Initialise the logger
 log = logging.getLogger(__name__)
 
 
-def parse_samtools_rmdup(module: BaseMultiqcModule):
+def parse_samtools_rmdup(module: BaseMultiqcModule, files, parsed: ParsedData) -> Dict:
     """Find Samtools rmdup logs and parse their data"""
 
     samtools_rmdup: Dict = dict()
-    for f in module.find_log_files("samtools/rmdup", filehandles=True):
+    for f in module.find_log_files("samtools/rmdup", filehandles=True, files=files):
         # Example below:
         # [bam_rmdupse_core] 26602816 / 103563641 = 0.2569 in library '   '
         dups_regex = r"\[bam_rmdups?e?_core\] (\d+) / (\d+) = (\d+\.\d+) in library '(.*)'"
@@ -26,7 +27,7 @@ def parse_samtools_rmdup(module: BaseMultiqcModule):
                     s_name = library_name
                 if s_name in samtools_rmdup:
                     log.debug(f"Duplicate sample name found in {f['fn']}! Overwriting: {s_name}")
-                module.add_data_source(f, s_name)
+                parsed.add_data_source(f, s_name)
                 samtools_rmdup[s_name] = {}
                 samtools_rmdup[s_name]["n_dups"] = int(match.group(1))
                 samtools_rmdup[s_name]["n_tot"] = int(match.group(2))
@@ -34,10 +35,11 @@ def parse_samtools_rmdup(module: BaseMultiqcModule):
                 samtools_rmdup[s_name]["pct_dups"] = float(match.group(3)) * 100
 
     # Filter to strip out ignored sample names
-    samtools_rmdup = module.ignore_samples(samtools_rmdup)
+    return module.ignore_samples(samtools_rmdup)
 
-    if len(samtools_rmdup) == 0:
-        return 0
+
+def build_samtools_rmdup_sections(module: BaseMultiqcModule, samtools_rmdup: Dict):
+    """Add the general stats column and the report section for Samtools rmdup"""
 
     # Write parsed report data to a file
     module.write_data_file(samtools_rmdup, "multiqc_samtools_rmdup")
@@ -76,5 +78,3 @@ def parse_samtools_rmdup(module: BaseMultiqcModule):
         }
     }
     module.general_stats_addcols(samtools_rmdup, stats_headers, namespace="rmdup")
-
-    return len(samtools_rmdup)
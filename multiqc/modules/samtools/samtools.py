@@ -1,14 +1,15 @@
 import logging
-from typing import Dict
+from typing import Dict, List, Mapping
 
-from multiqc.base_module import BaseMultiqcModule, ModuleNoSamplesFound
+from multiqc.base_module import BaseMultiqcModule, ModuleNoSamplesFound, ParsedData
+from multiqc.types import FileDict, ModuleId
 
-from .coverage import parse_samtools_coverage
-from .flagstat import parse_samtools_flagstat
-from .idxstats import parse_samtools_idxstats
-from .markdup import parse_samtools_markdup
-from .rmdup import parse_samtools_rmdup
-from .stats import parse_samtools_stats
+from .coverage import build_samtools_coverage_sections, parse_samtools_coverage
+from .flagstat import build_samtools_flagstat_sections, parse_samtools_flagstat
+from .idxstats import build_samtools_idxstats_sections, parse_samtools_idxstats
+from .markdup import build_samtools_markdup_sections, parse_samtools_markdup
+from .rmdup import build_samtools_rmdup_sections, parse_samtools_rmdup
+from .stats import build_samtools_stats_sections, parse_samtools_stats
 
 log = logging.getLogger(__name__)
 
@@ -95,33 +96,34 @@ class MultiqcModule(BaseMultiqcModule):
             doi="10.1093/bioinformatics/btp352",
         )
 
-        n = dict()
+        self.parse_and_build_sections()
 
-        # Call submodule functions
-        n["stats"] = parse_samtools_stats(self)
-        if n["stats"] > 0:
-            log.info(f"Found {n['stats']} stats reports")
-
-        n["flagstat"] = parse_samtools_flagstat(self)
-        if n["flagstat"] > 0:
-            log.info(f"Found {n['flagstat']} flagstat reports")
-
-        n["idxstats"] = parse_samtools_idxstats(self)
-        if n["idxstats"] > 0:
-            log.info(f"Found {n['idxstats']} idxstats reports")
+    def parse(self, files: Mapping[ModuleId, List[FileDict]]) -> ParsedData:
+        parsed = ParsedData()
 
-        n["rmdup"] = parse_samtools_rmdup(self)
-        if n["rmdup"] > 0:
-            log.info(f"Found {n['rmdup']} rmdup reports")
-
-        n["coverage"] = parse_samtools_coverage(self)
-        if n["coverage"] > 0:
-            log.info(f"Found {n['coverage']} coverage reports")
-
-        n["markdup"] = parse_samtools_markdup(self)
-        if n["markdup"] > 0:
-            log.info(f"Found {n['markdup']} markdup reports")
+        # Call submodule functions
+        parsed.data["stats"] = parse_samtools_stats(self, files, parsed)
+        parsed.data["flagstat"] = parse_samtools_flagstat(self, files, parsed)
+        parsed.data["idxstats"] = parse_samtools_idxstats(self, files, parsed)
+        parsed.data["rmdup"] = parse_samtools_rmdup(self, files, parsed)
+        parsed.data["coverage"] = parse_samtools_coverage(self, files, parsed)
+        parsed.data["markdup"] = parse_samtools_markdup(self, files, parsed)
 
         # Exit if we didn't find anything
-        if sum(n.values()) == 0:
+        if all(len(data) == 0 for data in parsed.data.values()):
             raise ModuleNoSamplesFound
+        return parsed
+
+    def build_sections(self, parsed: ParsedData) -> None:
+        for command, build_command_sections in [
+            ("stats", build_samtools_stats_sections),
+            ("flagstat", build_samtools_flagstat_sections),
+            ("idxstats", build_samtools_idxstats_sections),
+            ("rmdup", build_samtools_rmdup_sections),
+            ("coverage", build_samtools_coverage_sections),
+            ("markdup", build_samtools_markdup_sections),
+        ]:
+            data = parsed.data[command]
+            if len(data) > 0:
+                build_command_sections(self, data)
+                log.info(f"Found {len(data)} {command} reports")
@@ -1,8 +1,9 @@
 import logging
 import re
-from typing import Dict
+from typing import Dict, List, Optional, Tuple
 
 from multiqc import config, BaseMultiqcModule
+from multiqc.base_module import ParsedData
 from multiqc.plots import bargraph, violin
 
 log = logging.getLogger(__name__)
@@ -12,59 +13,73 @@ VERSION_REGEX = r"# This file was produced by samtools stats \(([\d\.]+)"
 HTSLIB_REGEX = r"\+htslib-([\d\.]+)"
 
 
-def parse_samtools_stats(module: BaseMultiqcModule):
+def parse_samtools_stats(module: BaseMultiqcModule, files, parsed: ParsedData) -> Dict:
     """Find Samtools stats logs and parse their data"""
 
     samtools_stats: Dict = dict()
-    for f in module.find_log_files("samtools/stats"):
-        parsed_data = dict()
-        for line in f["f"].splitlines():
-            # Get version number from file contents
-            if line.startswith("# This file was produced by samtools stats"):
-                # Look for Samtools version
-                version_match = re.search(VERSION_REGEX, line)
-                if version_match is None:
-                    continue
-
-                # Add Samtools version
-                samtools_version = version_match.group(1)
-                module.add_software_version(samtools_version, f["s_name"])
-
-                # Look for HTSlib version
-                htslib_version_match = re.search(HTSLIB_REGEX, line)
-                if htslib_version_match is None:
-                    continue
-
-                # Add HTSlib version if different from Samtools version
-                htslib_version = htslib_version_match.group(1)
-                if htslib_version != samtools_version:
-                    module.add_software_version(htslib_version, f["s_name"], "HTSlib")
-
-            if not line.startswith("SN"):
-                continue
-            sections = line.split("\t")
-            field = sections[1].strip()[:-1]
-            field = field.replace(" ", "_")
-            value = float(sections[2].strip())
-            parsed_data[field] = value
+    for f, (parsed_data, versions) in module.parse_log_files("samtools/stats", parse_single_report, files=files):
+        for version, software_name in versions:
+            parsed.add_software_version(version, f["s_name"], software_name)
 
         if len(parsed_data) > 0:
-            # Work out some percentages
-            if "raw_total_sequences" in parsed_data:
-                for k in list(parsed_data.keys()):
-                    if k.startswith("reads_") and k != "raw_total_sequences" and parsed_data["raw_total_sequences"] > 0:
-                        parsed_data[f"{k}_percent"] = (parsed_data[k] / parsed_data["raw_total_sequences"]) * 100
-
             if f["s_name"] in samtools_stats:
                 log.debug(f"Duplicate sample name found! Overwriting: {f['s_name']}")
-            module.add_data_source(f, section="stats")
+            parsed.add_data_source(f, section="stats")
             samtools_stats[f["s_name"]] = parsed_data
 
     # Filter to strip out ignored sample names
-    samtools_stats = module.ignore_samples(samtools_stats)
+    return module.ignore_samples(samtools_stats)
+
+
+def parse_single_report(f) -> Tuple[Dict[str, float], List[Tuple[str, Optional[str]]]]:
+    """
+    Parse a Samtools stats log. Returns the SN metrics, and the Samtools and HTSlib versions
+    as (version, software name) pairs
+    """
+    parsed_data: Dict[str, float] = dict()
+    versions: List[Tuple[str, Optional[str]]] = []
+    for line in f["f"].splitlines():
+        # Get version number from file contents
+        if line.startswith("# This file was produced by samtools stats"):
+            # Look for Samtools version
+            version_match = re.search(VERSION_REGEX, line)
+            if version_match is None:
+                continue
+
+            # Add Samtools version
+            samtools_version = version_match.group(1)
+            versions.append((samtools_version, None))
+
+            # Look for HTSlib version
+            htslib_version_match = re.search(HTSLIB_REGEX, line)
+            if htslib_version_match is None:
+                continue
+
+            # Add HTSlib version if different from Samtools version
+            htslib_version = htslib_version_match.group(1)
+            if htslib_version != samtools_version:
+                versions.append((htslib_version, "HTSlib"))
+
+        if not line.startswith("SN"):
+            continue
+        sections = line.split("\t")
+        field = sections[1].strip()[:-1]
+        field = field.replace(" ", "_")
+        value = float(sections[2].strip())
+        parsed_data[field] = value
+
+    if len(parsed_data) > 0:
+        # Work out some percentages
+        if "raw_total_sequences" in parsed_data:
+            for k in list(parsed_data.keys()):
+                if k.startswith("reads_") and k != "raw_total_sequences" and parsed_data["raw_total_sequences"] > 0:
+                    parsed_data[f"{k}_percent"] = (parsed_data[k] / parsed_data["raw_total_sequences"]) * 100
 
-    if len(samtools_stats) == 0:
-        return 0
+    return parsed_data, versions
+
+
+def build_samtools_stats_sections(module: BaseMultiqcModule, samtools_stats: Dict):
+    """Add the general stats columns and the report sections for Samtools stats"""
 
     # Write parsed report data to a file
     module.write_data_file(samtools_stats, "multiqc_samtools_stats")
@@ -182,9 +197,6 @@ def parse_samtools_stats(module: BaseMultiqcModule):
         ),
     )
 
-    # Return the number of logs that were found
-    return len(samtools_stats)
-
 
 def alignment_section(module, samples_data):
     bedgraph_data = {}
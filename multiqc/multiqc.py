@@ -15,7 +15,7 @@ from typing import Optional, Tuple
 import rich_click as click
 
 from multiqc import config, report
-from multiqc.core import log_and_rich, plugin_hooks
+from multiqc.core import log_and_rich, memory_usage, plot_data_compression, plugin_hooks
 from multiqc.core.exceptions import NoAnalysisFound, RunError
 from multiqc.core.exec_modules import exec_modules
 from multiqc.core.file_search import file_search
@@ -101,6 +101,8 @@ click.rich_click.OPTION_GROUPS = {
                 "--zip-data-dir",
                 "--no-report",
                 "--pdf",
+                "--plot-data-compression",
+                "--plot-data-compression-level",
             ],
         },
         {
@@ -113,6 +115,16 @@ click.rich_click.OPTION_GROUPS = {
                 "--require-logs",
                 "--profile-runtime",
                 "--profile-memory",
+                "--profile-rss",
+                "--trace",
+                "--search-workers",
+                "--search-walk-threads",
+                "--module-workers",
+                "--read-ahead",
+                "--search-cache",
+                "--reset-search-cache",
+                "--parse-cache",
+                "--reset-parse-cache",
                 "--no-megaqc-upload",
                 "--no-ansi",
                 "--version",
@@ -350,6 +362,19 @@ click.rich_click.OPTION_GROUPS = {
     default=None,
     help="Creates PDF report with the [i]'simple'[/] template. Requires [link=https://pandoc.org/]Pandoc[/] to be installed.",
 )
+@click.option(
+    "--plot-data-compression",
+    "plot_data_compression",
+    type=click.Choice(list(plot_data_compression.CODECS.keys())),
+    help="Compression of the plot data embedded in the report",
+)
+@click.option(
+    "--plot-data-compression-level",
+    "plot_data_compression_level",
+    type=click.IntRange(0, 22),
+    metavar="LEVEL",
+    help="Compression level of the plot data: 0 to 9 for gzip, 1 to 22 for zstd, 0 to 11 for brotli. Higher levels give smaller reports, but take longer to write",
+)
 @click.option(
     "--no-megaqc-upload",
     "no_megaqc_upload",
@@ -399,6 +424,76 @@ click.rich_click.OPTION_GROUPS = {
     default=None,
     help="Add analysis of how much memory each module uses. Note that tracking memory will increase the runtime, so the runtime metrics could scale up a few times",
 )
+@click.option(
+    "--profile-rss",
+    "profile_rss",
+    is_flag=True,
+    default=None,
+    help="Add analysis of the resident memory of MultiQC after each module and report writing step, and of the size of the data of each module. Doesn't slow down the run",
+)
+@click.option(
+    "--trace",
+    "trace",
+    is_flag=True,
+    default=None,
+    help="Record a timeline of the run, and write it to the data directory in the Chrome trace and speedscope formats",
+)
+@click.option(
+    "--search-workers",
+    "search_workers",
+    type=int,
+    metavar="N",
+    help="Search files in [yellow i]N[/] parallel processes. Useful for directories with many thousands of files",
+)
+@click.option(
+    "--search-walk-threads",
+    "search_walk_threads",
+    type=int,
+    metavar="N",
+    help="List directories in [yellow i]N[/] parallel threads. Useful for network file systems with slow directory listings",
+)
+@click.option(
+    "--module-workers",
+    "module_workers",
+    type=int,
+    metavar="N",
+    help="Run modules in [yellow i]N[/] parallel processes. Useful when logs for many different tools are found",
+)
+@click.option(
+    "--read-ahead",
+    "read_ahead_files",
+    type=int,
+    metavar="N",
+    help="Read the next [yellow i]N[/] files of a module in threads while parsing the current one. Useful for network file systems",
+)
+@click.option(
+    "--search-cache/--no-search-cache",
+    "search_cache",
+    is_flag=True,
+    default=None,
+    help="Cache the file search results, so that reruns only search new or changed files",
+)
+@click.option(
+    "--reset-search-cache",
+    "search_cache_reset",
+    is_flag=True,
+    default=None,
+    help="Remove the cached file search results before searching",
+)
+@click.option(
+    "--parse-cache/--no-parse-cache",
+    "parse_cache",
+    is_flag=True,
+    default=None,
+    help="Cache the data parsed from log files, so that reruns only parse new or changed files",
+)
+@click.option(
+    "--reset-parse-cache",
+    "parse_cache_reset",
+    is_flag=True,
+    default=None,
+    help="Remove the cached parsed data before running the modules",
+)
 @click.option(
     NO_ANSI_FLAG,
     "no_ansi",
@@ -443,6 +538,13 @@ def run_cli(analysis_dir: Tuple[str], clean_up: bool, **kwargs):
     For example, to run in the current working directory, use '[blue bold]multiqc .[/]'
     """
 
+    # The level range depends on the codec. A codec set in a config file is checked when the config is loaded
+    if kwargs.get("plot_data_compression") is not None and kwargs.get("plot_data_compression_level") is not None:
+        try:
+            plot_data_compression.check_level(kwargs["plot_data_compression"], kwargs["plot_data_compression_level"])
+        except ValueError as e:
+            raise click.BadParameter(str(e), param_hint="'--plot-data-compression-level'")
+
     cl_config_kwargs = {k: v for k, v in kwargs.items() if k in ClConfig.model_fields}
     other_fields = {k: v for k, v in kwargs.items() if k not in ClConfig.model_fields}
     cfg = ClConfig(**cl_config_kwargs, unknown_options=other_fields)
@@ -539,6 +641,13 @@ def run(*analysis_dir, clean_up: bool = True, cfg: Optional[ClConfig] = None, in
             logger.warning(f"Run took {report.runtimes.total:.2f} seconds")
             logger.warning(f" - {report.runtimes.total_sp:.2f}s: Searching files")
             logger.warning(f" - {report.runtimes.total_mods:.2f}s: Running modules")
+            if report.runtimes.clean_s_name_calls:
+                logger.warning(
+                    f"   Cleaned sample names {report.runtimes.clean_s_name_calls:,d} times, "
+                    f"{report.runtimes.clean_s_name_hits / report.runtimes.clean_s_name_calls:.0%} from cache"
+                )
+            for step, usage in report.runtimes.memory_steps.items():
+                logger.warning(f" - {step}: {memory_usage.format_usage(usage)}")
             if config.make_report:
                 logger.warning(f" - {report.runtimes.total_compression:.2f}s: Compressing report data")
                 logger.info("For more information, see the 'Run Time' section in the report")
@@ -8,6 +8,7 @@ from typing import Dict, List, Mapping, Optional, Sequence, Union, cast
 from importlib_metadata import EntryPoint
 
 from multiqc import config
+from multiqc.core import tracing
 from multiqc.core.exceptions import RunError
 from multiqc.plots.plotly import bar
 from multiqc.plots.plotly.bar import BarPlotConfig, CatDataDict
@@ -43,6 +44,7 @@ class CatConf(ValidatedConfig):
 CategoriesT = Union[Sequence[str], Mapping[str, Union[Mapping[str, str], CatConf]]]
 
 
+@tracing.traced("bargraph.plot", cat="plot")
 def plot(
     data: Union[InputDatasetT, Sequence[InputDatasetT]],
     cats: Optional[Union[CategoriesT, Sequence[CategoriesT]]] = None,
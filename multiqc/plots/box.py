@@ -6,6 +6,7 @@ from typing import Dict, List, Optional, OrderedDict, Union, cast
 from importlib_metadata import EntryPoint
 
 from multiqc import config
+from multiqc.core import tracing
 from multiqc.plots.plotly import box
 from multiqc.plots.plotly.box import BoxPlotConfig, BoxT
 
@@ -23,6 +24,7 @@ def get_template_mod():
     return _template_mod
 
 
+@tracing.traced("box.plot", cat="plot")
 def plot(
     list_of_data_by_sample: Union[Dict[str, BoxT], List[Dict[str, BoxT]]],
     pconfig: Union[Dict, BoxPlotConfig, None],
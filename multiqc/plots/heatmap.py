@@ -6,6 +6,7 @@ from typing import Dict, List, Optional, Union, cast
 from importlib_metadata import EntryPoint
 
 from multiqc import config
+from multiqc.core import tracing
 from multiqc.plots.plotly import heatmap
 from multiqc.plots.plotly.heatmap import HeatmapConfig
 
@@ -23,6 +24,7 @@ def get_template_mod():
     return _template_mod
 
 
+@tracing.traced("heatmap.plot", cat="plot")
 def plot(
     data,
     xcats: Optional[List[Union[str, int]]] = None,
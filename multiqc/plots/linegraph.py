@@ -6,6 +6,7 @@ from typing import Dict, List, Optional, Sequence, Tuple, TypeVar, Union, cast
 from importlib_metadata import EntryPoint
 
 from multiqc import config
+from multiqc.core import tracing
 from multiqc.plots.plotly import line
 from multiqc.plots.plotly.line import DatasetT, KeyTV, LinePlotConfig, Series, ValueTV, XToYDictT
 from multiqc.utils import mqc_colour
@@ -25,6 +26,7 @@ def get_template_mod() -> EntryPoint:
     return _template_mod
 
 
+@tracing.traced("linegraph.plot", cat="plot")
 def plot(
     data: Union[DatasetT, Sequence[DatasetT]],
     pconfig: Union[Dict, LinePlotConfig, None] = None,
@@ -10,6 +10,7 @@ from plotly.graph_objs.layout.shape import Label  # type: ignore
 from pydantic import BaseModel, Field
 
 from multiqc import config, report
+from multiqc.plots.plotly import typed_array
 from multiqc.plots.plotly.plot import BaseDataset, PConfig, Plot, PlotType, convert_dash_style
 from multiqc.types import SampleName
 from multiqc.utils.util_functions import update_dict
@@ -271,6 +272,19 @@ class Dataset(BaseDataset):
 class LinePlot(Plot[Dataset]):
     datasets: List[Dataset]
 
+    def plot_data_for_report(self) -> Dict:
+        """
+        Store each series as x and y columns instead of a list of pairs, with numeric columns
+        encoded as typed arrays, decoded in `LinePlot` in `line.js`
+        """
+        dump = super().plot_data_for_report()
+        for dataset in dump["datasets"]:
+            for line in dataset["lines"]:
+                pairs = line.pop("pairs")
+                line["x"] = typed_array.encode([p[0] for p in pairs])
+                line["y"] = typed_array.encode([p[1] for p in pairs])
+        return dump
+
 
 def create(
     pconfig: LinePlotConfig,
@@ -781,9 +781,15 @@ class Plot(BaseModel, Generic[T]):
         html += "</div>"
 
         # Saving compressed data for JavaScript to pick up and uncompress.
-        report.plot_data[self.anchor] = self.model_dump(warnings=False)
+        report.plot_data[self.anchor] = self.plot_data_for_report()
         return html
 
+    def plot_data_for_report(self) -> Dict:
+        """
+        Data embedded in the report for the JavaScript to build the interactive plot
+        """
+        return self.model_dump(warnings=False)
+
     def flat_plot(self, embed_in_html: Optional[bool] = None, plots_dir_name: Optional[str] = None) -> str:
         embed_in_html = embed_in_html if embed_in_html is not None else not config.development
         if not embed_in_html and plots_dir_name is None:
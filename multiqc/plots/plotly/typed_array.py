@@ -0,0 +1,76 @@
+"""
+Encoding of numeric columns of the plot data embedded in the report as base64 little-endian typed
+arrays, read in the report JavaScript by `decodeTypedArray` as `Int32Array` or `Float64Array`,
+without parsing every number from JSON.
+"""
+
+import array
+import base64
+import math
+import sys
+from typing import Any, Dict, List, Sequence, Union
+
+# Shorter columns are kept as JSON lists, as the encoding doesn't pay off for them
+MIN_LENGTH = 16
+
+_INT32_MIN, _INT32_MAX = -(2**31), 2**31 - 1
+_MAX_EXACT_FLOAT_INT = 2**53
+
+
+def _json_float_len(values: Sequence[float]) -> float:
+    """
+    Average length of a sample of the values written as JSON numbers
+    """
+    step = max(1, len(values) // 16)
+    sample = values[::step][:16]
+    return sum(len(repr(float(v))) for v in sample) / len(sample)
+
+
+def encode(values: Sequence[Any]) -> Union[List[Any], Dict[str, str]]:
+    """
+    Encode a column of values as {"dtype": "i4" or "f8", "b64": <base64 bytes>}, or return it as a list
+    if it isn't worth it or can't be encoded losslessly: for short columns, columns with anything but
+    numbers, NaNs or infinities (written as null in JSON), and floats with few digits, which compress
+    better as JSON text than as 8-byte doubles
+    """
+    if len(values) < MIN_LENGTH:
+        return list(values)
+    all_ints = True
+    for v in values:
+        if isinstance(v, bool) or not isinstance(v, (int, float)):
+            return list(values)
+        if isinstance(v, int):
+            if all_ints and not _INT32_MIN <= v <= _INT32_MAX:
+                all_ints = False
+            if abs(v) > _MAX_EXACT_FLOAT_INT:
+                return list(values)
+        else:
+            all_ints = False
+            if math.isnan(v) or math.isinf(v):
+                return list(values)
+
+    if all_ints:
+        arr = array.array("i", values)
+        dtype = "i4"
+    elif _json_float_len(values) > 8:
+        arr = array.array("d", values)
+        dtype = "f8"
+    else:
+        return list(values)
+    if arr.itemsize != int(dtype[1]):
+        return list(values)
+    if sys.byteorder == "big":
+        arr.byteswap()
+    return {"dtype": dtype, "b64": base64.b64encode(arr.tobytes()).decode("ascii")}
+
+
+def decode(column: Union[List[Any], Dict[str, str]]) -> List[Any]:
+    """
+    Values of a column encoded with `encode`
+    """
+    if not isinstance(column, dict):
+        return column
+    arr = array.array("i" if column["dtype"] == "i4" else "d", base64.b64decode(column["b64"]))
+    if sys.byteorder == "big":
+        arr.byteswap()
+    return arr.tolist()
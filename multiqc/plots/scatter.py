@@ -6,6 +6,7 @@ from typing import Any, Dict, List, Optional, Union, cast
 from importlib_metadata import EntryPoint
 
 from multiqc import config
+from multiqc.core import tracing
 from multiqc.plots.plotly import scatter
 from multiqc.plots.plotly.scatter import ScatterConfig
 
@@ -23,6 +24,7 @@ def get_template_mod():
     return _template_mod
 
 
+@tracing.traced("scatter.plot", cat="plot")
 def plot(
     data,
     pconfig: Union[Dict, ScatterConfig, None] = None,
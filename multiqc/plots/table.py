@@ -4,6 +4,7 @@ from typing import Dict, List, Optional, Sequence, Union, cast
 from importlib_metadata import EntryPoint
 
 from multiqc import config, report
+from multiqc.core import tracing
 from multiqc.plots import table_object
 from multiqc.plots.plotly import table
 from multiqc.plots.plotly.plot import Plot
@@ -24,6 +25,7 @@ def get_template_mod():
     return _template_mod
 
 
+@tracing.traced("table.plot", cat="plot")
 def plot(
     data: Union[SectionT, List[SectionT]],
     headers: Optional[Union[List[Dict[ColumnKeyT, ColumnDict]], Dict[ColumnKeyT, ColumnDict]]] = None,
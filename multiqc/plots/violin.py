@@ -4,6 +4,7 @@ from typing import Dict, List, Optional, Union, cast
 from importlib_metadata import EntryPoint
 
 from multiqc import config, report
+from multiqc.core import tracing
 from multiqc.plots import table_object
 from multiqc.plots.plotly import violin
 from multiqc.plots.table_object import ColumnDict, ColumnKey, ColumnKeyT, SectionT, TableConfig
@@ -25,6 +26,7 @@ def get_template_mod() -> EntryPoint:
     return _template_mod
 
 
+@tracing.traced("violin.plot", cat="plot")
 def plot(
     data: Union[List[SectionT], SectionT],
     headers: Optional[Union[List[Dict[ColumnKeyT, ColumnDict]], Dict[ColumnKeyT, ColumnDict]]] = None,
@@ -4,13 +4,15 @@ modules. Contains helper functions to generate markup for report.
 """
 
 import base64
+import codecs
+import concurrent.futures
 import dataclasses
 import fnmatch
-import gzip
 import inspect
 import io
 import json
 import logging
+import math
 import mimetypes
 import os
 import re
@@ -20,8 +22,10 @@ from collections import defaultdict
 from pathlib import Path, PosixPath
 from typing import (
     Any,
+    BinaryIO,
     Callable,
     Dict,
+    Iterable,
     Iterator,
     List,
     Mapping,
@@ -37,20 +41,29 @@ from typing import (
 import yaml
 from pydantic import BaseModel, Field
 
+try:
+    # Optional: an Aho-Corasick automaton finds all search pattern strings in a single pass over the file
+    import ahocorasick  # type: ignore
+except ImportError:
+    ahocorasick = None
+
 from multiqc import config
 
 # This does not cause circular imports because BaseMultiqcModule is used only in
 # quoted type hints, and quoted type hints are lazily evaluated:
 from multiqc.base_module import BaseMultiqcModule
-from multiqc.core import log_and_rich, tmp_dir
+from multiqc.core import compressed_files, log_and_rich, plot_data_compression, search_cache, tmp_dir, tracing
 from multiqc.core.exceptions import NoAnalysisFound
 from multiqc.core.log_and_rich import iterate_using_progress_bar
+from multiqc.core.search_cache import SearchResult
 from multiqc.core.tmp_dir import data_tmp_dir
+from multiqc.core.walk_dirs import is_searching_in_source_dir, walk_analysis_paths
 from multiqc.plots.plotly.plot import Plot
 from multiqc.plots.table_object import ColumnDict, InputRow, SampleName
 from multiqc.types import Anchor, ColumnKey, FileDict, ModuleId, SampleGroup
 from multiqc.utils.util_functions import (
     dump_json,
+    iter_json,
     replace_defaultdicts,
     rmtree_with_retries,
 )
@@ -60,6 +73,74 @@ logger = logging.getLogger(__name__)
 initialized = False
 
 
+@dataclasses.dataclass
+class SearchPatternStats:
+    """
+    Work done by the file search for a search pattern key, collected with `config.profile_runtime`.
+    Reading a file is counted for the search pattern key that needed it first.
+    """
+
+    files_tested: int = 0  # Files with a name matching the search pattern, that were tested further
+    files_opened: int = 0
+    bytes_read: int = 0  # Decompressed bytes for compressed files
+    lines_read: int = 0
+    blocks_from_disk: int = 0
+    blocks_from_cache: int = 0  # Line blocks already read for another search pattern
+    matches: int = 0
+
+    def add(self, other: "SearchPatternStats", subtract: Optional["SearchPatternStats"] = None):
+        for field in dataclasses.fields(self):
+            value = getattr(other, field.name) - (getattr(subtract, field.name) if subtract else 0)
+            setattr(self, field.name, getattr(self, field.name) + value)
+
+
+@dataclasses.dataclass
+class MemoryUsage:
+    """
+    Memory of the process during a module or a report writing step in bytes, collected with
+    `config.profile_rss`. The current RSS is None where it can't be read cheaply, i.e. on systems without /proc.
+    """
+
+    rss_before: Optional[int] = None
+    rss_after: Optional[int] = None
+    peak_rss: Optional[int] = None  # high-water mark of the process at the end of the step
+    data_bytes: int = 0  # size of the raw data saved by a module
+    plot_bytes: int = 0  # size of the plots added by a module
+
+    @property
+    def rss_change(self) -> Optional[int]:
+        if self.rss_before is None or self.rss_after is None:
+            return None
+        return self.rss_after - self.rss_before
+
+
+@dataclasses.dataclass
+class TraceEvent:
+    """
+    A span of the run timeline, collected with `config.trace`. Times in microseconds since the epoch
+    """
+
+    name: str
+    cat: str
+    start: int
+    duration: int
+    pid: int
+    tid: int
+    args: Dict[str, str] = dataclasses.field(default_factory=dict)
+
+
+# Upper bounds and labels of the buckets of the file size histogram in `Runtimes.sp_filesizes`
+FILESIZE_BUCKETS = [
+    (1024, "<1 KB"),
+    (10 * 1024, "1-10 KB"),
+    (100 * 1024, "10-100 KB"),
+    (1024 * 1024, "100 KB-1 MB"),
+    (10 * 1024 * 1024, "1-10 MB"),
+    (100 * 1024 * 1024, "10-100 MB"),
+    (math.inf, ">100 MB"),
+]
+
+
 @dataclasses.dataclass
 class Runtimes:
     total: float = 0.0
@@ -68,6 +149,30 @@ class Runtimes:
     total_compression: float = 0.0
     sp: Dict[str, float] = dataclasses.field(default_factory=lambda: defaultdict())
     mods: Dict[str, float] = dataclasses.field(default_factory=lambda: defaultdict())
+    # Collected with `config.profile_runtime`: file search work per search pattern key, and
+    # a histogram of the sizes of files read by the search
+    sp_stats: Dict[str, SearchPatternStats] = dataclasses.field(default_factory=dict)
+    sp_filesizes: Dict[str, int] = dataclasses.field(default_factory=dict)
+    # Calls to `BaseMultiqcModule.clean_s_name()`, and the calls answered with a memoized name
+    clean_s_name_calls: int = 0
+    clean_s_name_hits: int = 0
+    # Collected with `config.profile_rss`: memory usage by module, and by report writing step
+    memory_mods: Dict[str, MemoryUsage] = dataclasses.field(default_factory=dict)
+    memory_steps: Dict[str, MemoryUsage] = dataclasses.field(default_factory=dict)
+    # Collected with `config.trace`: spans of the run timeline, including those of worker processes
+    trace_events: List[TraceEvent] = dataclasses.field(default_factory=list)
+
+    def add_search(self, other: "Runtimes"):
+        """
+        Add the file search run times, stats and trace spans collected by a worker process
+        """
+        for module_id, sp_time in other.sp.items():
+            self.sp[module_id] = self.sp.get(module_id, 0) + sp_time
+        for module_id, stats in other.sp_stats.items():
+            self.sp_stats.setdefault(module_id, SearchPatternStats()).add(stats)
+        for bucket, count in other.sp_filesizes.items():
+            self.sp_filesizes[bucket] = self.sp_filesizes.get(bucket, 0) + count
+        self.trace_events.extend(other.trace_events)
 
 
 # Uninitialised global variables for static typing
@@ -86,6 +191,7 @@ runtimes: Runtimes
 peak_memory_bytes_per_module: Dict[str, int]
 diff_memory_bytes_per_module: Dict[str, int]
 file_search_stats: Dict[str, Set[Path]]
+file_walk_stats: Dict[str, int]
 files: Dict[ModuleId, List[FileDict]]
 
 # Fields below are kept between interactive runs
@@ -163,6 +269,7 @@ def reset_file_search():
     global analysis_files
     global files
     global file_search_stats
+    global file_walk_stats
     analysis_files = []
     files = dict()  # Discovered files for each search key
     file_search_stats = {
@@ -172,9 +279,14 @@ def reset_file_search():
         "skipped_filesize_limit": set(),
         "skipped_module_specific_max_filesize": set(),
         "skipped_no_match": set(),
+        "skipped_no_filename_match": set(),
         "skipped_directory_fn_ignore_dirs": set(),
         "skipped_file_contents_search_errors": set(),
     }
+    file_walk_stats = {
+        "dirs_visited": 0,
+        "entries_visited": 0,
+    }
 
 
 reset()
@@ -214,6 +326,28 @@ def file_line_block_iterator(fp: TextIO, block_size: int = 4096) -> Iterator[Tup
         remainder = block[block_end:]
 
 
+def bytes_line_block_iterator(chunks: Iterable[bytes]) -> Iterator[Tuple[int, str]]:
+    """
+    Same as `file_line_block_iterator`, but for chunks of bytes read from a file. The chunks
+    are decoded as UTF-8, skipping invalid characters, and "\r\n" and "\r" line breaks are
+    translated to "\n", same as when reading the file in text mode.
+    """
+    decoder = io.IncrementalNewlineDecoder(codecs.getincrementaldecoder("utf-8")(errors="ignore"), translate=True)
+    remainder: List[str] = []  # Parts of a line that spans multiple chunks
+    for chunk in chunks:
+        text = decoder.decode(chunk)
+        block_end = text.rfind("\n") + 1  # + 1 to include the '\n'
+        if block_end == 0:
+            remainder.append(text)
+            continue
+        yield text.count("\n", 0, block_end), "".join(remainder) + text[:block_end]
+        remainder = [text[block_end:]]
+    # The last line may not have a terminating newline character
+    block = "".join(remainder) + decoder.decode(b"", final=True)
+    if block:
+        yield block.count("\n") + (not block.endswith("\n")), block
+
+
 class SearchFile:
     """
     Wrap file handler and provide a lazy line block iterator on it with caching.
@@ -231,16 +365,40 @@ class SearchFile:
         # start again, this time will read from cache:
         for line_count, block in f.line_block_iterator():
             # process block again
+
+    The file is read as bytes, and only decoded when the line blocks are iterated. A file
+    with a NUL byte in the first read is considered binary, and yields no lines. Compressed
+    files (see `compressed_files.COMPRESSION_EXTENSIONS`) are decompressed as they are read,
+    so only the start of the file needed by the search patterns is decompressed.
+
+    With `max_cached_lines`, only the blocks with the first lines of the file are cached, and
+    the rest of the file is streamed without keeping it in memory. Iterating again past the
+    cached blocks then reads the file again.
     """
 
-    def __init__(self, path: Path):
+    # Number of bytes read from the file at once. The first read is also used to detect binary files
+    read_size = 32 * 1024
+
+    def __init__(self, path: Path, max_cached_lines: Optional[int] = None):
         self.path: Path = path
         self.filename = path.name
         self.root = path.parent
-        self._filehandle: Optional[TextIO] = None
+        # Names to match search patterns against, including the name without the compression extension
+        self.match_filenames: List[str] = compressed_files.match_filenames(self.filename)
+        self._fh: Optional[BinaryIO] = None
         self._iterator: Optional[Iterator[Tuple[int, str]]] = None
         self._blocks: List[Tuple[int, str]] = []  # cache of read blocks with line count found in each block
+        self.max_cached_lines = max_cached_lines
+        self._cached_lines = 0
+        self._iterator_blocks = 0  # Number of blocks read by self._iterator, including the ones not cached
         self._filesize: Optional[int] = None
+        self.is_binary: Optional[bool] = None  # Set when the file head is read
+        # Counters for the runtime profile
+        self.opened = False
+        self.bytes_read = 0
+        self.lines_read = 0
+        self.blocks_from_disk = 0
+        self.blocks_from_cache = 0
 
     @property
     def filesize(self) -> Optional[int]:
@@ -252,6 +410,24 @@ class SearchFile:
                 self._filesize = None
         return self._filesize
 
+    def _read_chunks(self) -> Iterator[bytes]:
+        assert self._fh is not None
+        head = self._fh.read(self.read_size)
+        self.bytes_read += len(head)
+        # Text files don't have NUL bytes, while most binary formats have them in the header
+        self.is_binary = b"\0" in head
+        if self.is_binary:
+            if config.report_readerrors:
+                logger.debug(f"File looks binary, not searching its contents: {self.path}")
+            return
+        yield head
+        while True:
+            chunk = self._fh.read(self.read_size)
+            if not chunk:  # EOF
+                return
+            self.bytes_read += len(chunk)
+            yield chunk
+
     def line_block_iterator(self) -> Iterator[Tuple[int, str]]:
         """
         Optimized file line iterator.
@@ -262,64 +438,65 @@ class SearchFile:
 
         Serves as a replacement for f.readlines() that is:
         - lazy
-        - caches 4kb+ blocks
+        - caches 32kb+ blocks
         - returns multiple lines concatenated with '\n' if found in block
 
         This way, we can compare whole blocks versus the search patterns, instead of individual lines,
         and each comparison comes with a lot of Python runtime overhead.
 
-        First loops over the cache `self._blocks`, then tries to read more blocks from the file handler.
+        First loops over the cache `self._blocks`, then tries to read more blocks from the file.
+        Characters that are not valid UTF-8 are skipped, so a file with a few non-unicode
+        characters is still searched.
         """
         for count_and_block_tuple in self._blocks:
+            self.blocks_from_cache += 1
             yield count_and_block_tuple
-        if self._filehandle is None:
+        if self._fh is not None and self._iterator_blocks > len(self._blocks):
+            # The file was already streamed past the cached blocks, so start reading it again
+            self.close()
+        if self._fh is None:
             try:
-                self._filehandle = io.open(self.path, "rt", encoding="utf-8")
+                self._fh = compressed_files.open_binary(self.path)
+                self.opened = True
             except Exception as e:
                 if config.report_readerrors:
                     logger.debug(f"Couldn't read file when looking for output: {self.path}, {e}")
                 raise
-            self._iterator = file_line_block_iterator(self._filehandle)
+            self._iterator = bytes_line_block_iterator(self._read_chunks())
+            self._iterator_blocks = 0
         assert self._iterator is not None
         try:
             for count_and_block_tuple in self._iterator:
-                self._blocks.append(count_and_block_tuple)
+                self._iterator_blocks += 1
+                if self._iterator_blocks <= len(self._blocks):
+                    continue  # Reading the file again, and the block was already yielded from the cache
+                if self.max_cached_lines is None or self._cached_lines < self.max_cached_lines:
+                    self._blocks.append(count_and_block_tuple)
+                    self._cached_lines += count_and_block_tuple[0]
+                self.blocks_from_disk += 1
+                self.lines_read += count_and_block_tuple[0]
                 yield count_and_block_tuple
-
-        except UnicodeDecodeError as e:
-            if config.report_readerrors:
-                logger.debug(
-                    f"Couldn't read file as a utf-8 text when looking for output: {self.path}, {e}. "
-                    f"Usually because it's a binary file. But sometimes there are single non-unicode "
-                    f"characters, so attempting reading while skipping such characters."
-                )
         except Exception as e:
             if config.report_readerrors:
                 logger.debug(f"Couldn't read file when looking for output: {self.path}, {e}")
             raise
-        else:
-            # When no lines are parsed, self.content_lines should be empty
-            if not self._blocks and config.report_readerrors:
-                logger.debug(f"No utf-8 lines were read from the file, skipping {self.path}")
-            return  # No errors
-        self._filehandle.close()
-        self._filehandle = io.open(self.path, "rt", encoding="utf-8", errors="ignore")
-        self._iterator = file_line_block_iterator(self._filehandle)
-        try:
-            if self._blocks:
-                # Skip all the lines that were already read
-                for _ in self._blocks:
-                    next(self._iterator)
-            for count_and_block_tuple in self._iterator:
-                self._blocks.append(count_and_block_tuple)
-                yield count_and_block_tuple
-        except Exception as e:
-            if config.report_readerrors:
-                logger.debug(f"Still couldn't read the file, skipping: {self.path}, {e}")
 
-        if not self._blocks and config.report_readerrors:
+        # When no lines are parsed, self.content_lines should be empty
+        if not self._iterator_blocks and not self.is_binary and config.report_readerrors:
             logger.debug(f"No utf-8 lines were read from the file, skipping {self.path}")
 
+    def read_stats(self) -> SearchPatternStats:
+        """
+        How much of the file was read so far
+        """
+        return SearchPatternStats(
+            files_opened=int(self.opened),
+            bytes_read=self.bytes_read,
+            lines_read=self.lines_read,
+            blocks_from_disk=self.blocks_from_disk,
+            blocks_from_cache=self.blocks_from_cache,
+        )
+
     def line_iterator(self) -> Iterator[Tuple[int, str]]:
         total_line_count = 0
         for _line_count, line_block in self.line_block_iterator():
@@ -328,13 +505,13 @@ class SearchFile:
                 yield total_line_count, line
 
     def close(self):
-        if self._filehandle:
-            self._filehandle.close()
+        if self._fh is not None:
+            self._fh.close()
         self._iterator = None
-        self._filehandle = None
+        self._fh = None
 
     def closed(self):
-        return bool(self._filehandle)
+        return self._fh is not None
 
     def __enter__(self):
         return self
@@ -346,31 +523,6 @@ class SearchFile:
         return {"fn": self.filename, "root": str(self.root)}
 
 
-def is_searching_in_source_dir(path: Path) -> bool:
-    """
-    Checks whether MultiQC is searching for files in the source code folder
-    """
-    multiqc_installation_dir_files = [
-        "LICENSE",
-        "CHANGELOG.md",
-        "Dockerfile",
-        "MANIFEST.in",
-        ".gitmodules",
-        "README.md",
-        "pyproject.toml",
-        ".gitignore",
-    ]
-
-    filenames = [f.name for f in path.iterdir() if f.is_file()]
-
-    if len(filenames) > 0 and all([fn in filenames for fn in multiqc_installation_dir_files]):
-        logger.error(f"Error: MultiQC is running in source code directory! {path}")
-        logger.warning("Please see the docs for how to use MultiQC: https://multiqc.info/docs/#running-multiqc")
-        return True
-    else:
-        return False
-
-
 class SearchPattern(BaseModel):
     fn: Optional[str] = None
     fn_re: Optional[re.Pattern] = None
@@ -414,42 +566,296 @@ class SearchPattern(BaseModel):
         return SearchPattern(**d)
 
 
-def prep_ordered_search_files_list(
-    sp_keys: List[ModuleId],
-) -> Tuple[List[Dict[ModuleId, List[SearchPattern]]], List[Path]]:
+_LONE_CR_RE = re.compile(r"\r(?!\n)")
+
+
+def _has_non_lf_line_breaks(block: str) -> bool:
     """
-    Prepare the searchfiles list in desired order, from easy to difficult;
-    apply ignore_dirs and ignore_paths filters.
+    Whether `str.splitlines()` would split the block on anything else than "\n" and "\r\n"
     """
+    if "\r" in block and _LONE_CR_RE.search(block):
+        return True
+    return any(c in block for c in "\x0b\x0c\x1c\x1d\x1e\x85\u2028\u2029")
+
+
+# Regex constructs that can behave differently when matching a line inside a block of lines
+# than when matching the line on its own: anchors, backreferences, lookarounds, groups with
+# names or flags
+_NOT_PREFILTERABLE_RE = re.compile(r"\\[AZ1-9]|\(\?[^:]")
+
+# Position of a search pattern: the search pattern key, and the index in its list of patterns
+SearchPatternPos = Tuple[ModuleId, int]
 
-    spatterns: List[Dict[ModuleId, List[SearchPattern]]] = [{}, {}, {}, {}, {}, {}, {}]
-    searchfiles: List[Path] = []
 
-    def _maybe_add_path_to_searchfiles(item: Path):
+class ContentMatcher:
+    """
+    The `contents` strings and `contents_re` regexes of all search patterns, prepared to
+    scan a file once for all of them, instead of once per search pattern. Built once per
+    search in `prep_ordered_search_files_list`. The per-file state of a scan is kept in a
+    `ContentScan` object.
+    """
+
+    def __init__(self, spatterns: List[Dict[ModuleId, List[SearchPattern]]]):
+        # For each string and regex, the maximum number of lines that a search pattern needs
+        # to look through, so we don't keep looking for it further down the file
+        self.strings: Dict[str, int] = {}
+        self.re_patterns: Dict[re.Pattern, int] = {}
+        # Number of lines that each search pattern with contents needs to look through
+        self.lines_needed: Dict[SearchPatternPos, int] = {}
+        for patterns in spatterns:
+            for module_id, sps in patterns.items():
+                for i, sp in enumerate(sps):
+                    num_lines = sp.num_lines or config.filesearch_lines_limit
+                    if sp.contents or sp.contents_re:
+                        self.lines_needed[(module_id, i)] = num_lines
+                    for s in sp.contents:
+                        self.strings[s] = max(self.strings.get(s, 0), num_lines)
+                    for p in sp.contents_re:
+                        self.re_patterns[p] = max(self.re_patterns.get(p, 0), num_lines)
+
+        # Strings sorted from the ones needed furthest down the file, so the ones not needed
+        # anymore can be dropped from the end of the list
+        self.strings_by_lines: List[Tuple[int, str]] = sorted(
+            ((max_lines, s) for s, max_lines in self.strings.items()), reverse=True
+        )
+        self.automaton = None
+        if ahocorasick is not None and self.strings:
+            self.automaton = ahocorasick.Automaton()
+            for s, max_lines in self.strings.items():
+                self.automaton.add_word(s, (len(s), s, max_lines))
+            self.automaton.make_automaton()
+
+        # Patterns are matched against each line with `pattern.match(line)`. Most of them can
+        # be combined into a single regex that finds the starts of lines in a block where any
+        # of them might match, so only these lines have to be checked one by one. The rest are
+        # checked on every line.
+        self.re_prefilterable: Set[re.Pattern] = {
+            p
+            for p in self.re_patterns
+            if p.flags == re.compile("").flags and not _NOT_PREFILTERABLE_RE.search(p.pattern)
+        }
+        self._re_prefilters: Dict[int, Tuple[Optional[re.Pattern], Set[re.Pattern]]] = {}
+
+    def re_prefilter(self, lines_before: int) -> Tuple[Optional[re.Pattern], Set[re.Pattern]]:
         """
-        Branching logic to handle analysis paths (directories and files)
-        Walks directory trees recursively calling pathlib's `path.iterdir()`.
-        Guaranteed to work correctly with symlinks even on non-POSIX compliant filesystems.
+        Combined regex for the patterns still needed after `lines_before` lines, and the
+        set of patterns it covers. Patterns with a low `num_lines` drop out further down
+        the file, so they don't keep flagging lines that don't need to be checked anymore.
         """
-        if item.is_symlink() and config.ignore_symlinks:
-            file_search_stats["skipped_symlinks"].add(item)
+        patterns = [p for p in self.re_prefilterable if self.re_patterns[p] > lines_before]
+        if not patterns:
+            return None, set()
+        key = min(self.re_patterns[p] for p in patterns)
+        if key not in self._re_prefilters:
+            patterns.sort(key=lambda p: p.pattern)
+            try:
+                prefilter = re.compile(
+                    "^(?=" + "|".join(f"(?:{p.pattern})" for p in patterns) + ")",
+                    re.MULTILINE,
+                )
+            except re.error as e:
+                logger.debug(f"Couldn't combine contents_re search patterns, will check them one by one: {e}")
+                self._re_prefilters[key] = (None, set())
+            else:
+                self._re_prefilters[key] = (prefilter, set(patterns))
+        return self._re_prefilters[key]
+
+
+class ContentScan:
+    """
+    Scan of a file for all strings and regexes of a `ContentMatcher`. The file is read lazily,
+    as far as the search patterns checked so far required, and the line number of the first
+    match is recorded for each string and regex.
+    """
+
+    def __init__(self, matcher: ContentMatcher, f: "SearchFile"):
+        self.matcher = matcher
+        self.f = f
+        self.lines_scanned = 0
+        self.blocks_scanned = 0
+        self.finished = False
+        self.string_lines: Dict[str, int] = {}
+        self.re_lines: Dict[re.Pattern, int] = {}
+        self._strings_left = list(matcher.strings_by_lines)
+
+    def scan(self, num_lines: int):
+        """
+        Read the file until at least `num_lines` lines are scanned, or until the end of file
+        """
+        if self.finished or self.lines_scanned >= num_lines:
             return
-        elif item.is_file():
-            searchfiles.append(item)
-        elif item.is_dir():
-            # Skip directory if it matches ignore patterns
-            d_matches = any(d for d in config.fn_ignore_dirs if item.match(d.rstrip(os.sep)))
-            p_matches = any(p for p in config.fn_ignore_paths if item.match(p.rstrip(os.sep)))
-            if d_matches or p_matches:
-                file_search_stats["skipped_directory_fn_ignore_dirs"].add(item)
+        for i, (line_count, block) in enumerate(self.f.line_block_iterator()):
+            if i < self.blocks_scanned:
+                continue  # Already scanned, coming from the block cache
+            self._scan_block(block)
+            self.lines_scanned += line_count
+            self.blocks_scanned += 1
+            if self.lines_scanned >= num_lines:
                 return
+        self.finished = True
+
+    def _scan_block(self, block: str):
+        lines_before = self.lines_scanned
+        if self.matcher.automaton is not None:
+            for end_index, (length, s, max_lines) in self.matcher.automaton.iter(block):
+                if lines_before < max_lines and s not in self.string_lines:
+                    s_index = end_index - length + 1
+                    self.string_lines[s] = lines_before + block.count("\n", 0, s_index) + 1
+        else:
+            while self._strings_left and self._strings_left[-1][0] <= lines_before:
+                self._strings_left.pop()
+            strings_left = []
+            for max_lines, s in self._strings_left:
+                s_index = block.find(s)
+                if s_index == -1:
+                    strings_left.append((max_lines, s))
+                else:
+                    self.string_lines[s] = lines_before + block.count("\n", 0, s_index) + 1
+            self._strings_left = strings_left
+
+        re_patterns = [
+            p
+            for p, max_lines in self.matcher.re_patterns.items()
+            if lines_before < max_lines and p not in self.re_lines
+        ]
+        if not re_patterns:
+            return
+        prefilter, prefiltered_set = self.matcher.re_prefilter(lines_before)
+        if prefilter is None or _has_non_lf_line_breaks(block):
+            # Lines are not the same as found by the prefilter, so check every line
+            for line_i, line in enumerate(block.splitlines(keepends=True)):
+                for p in re_patterns:
+                    if p not in self.re_lines and p.match(line):
+                        self.re_lines[p] = lines_before + line_i + 1
+            return
 
-            # Check not running in install directory
-            if is_searching_in_source_dir(item):
-                return
+        # Patterns that can't be prefiltered are checked on every line
+        unfiltered = [p for p in re_patterns if p not in prefiltered_set]
+        if unfiltered:
+            for line_i, line in enumerate(block.splitlines(keepends=True)):
+                for p in unfiltered:
+                    if p not in self.re_lines and p.match(line):
+                        self.re_lines[p] = lines_before + line_i + 1
+        prefiltered = [p for p in re_patterns if p in prefiltered_set]
+        if not prefiltered:
+            return
+        line_i = 0
+        prev_start = 0
+        for m in prefilter.finditer(block):
+            start = m.start()
+            if start == len(block):
+                break  # Empty line after the trailing newline, not a line
+            line_i += block.count("\n", prev_start, start)
+            prev_start = start
+            end = block.find("\n", start)
+            line = block[start:] if end == -1 else block[start : end + 1]
+            for p in prefiltered:
+                if p not in self.re_lines and p.match(line):
+                    self.re_lines[p] = lines_before + line_i + 1
+
+
+_GLOB_CHARS_RE = re.compile(r"[*?\[]")
+
+# Backreferences refer to the wrong group when a regex is combined with others
+_BACKREFERENCE_RE = re.compile(r"\\[1-9]|\(\?P=")
 
-            for item in item.iterdir():
-                _maybe_add_path_to_searchfiles(item)
+
+def _combine_fn_regexes(regexes: List[Tuple[re.Pattern, SearchPatternPos]]) -> Optional[re.Pattern]:
+    """
+    Combine the file name regexes into one alternation that can be used to rule all of them
+    out at once. They are matched at the start of the file name with `pattern.match(fn)`.
+    """
+    if not regexes or any(p.flags != re.compile("").flags or _BACKREFERENCE_RE.search(p.pattern) for p, _ in regexes):
+        return None
+    try:
+        return re.compile("|".join(f"(?:{p.pattern})" for p, _ in regexes))
+    except re.error as e:
+        logger.debug(f"Couldn't combine file name search patterns, will check them one by one: {e}")
+        return None
+
+
+def _match_fn_regexes(
+    fn: str, regexes: List[Tuple[re.Pattern, SearchPatternPos]], prefilter: Optional[re.Pattern]
+) -> Iterator[SearchPatternPos]:
+    if prefilter is not None and not prefilter.match(fn):
+        return
+    for p, pos in regexes:
+        if p.match(fn):
+            yield pos
+
+
+class FilenameIndex:
+    """
+    Lookup of the search patterns that can match a file by its name, so a file is only tested
+    against those, and files that no pattern can match are skipped without being read. Exact
+    file names, extensions, and suffixes (`fn: "*_suffix.txt"`) are looked up in hash tables.
+    Other globs and `fn_re` regexes are combined into a single regex to rule them all out at
+    once, and only checked one by one if it matches.
+    """
+
+    def __init__(self, spatterns: List[Dict[ModuleId, List[SearchPattern]]]):
+        self.any_name: Set[SearchPatternPos] = set()  # Patterns without `fn` or `fn_re`
+        self.exact: Dict[str, Set[SearchPatternPos]] = {}
+        self.extensions: Dict[str, Set[SearchPatternPos]] = {}
+        self.suffixes: Dict[int, Dict[str, Set[SearchPatternPos]]] = {}  # By suffix length
+        self.globs: List[Tuple[re.Pattern, SearchPatternPos]] = []  # Other globs, translated to regex
+        self.fn_res: List[Tuple[re.Pattern, SearchPatternPos]] = []
+
+        for patterns in spatterns:
+            for module_id, sps in patterns.items():
+                for i, sp in enumerate(sps):
+                    pos = (module_id, i)
+                    if sp.fn is not None:
+                        # Same as fnmatch.fnmatch(), which normalises the case on case-insensitive systems
+                        fn = os.path.normcase(sp.fn)
+                        if not _GLOB_CHARS_RE.search(fn):
+                            self.exact.setdefault(fn, set()).add(pos)
+                        elif fn.startswith("*") and fn[1:] and not _GLOB_CHARS_RE.search(fn[1:]):
+                            suffix = fn[1:]
+                            if suffix.startswith(".") and "." not in suffix[1:]:
+                                self.extensions.setdefault(suffix, set()).add(pos)
+                            else:
+                                self.suffixes.setdefault(len(suffix), {}).setdefault(suffix, set()).add(pos)
+                        else:
+                            self.globs.append((re.compile(fnmatch.translate(fn)), pos))
+                    elif sp.fn_re is not None:
+                        self.fn_res.append((sp.fn_re, pos))
+                    else:
+                        self.any_name.add(pos)
+
+        # Globs are matched against the case-normalised file name, and `fn_re` against the file
+        # name as it is, so they are combined separately
+        self.globs_prefilter = _combine_fn_regexes(self.globs)
+        self.fn_res_prefilter = _combine_fn_regexes(self.fn_res)
+
+    def candidates(self, filename: str) -> Set[SearchPatternPos]:
+        """
+        Search patterns that can match the file name
+        """
+        fn = os.path.normcase(filename)
+        found = set(self.any_name)
+        found.update(self.exact.get(fn, ()))
+        ext_start = fn.rfind(".")
+        if ext_start != -1:
+            found.update(self.extensions.get(fn[ext_start:], ()))
+        for length, by_suffix in self.suffixes.items():
+            if len(fn) >= length:
+                found.update(by_suffix.get(fn[-length:], ()))
+        found.update(_match_fn_regexes(fn, self.globs, self.globs_prefilter))
+        found.update(_match_fn_regexes(filename, self.fn_res, self.fn_res_prefilter))
+        return found
+
+
+def prep_ordered_search_files_list(
+    sp_keys: List[ModuleId],
+) -> Tuple[List[Dict[ModuleId, List[SearchPattern]]], List[Path], ContentMatcher, FilenameIndex]:
+    """
+    Prepare the searchfiles list in desired order, from easy to difficult;
+    apply ignore_dirs and ignore_paths filters. Also prepare the matcher for
+    the contents of all search patterns, and the index of their file names.
+    """
+
+    spatterns: List[Dict[ModuleId, List[SearchPattern]]] = [{}, {}, {}, {}, {}, {}, {}]
 
     ignored_patterns = []
     skipped_patterns = []
@@ -525,55 +931,77 @@ def prep_ordered_search_files_list(
         logger.debug(f"Skipping search patterns: {', '.join(skipped_patterns)}")
 
     # Go through the analysis directories and get file list in searchfiles
-    for path in analysis_files:
-        _maybe_add_path_to_searchfiles(Path(path))
-
-    return spatterns, searchfiles
+    walk = walk_analysis_paths(analysis_files, threads=config.search_walk_threads)
+    searchfiles = walk.files
+    file_search_stats["skipped_symlinks"].update(walk.skipped_symlinks)
+    file_search_stats["skipped_directory_fn_ignore_dirs"].update(walk.skipped_dirs)
+    file_walk_stats["dirs_visited"] += walk.dirs_visited
+    file_walk_stats["entries_visited"] += walk.entries_visited
+    logger.debug(f"Found {len(searchfiles)} files in {walk.dirs_visited} directories, {walk.entries_visited} entries")
+
+    return spatterns, searchfiles, ContentMatcher(spatterns), FilenameIndex(spatterns)
+
+
+def _add_file(
+    path: Path,
+    spatterns: List[Dict[ModuleId, List[SearchPattern]]],
+    matcher: ContentMatcher,
+    fn_index: FilenameIndex,
+) -> bool:
+    """
+    Function applied to each file found when walking the analysis
+    directories. Runs through all search patterns and returns True
+    if a match is found.
+    """
+    search_f = SearchFile(path)
 
+    # Only test the search patterns that can match the file name
+    candidates = set().union(*(fn_index.candidates(fn) for fn in search_f.match_filenames))
+    if not candidates:
+        file_search_stats["skipped_no_filename_match"].add(path)
+        return False
+    # Only keep the lines that the search patterns for contents need in memory. The rest of the
+    # file is streamed, e.g. when looking for `exclude_contents` through the whole file
+    search_f.max_cached_lines = max((matcher.lines_needed.get(pos, 0) for pos in candidates), default=0)
 
-def run_search_files(spatterns: List[Dict[ModuleId, List[SearchPattern]]], searchfiles: List[Path]):
-    runtimes.sp = defaultdict()
-    total_sp_starttime = time.time()
+    # Check that this is a file and not a pipe or anything weird
+    if not path.is_file():
+        file_search_stats["skipped_not_a_file"].add(path)
+        return False
 
-    def add_file(path: Path):
-        """
-        Function applied to each file found when walking the analysis
-        directories. Runs through all search patterns and returns True
-        if a match is found.
-        """
-        search_f = SearchFile(path)
+    if search_f.filesize is not None and search_f.filesize > config.log_filesize_limit:
+        file_search_stats["skipped_filesize_limit"].add(path)
+        return False
 
-        # Check that this is a file and not a pipe or anything weird
-        if not path.is_file():
-            file_search_stats["skipped_not_a_file"].add(path)
+    # Use mimetypes to exclude binary files where possible
+    if not re.match(r".+_mqc\.(png|jpg|jpeg)", search_f.filename) and config.ignore_images:
+        (ftype, encoding) = mimetypes.guess_type(str(path))
+        if encoding is not None and encoding not in compressed_files.COMPRESSION_ENCODINGS:
             return False
-
-        if search_f.filesize is not None and search_f.filesize > config.log_filesize_limit:
-            file_search_stats["skipped_filesize_limit"].add(path)
+        if ftype is not None and ftype.startswith("image"):
             return False
 
-        # Use mimetypes to exclude binary files where possible
-        if not re.match(r".+_mqc\.(png|jpg|jpeg)", search_f.filename) and config.ignore_images:
-            (ftype, encoding) = mimetypes.guess_type(str(path))
-            if encoding is not None and encoding != "gzip":
-                return False
-            if ftype is not None and ftype.startswith("image"):
-                return False
-
-        # Check if file is in ignore files
-        is_ignore_file = False
-        for ignore_pat in config.fn_ignore_files:
-            if fnmatch.fnmatch(search_f.filename, ignore_pat):
-                is_ignore_file = True
-
-        # Test file for each search pattern
-        file_matched = False
-        with search_f:  # Ensure any open filehandles are closed.
-            for patterns in spatterns:
-                for module_id, sps in patterns.items():
-                    start = time.time()
-                    for sp in sps:
-                        if search_file(sp, search_f, module_id, is_ignore_file):
+    # Check if file is in ignore files
+    is_ignore_file = False
+    for ignore_pat in config.fn_ignore_files:
+        if any(fnmatch.fnmatch(fn, ignore_pat) for fn in search_f.match_filenames):
+            is_ignore_file = True
+
+    # Test file for each search pattern
+    file_matched = False
+    scan = ContentScan(matcher, search_f)
+    with search_f:  # Ensure any open filehandles are closed.
+        for patterns in spatterns:
+            for module_id, sps in patterns.items():
+                start = time.time()
+                read_before = search_f.read_stats() if config.profile_runtime else None
+                tested = matched = False
+                try:
+                    for i, sp in enumerate(sps):
+                        if (module_id, i) not in candidates:
+                            continue
+                        tested = True
+                        if search_file(sp, search_f, module_id, is_ignore_file, scan):
                             # Check that we shouldn't exclude this file
                             if not exclude_file(sp, search_f):
                                 # Looks good! Remember this file
@@ -581,26 +1009,217 @@ def run_search_files(spatterns: List[Dict[ModuleId, List[SearchPattern]]], searc
                                     files[module_id] = []
                                 files[module_id].append(search_f.to_dict())
                                 file_search_stats[module_id] = file_search_stats.get(module_id, set()) | {path}
-                                file_matched = True
+                                file_matched = matched = True
                                 # logger.debug(f"File {f.path} matched {module_id}")
                             # Don't keep searching this file for other modules
                             if not sp.shared and module_id not in config.filesearch_file_shared:
-                                runtimes.sp[module_id] = runtimes.sp.get(module_id, 0) + (time.time() - start)
                                 return True
                             # Don't look at other patterns for this module
                             break
+                finally:
                     runtimes.sp[module_id] = runtimes.sp.get(module_id, 0) + (time.time() - start)
-        return file_matched
+                    if read_before is not None and tested:
+                        _add_search_pattern_stats(module_id, search_f, read_before, matched)
+    return file_matched
 
-    def update_fn(_, sf: Path):
-        if not add_file(sf):
-            file_search_stats["skipped_no_match"].add(sf)
 
-    iterate_using_progress_bar(
-        items=searchfiles,
-        update_fn=update_fn,
-        desc="searching",
-    )
+def _add_search_pattern_stats(
+    module_id: ModuleId,
+    search_f: SearchFile,
+    read_before: SearchPatternStats,
+    matched: bool,
+):
+    """
+    Add the work done testing a file for a search pattern key to `runtimes.sp_stats`
+    """
+    read_after = search_f.read_stats()
+    stats = runtimes.sp_stats.setdefault(module_id, SearchPatternStats())
+    stats.add(read_after, subtract=read_before)
+    stats.files_tested += 1
+    stats.matches += int(matched)
+    if read_after.files_opened and not read_before.files_opened:
+        filesize = search_f.filesize or 0
+        bucket = next(label for limit, label in FILESIZE_BUCKETS if filesize < limit)
+        runtimes.sp_filesizes[bucket] = runtimes.sp_filesizes.get(bucket, 0) + 1
+
+
+# Search results that are not cached, as file access errors can go away without the file changing
+_UNCACHED_STATS = {"skipped_not_a_file", "skipped_file_contents_search_errors"}
+
+
+def _search_path(
+    path: Path,
+    spatterns: List[Dict[ModuleId, List[SearchPattern]]],
+    matcher: ContentMatcher,
+    fn_index: FilenameIndex,
+) -> SearchResult:
+    """
+    Search a single file, and return what was found instead of adding it to `files`
+    and `file_search_stats`, so the result can be cached, or passed from a worker process
+    """
+    global files, file_search_stats
+    report_files, report_stats = files, file_search_stats
+    files, file_search_stats = {}, defaultdict(set)
+    try:
+        if not _add_file(path, spatterns, matcher, fn_index):
+            file_search_stats["skipped_no_match"].add(path)
+        return list(files), list(file_search_stats)
+    finally:
+        files, file_search_stats = report_files, report_stats
+
+
+def _add_search_result(path: Path, result: SearchResult):
+    """
+    Add the result of searching a file to `files` and `file_search_stats`
+    """
+    matched, stats = result
+    for module_id in matched:
+        files.setdefault(ModuleId(module_id), []).append({"fn": path.name, "root": str(path.parent)})
+    for key in stats:
+        file_search_stats.setdefault(key, set()).add(path)
+
+
+# Parallel search only pays off the process start-up cost with enough files per worker
+MIN_FILES_PER_SEARCH_WORKER = 100
+
+# Search patterns, contents matcher and file name index in a worker process, set by _init_search_worker
+_worker_spatterns: List[Dict[ModuleId, List[SearchPattern]]] = []
+_worker_matcher: Optional[ContentMatcher] = None
+_worker_fn_index: Optional[FilenameIndex] = None
+
+
+def _init_search_worker(
+    config_state: Dict,
+    spatterns: List[Dict[ModuleId, List[SearchPattern]]],
+    matcher: ContentMatcher,
+    fn_index: FilenameIndex,
+):
+    """
+    Initialize a worker process of the parallel file search with the config and search
+    patterns of the main process
+    """
+    global _worker_spatterns, _worker_matcher, _worker_fn_index
+    config.restore(config_state)
+    _worker_spatterns = spatterns
+    _worker_matcher = matcher
+    _worker_fn_index = fn_index
+
+
+def _search_files_chunk(paths: List[Path]) -> Tuple[List[SearchResult], Runtimes]:
+    """
+    Search a chunk of files in a worker process. Returns the result for each file, and the
+    search pattern run times and stats for the chunk, to be merged in the main process
+    """
+    global runtimes
+    runtimes = Runtimes()
+    assert _worker_matcher is not None and _worker_fn_index is not None
+    with tracing.span("search files", cat="search", n_files=len(paths)):
+        results = [_search_path(path, _worker_spatterns, _worker_matcher, _worker_fn_index) for path in paths]
+    return results, runtimes
+
+
+def _run_search_files_parallel(
+    spatterns: List[Dict[ModuleId, List[SearchPattern]]],
+    searchfiles: List[Path],
+    matcher: ContentMatcher,
+    fn_index: FilenameIndex,
+    n_workers: int,
+) -> List[SearchResult]:
+    """
+    Search files in a pool of worker processes. The files are split into contiguous chunks, and
+    the results are returned in the order of `searchfiles`, so that adding them to `report.files`
+    gives exactly the same as a serial search.
+    """
+    # Several chunks per worker to balance the load, and to have a meaningful progress bar
+    chunk_size = math.ceil(len(searchfiles) / (n_workers * 16))
+    chunks = [searchfiles[i : i + chunk_size] for i in range(0, len(searchfiles), chunk_size)]
+    logger.debug(f"Searching {len(searchfiles)} files in {n_workers} processes")
+
+    all_results: List[SearchResult] = []
+    with concurrent.futures.ProcessPoolExecutor(
+        max_workers=n_workers,
+        initializer=_init_search_worker,
+        initargs=(config.snapshot(), spatterns, matcher, fn_index),
+    ) as executor:
+        chunk_results = executor.map(_search_files_chunk, chunks)
+
+        def update_fn(_, __):
+            results, chunk_runtimes = next(chunk_results)
+            all_results.extend(results)
+            runtimes.add_search(chunk_runtimes)
+
+        iterate_using_progress_bar(
+            items=chunks,
+            update_fn=update_fn,
+            item_to_str_fn=lambda chunk: str(chunk[0]),
+            desc="searching",
+        )
+    return all_results
+
+
+def run_search_files(
+    spatterns: List[Dict[ModuleId, List[SearchPattern]]],
+    searchfiles: List[Path],
+    matcher: Optional[ContentMatcher] = None,
+    fn_index: Optional[FilenameIndex] = None,
+):
+    if matcher is None:
+        matcher = ContentMatcher(spatterns)
+    if fn_index is None:
+        fn_index = FilenameIndex(spatterns)
+    runtimes.sp = defaultdict()
+    runtimes.sp_stats = {}
+    runtimes.sp_filesizes = {}
+    total_sp_starttime = time.time()
+
+    if config.search_cache_reset:
+        search_cache.reset()
+    cache: Optional[search_cache.SearchCache] = None
+    if config.search_cache:
+        cache = search_cache.SearchCache.open(search_cache.search_fingerprint(spatterns))
+
+    # Look up unchanged files in the cache, and only search the rest
+    results: List[Optional[SearchResult]] = [None] * len(searchfiles)
+    cache_keys: List[Optional[Tuple[str, int, int]]] = [None] * len(searchfiles)
+    if cache is not None:
+        for i, path in enumerate(searchfiles):
+            cache_keys[i] = cache_key = cache.file_key(path)
+            if cache_key is not None:
+                results[i] = cache.get(cache_key)
+    to_search = [i for i, result in enumerate(results) if result is None]
+
+    n_workers = min(config.search_workers or 1, len(to_search) // MIN_FILES_PER_SEARCH_WORKER)
+    if n_workers > 1:
+        found = _run_search_files_parallel(spatterns, [searchfiles[i] for i in to_search], matcher, fn_index, n_workers)
+        for i, result in zip(to_search, found):
+            results[i] = result
+    else:
+
+        def update_fn(_, i: int):
+            results[i] = _search_path(searchfiles[i], spatterns, matcher, fn_index)
+
+        iterate_using_progress_bar(
+            items=to_search,
+            update_fn=update_fn,
+            item_to_str_fn=lambda i: str(searchfiles[i]),
+            desc="searching",
+        )
+
+    for path, search_result in zip(searchfiles, results):
+        assert search_result is not None
+        _add_search_result(path, search_result)
+
+    if cache is not None:
+        for i in to_search:
+            cache_key = cache_keys[i]
+            new_result: Optional[SearchResult] = results[i]
+            if cache_key is not None and new_result is not None and not _UNCACHED_STATS.intersection(new_result[1]):
+                cache.add(cache_key, new_result)
+        logger.debug(
+            f"File search cache: {cache.hits} files unchanged since the previous run, searched {len(to_search)} files"
+        )
+        cache.save()
+        cache.close()
 
     runtimes.total_sp = time.time() - total_sp_starttime
     if config.profile_runtime:
@@ -623,14 +1242,22 @@ def search_files(sp_keys):
     if not analysis_files:
         raise NoAnalysisFound("No analysis files found to search")
 
-    spatterns, searchfiles = prep_ordered_search_files_list(sp_keys)
+    spatterns, searchfiles, matcher, fn_index = prep_ordered_search_files_list(sp_keys)
 
-    run_search_files(spatterns, searchfiles)
+    run_search_files(spatterns, searchfiles, matcher, fn_index)
 
 
-def search_file(pattern: SearchPattern, f: SearchFile, module_key: ModuleId, is_ignore_file: bool = False):
+def search_file(
+    pattern: SearchPattern,
+    f: SearchFile,
+    module_key: ModuleId,
+    is_ignore_file: bool = False,
+    scan: Optional[ContentScan] = None,
+):
     """
-    Function to search a single file for a single search pattern.
+    Function to search a single file for a single search pattern. Contents are
+    looked up in `scan`, which is shared between all search patterns tested on
+    the file, so the file is only scanned once.
     """
 
     global file_search_stats
@@ -641,14 +1268,14 @@ def search_file(pattern: SearchPattern, f: SearchFile, module_key: ModuleId, is_
             file_search_stats["skipped_module_specific_max_filesize"].add(f.path)
             return False
 
-    # Search by file name (glob)
+    # Search by file name (glob). Compressed files also match by the name without the compression extension
     if pattern.fn is not None:
-        if not fnmatch.fnmatch(f.filename, pattern.fn):
+        if not any(fnmatch.fnmatch(fn, pattern.fn) for fn in f.match_filenames):
             return False
 
     # Search by file name (regex)
     if pattern.fn_re is not None:
-        if not re.match(pattern.fn_re, f.filename):
+        if not any(re.match(pattern.fn_re, fn) for fn in f.match_filenames):
             return False
 
     # If we only had fn and fn_re, can assume matching is done:
@@ -663,44 +1290,17 @@ def search_file(pattern: SearchPattern, f: SearchFile, module_key: ModuleId, is_
     # Search by file contents
     num_lines = pattern.num_lines or config.filesearch_lines_limit
 
-    total_lines = 0
-    query_strings = pattern.contents
-    query_re_patterns = pattern.contents_re
-    match_strings: Set[str] = set()
-    match_re_patterns: Set[re.Pattern] = set()
+    if scan is None:
+        scan = ContentScan(ContentMatcher([{module_key: [pattern]}]), f)
     try:
-        for line_count, block in f.line_block_iterator():
-            for q_string in query_strings:
-                if q_string in block:
-                    if total_lines + line_count > num_lines:
-                        # We read more lines than requested and the match may
-                        # be in a part of the file that shouldn't be read.
-                        # Test how many lines preceed the match to see if there
-                        # was overshoot.
-                        s_index = block.index(q_string)
-                        lines_including_match = block[:s_index].count("\n") + 1
-                        if total_lines + lines_including_match <= num_lines:
-                            match_strings.add(q_string)
-                    else:
-                        match_strings.add(q_string)
-                    if len(match_strings) == len(query_strings):  # all strings matched
-                        break
-            for q_pattern in query_re_patterns:
-                # Limit the number of lines to the amount of lines that should remain
-                for line in block.splitlines(keepends=True)[: num_lines - total_lines]:
-                    if q_pattern.match(line):
-                        match_re_patterns.add(q_pattern)
-                        if len(match_re_patterns) == len(query_re_patterns):  # all strings matched
-                            break
-            total_lines += line_count
-            if total_lines >= num_lines:
-                break
+        scan.scan(num_lines)
     except Exception:
         file_search_stats["skipped_file_contents_search_errors"].add(f.path)
         return False
 
-    strings_match = not query_strings or len(match_strings) == len(query_strings)
-    re_patterns_match = not query_re_patterns or len(match_re_patterns) == len(query_re_patterns)
+    # Match if the first occurrence of each string and regex is within the first num_lines lines
+    strings_match = all(scan.string_lines.get(s, num_lines + 1) <= num_lines for s in pattern.contents)
+    re_patterns_match = all(scan.re_lines.get(p, num_lines + 1) <= num_lines for p in pattern.contents_re)
     return strings_match and re_patterns_match
 
 
@@ -712,15 +1312,17 @@ def exclude_file(sp, f: SearchFile):
 
     # Search by file name (glob)
     for pat in sp.exclude_fn:
-        if pat and fnmatch.fnmatch(f.filename, pat):
+        if pat and any(fnmatch.fnmatch(fn, pat) for fn in f.match_filenames):
             return True
 
     # Search by file name (regex)
     for pat in sp.exclude_fn_re:
-        if pat and re.match(pat, f.filename):
+        if pat and any(re.match(pat, fn) for fn in f.match_filenames):
             return True
 
     # Search the contents of the file
+    if not sp.exclude_contents and not sp.exclude_contents_re:
+        return False
     for num_lines, line_block in f.line_block_iterator():
         if sp.exclude_contents:
             for pat in sp.exclude_contents:
@@ -841,19 +1443,68 @@ def save_htmlid(html_id, skiplint=False, scope: Optional[str] = None) -> str:
     return html_id_clean
 
 
-def compress_json(data):
+def compress_json(data, new_compressor: Optional[Callable[[], plot_data_compression.Compressor]] = None) -> str:
+    """
+    Take a Python data object. Convert to JSON and compress with `config.plot_data_compression`,
+    gzip by default, or with a compressor made by `new_compressor`. Represent in base64 format.
+    """
+    return "".join(iter_compressed_json(data, new_compressor))
+
+
+# Bytes of JSON to collect before passing them on to the compressor
+COMPRESS_JSON_CHUNK_SIZE = 1024 * 1024
+
+
+def iter_compressed_json(
+    data,
+    new_compressor: Optional[Callable[[], plot_data_compression.Compressor]] = None,
+    chunk_size: int = COMPRESS_JSON_CHUNK_SIZE,
+) -> Iterator[str]:
+    """
+    Like `compress_json`, but yield the base64 text in pieces. The JSON is encoded, compressed and
+    base64-encoded in a single pass, so only about `chunk_size` bytes of JSON are held at a time,
+    besides the largest value that `iter_json` encodes in one go.
+    """
+    compressor = (new_compressor or plot_data_compression.compressor_factory())()
+    leftover = b""  # compressed bytes that don't make a full base64 quantum of 3 bytes yet
+
+    def _b64(compressed: bytes) -> str:
+        nonlocal leftover
+        compressed = leftover + compressed
+        n = len(compressed) - len(compressed) % 3
+        leftover = compressed[n:]
+        return base64.b64encode(compressed[:n]).decode("ascii")
+
+    pieces: List[str] = []
+    size = 0
+    for piece in iter_json(data):
+        pieces.append(piece)
+        size += len(piece)
+        if size >= chunk_size:
+            out = _b64(compressor.compress("".join(pieces).encode("utf-8")))
+            pieces, size = [], 0
+            if out:
+                yield out
+    out = _b64(compressor.compress("".join(pieces).encode("utf-8")) + compressor.flush())
+    yield out + base64.b64encode(leftover).decode("ascii")
+
+
+def iter_compressed_plot_data(
+    plot_data: Mapping[Anchor, Any],
+    new_compressor: Callable[[], plot_data_compression.Compressor],
+) -> Iterator[str]:
     """
-    Take a Python data object. Convert to JSON and compress using gzip.
-    Represent in base64 format.
+    Yield the JSON index of the plot data embedded in the report, with the data of each plot compressed
+    independently with `iter_compressed_json` by a compressor made by `new_compressor`, keyed by plot
+    anchor: {"<anchor>": "<base64>", ...}. The report JavaScript only decompresses a plot's data when
+    the plot is first rendered.
     """
-    # Stream to an in-memory buffer rather than compressing the big string
-    # at once. This saves memory.
-    buffer = io.BytesIO()
-    with gzip.open(buffer, "wt", encoding="utf-8", compresslevel=6) as gzip_buffer:
-        # The compression level 6 gives 10% speed gain vs. 2% extra size, in contrast to default compresslevel=9
-        dump_json(data, gzip_buffer)
-    base64_bytes = base64.b64encode(buffer.getvalue())
-    return base64_bytes.decode("ascii")
+    yield "{"
+    for i, (anchor, data) in enumerate(plot_data.items()):
+        yield ("," if i else "") + json.dumps(str(anchor)) + ':"'
+        yield from iter_compressed_json(data, new_compressor)
+        yield '"'
+    yield "}"
 
 
 def write_data_file(
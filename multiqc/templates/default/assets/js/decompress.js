@@ -1,8 +1,24 @@
-function decompressPlotData(base64Str, callback) {
+function decompressPlotData(base64Str, compression, callback) {
   // Decode the Base64 string to bytes.
   const binaryString = atob(base64Str);
   const bytes = Uint8Array.from(binaryString, (m) => m.codePointAt(0));
 
+  // Uncompressed plot data, written with `plot_data_compression: none`
+  if (compression === "none") {
+    decompressUsing((b) => b, "none", bytes, callback);
+    return;
+  }
+
+  // zstd and brotli: browsers can't decode them natively, the decoders are included with the report
+  if (compression === "zstd") {
+    decompressUsing(zstdDecompress, "zstd", bytes, callback);
+    return;
+  }
+  if (compression === "brotli") {
+    decompressUsing(brotliDecompress, "brotli", bytes, callback);
+    return;
+  }
+
   // Check if DecompressionStream is supported
   if ("DecompressionStream" in window) {
     // Passing a callback to work around that DecompressionStream is async
@@ -36,6 +52,15 @@ function decompressUsingDecompressionStream(bytes, callback) {
     });
 }
 
+function decompressUsing(decompress, name, bytes, callback) {
+  try {
+    callback(decodeDecompressedBytes(decompress(bytes)), null);
+  } catch (error) {
+    console.error("Decompression with " + name + " failed:", error);
+    callback(null, error);
+  }
+}
+
 function decompressUsingPako(bytes, callback) {
   try {
     const decompressedBytes = pako.inflate(bytes);
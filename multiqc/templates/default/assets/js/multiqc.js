@@ -2,7 +2,8 @@
 // Base JS for MultiQC Reports
 ////////////////////////////////////////////////
 
-// Collect functions to be called after plot data is decompressed.
+// Collect functions to be called once the report is loaded. The plot data isn't decompressed at this
+// point: it's decompressed for each plot when the plot is first rendered, see loadPlot() in plotting.js.
 // Includes functions in plotting.js, and any module-specific JS like multiqc_fastqc.js
 let callAfterDecompressed = [];
 
@@ -0,0 +1,523 @@
+/*! Zstandard decoder for MultiQC reports (RFC 8878). Decoding tables from the zstd reference
+    implementation, Copyright (c) Meta Platforms, Inc. and affiliates @license BSD-3-Clause */
+
+// Decompress a Zstandard stream of one or more frames: zstdDecompress(Uint8Array) -> Uint8Array.
+// Supports everything the reference encoder writes without a dictionary, the checksum is not verified.
+var zstdDecompress = (function () {
+  "use strict";
+
+  // Baselines and numbers of extra bits of the literals length and match length codes
+  const LL_BASE = [
+    0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15, 16, 18, 20, 22, 24, 28, 32, 40, 48, 64, 128, 256, 512, 1024,
+    2048, 4096, 8192, 16384, 32768, 65536,
+  ];
+  const LL_BITS = [
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 1, 1, 1, 2, 2, 3, 3, 4, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15, 16,
+  ];
+  const ML_BASE = [
+    3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15, 16, 17, 18, 19, 20, 21, 22, 23, 24, 25, 26, 27, 28, 29, 30, 31, 32, 33,
+    34, 35, 37, 39, 41, 43, 47, 51, 59, 67, 83, 99, 131, 259, 515, 1027, 2051, 4099, 8195, 16387, 32771, 65539,
+  ];
+  const ML_BITS = [
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 1, 1, 1, 2, 2, 3,
+    3, 4, 4, 5, 7, 8, 9, 10, 11, 12, 13, 14, 15, 16,
+  ];
+
+  // Predefined distributions of the sequence codes, with their accuracy logs
+  const LL_DEFAULT_NORM = [
+    4, 3, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 1, 1, 1, 2, 2, 2, 2, 2, 2, 2, 2, 2, 3, 2, 1, 1, 1, 1, 1, -1, -1, -1, -1,
+  ];
+  const ML_DEFAULT_NORM = [
+    1, 4, 3, 2, 2, 2, 2, 2, 2, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, -1, -1, -1, -1, -1, -1, -1,
+  ];
+  const OF_DEFAULT_NORM = [1, 1, 1, 1, 1, 1, 2, 2, 2, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, -1, -1, -1, -1, -1];
+
+  function fail(message) {
+    throw new Error("Invalid zstd data: " + message);
+  }
+
+  function highBit(n) {
+    return 31 - Math.clz32(n);
+  }
+
+  // Growable output buffer, as the decompressed size is not always known upfront
+  class Output {
+    constructor(size) {
+      this.buf = new Uint8Array(Math.max(size, 1024));
+      this.len = 0;
+    }
+    reserve(n) {
+      if (this.len + n > this.buf.length) {
+        const buf = new Uint8Array(Math.max(this.buf.length * 2, this.len + n));
+        buf.set(this.buf.subarray(0, this.len));
+        this.buf = buf;
+      }
+    }
+    append(bytes) {
+      this.reserve(bytes.length);
+      this.buf.set(bytes, this.len);
+      this.len += bytes.length;
+    }
+    copyMatch(offset, length) {
+      if (offset > this.len || offset === 0) fail("match offset out of range");
+      this.reserve(length);
+      const buf = this.buf;
+      let src = this.len - offset;
+      let dst = this.len;
+      if (offset >= length) {
+        buf.copyWithin(dst, src, src + length);
+      } else {
+        // Overlapping match: repeats the last `offset` bytes
+        for (let i = 0; i < length; i++) buf[dst++] = buf[src++];
+      }
+      this.len += length;
+    }
+  }
+
+  // Reads bits from the end of a byte range backwards, as the FSE and Huffman bitstreams are written
+  class BackwardBitReader {
+    constructor(data, start, end) {
+      if (end <= start) fail("empty bitstream");
+      const last = data[end - 1];
+      if (last === 0) fail("missing bitstream end mark");
+      this.data = data;
+      this.start = start;
+      this.end = end;
+      // Number of bits not read yet, below the end mark
+      this.pos = (end - start - 1) * 8 + highBit(last);
+    }
+    // Up to 24 bits starting at bit position `pos` from the start, bits before the start read as zeros
+    _bits(pos, n) {
+      if (n <= 0) return 0;
+      if (pos < 0) return this._bits(0, n + pos) << -pos;
+      const i = this.start + (pos >> 3);
+      const d = this.data;
+      const word = d[i] | ((i + 1 < this.end ? d[i + 1] : 0) << 8) | ((i + 2 < this.end ? d[i + 2] : 0) << 16) |
+        ((i + 3 < this.end ? d[i + 3] : 0) << 24);
+      return (word >>> (pos & 7)) & ((1 << n) - 1);
+    }
+    read(n) {
+      this.pos -= n;
+      if (n <= 24) return this._bits(this.pos, n);
+      return this._bits(this.pos + 24, n - 24) * 0x1000000 + this._bits(this.pos, 24);
+    }
+    peek(n) {
+      return this._bits(this.pos - n, n);
+    }
+    skip(n) {
+      this.pos -= n;
+    }
+    overflowed() {
+      return this.pos < 0;
+    }
+  }
+
+  // Reads the normalized probabilities of an FSE table description. Returns [probabilities, accuracy log, bytes read]
+  function readFseDescription(data, start, end, maxSymbol, maxLog) {
+    let bitPos = 0;
+    const read = (n) => {
+      let value = 0;
+      for (let i = 0; i < n; i++, bitPos++) {
+        const byte = start + (bitPos >> 3);
+        if (byte >= end) fail("truncated FSE table description");
+        value |= ((data[byte] >> (bitPos & 7)) & 1) << i;
+      }
+      return value;
+    };
+    const accuracyLog = read(4) + 5;
+    if (accuracyLog > maxLog) fail("FSE accuracy log too large");
+    const norm = [];
+    let remaining = (1 << accuracyLog) + 1;
+    let threshold = 1 << accuracyLog;
+    let nbBits = accuracyLog + 1;
+    while (remaining > 1) {
+      if (norm.length > maxSymbol) fail("too many FSE symbols");
+      const max = 2 * threshold - 1 - remaining;
+      let count;
+      const low = read(nbBits - 1);
+      if (low < max) {
+        count = low;
+      } else {
+        count = low | (read(1) << (nbBits - 1));
+        if (count >= threshold) count -= max;
+      }
+      count--;
+      remaining -= Math.abs(count);
+      norm.push(count);
+      if (count === 0) {
+        // Repeat flags: number of following symbols that are also zero
+        for (;;) {
+          const repeat = read(2);
+          for (let i = 0; i < repeat; i++) norm.push(0);
+          if (repeat !== 3) break;
+        }
+      }
+      while (remaining < threshold) {
+        nbBits--;
+        threshold >>= 1;
+      }
+    }
+    if (remaining !== 1) fail("FSE probabilities don't add up");
+    return [norm, accuracyLog, (bitPos + 7) >> 3];
+  }
+
+  // FSE decoding table: symbol, number of bits to read and baseline of the next state for each state
+  function buildFseTable(norm, accuracyLog) {
+    const size = 1 << accuracyLog;
+    const symbol = new Uint8Array(size);
+    const nbBits = new Uint8Array(size);
+    const baseline = new Uint16Array(size);
+    const next = new Uint16Array(norm.length);
+    let high = size - 1;
+    for (let s = 0; s < norm.length; s++) {
+      if (norm[s] === -1) {
+        symbol[high--] = s;
+        next[s] = 1;
+      }
+    }
+    const step = (size >> 1) + (size >> 3) + 3;
+    let pos = 0;
+    for (let s = 0; s < norm.length; s++) {
+      if (norm[s] <= 0) continue;
+      next[s] = norm[s];
+      for (let i = 0; i < norm[s]; i++) {
+        symbol[pos] = s;
+        do pos = (pos + step) & (size - 1);
+        while (pos > high);
+      }
+    }
+    if (pos !== 0) fail("invalid FSE distribution");
+    for (let u = 0; u < size; u++) {
+      const state = next[symbol[u]]++;
+      nbBits[u] = accuracyLog - highBit(state);
+      baseline[u] = (state << nbBits[u]) - size;
+    }
+    return { accuracyLog, symbol, nbBits, baseline };
+  }
+
+  function rleFseTable(s) {
+    return { accuracyLog: 0, symbol: Uint8Array.of(s), nbBits: Uint8Array.of(0), baseline: Uint16Array.of(0) };
+  }
+
+  const LL_DEFAULT_TABLE = buildFseTable(LL_DEFAULT_NORM, 6);
+  const ML_DEFAULT_TABLE = buildFseTable(ML_DEFAULT_NORM, 6);
+  const OF_DEFAULT_TABLE = buildFseTable(OF_DEFAULT_NORM, 5);
+
+  // Huffman decoding table for the weights of the literals, indexed by the next `maxBits` bits
+  function buildHuffmanTable(weights) {
+    let total = 0;
+    for (const w of weights) if (w > 0) total += 1 << (w - 1);
+    if (total === 0) fail("empty Huffman weights");
+    const maxBits = highBit(total) + 1;
+    const left = (1 << maxBits) - total;
+    if (left & (left - 1)) fail("invalid Huffman weights");
+    // The weight of the last symbol is implied by the others
+    weights.push(highBit(left) + 1);
+    if (maxBits > 11) fail("Huffman codes too long");
+    const size = 1 << maxBits;
+    const symbol = new Uint8Array(size);
+    const nbBits = new Uint8Array(size);
+    let pos = 0;
+    for (let w = 1; w <= maxBits; w++) {
+      for (let s = 0; s < weights.length; s++) {
+        if (weights[s] !== w) continue;
+        const n = 1 << (w - 1);
+        symbol.fill(s, pos, pos + n);
+        nbBits.fill(maxBits + 1 - w, pos, pos + n);
+        pos += n;
+      }
+    }
+    return { maxBits, symbol, nbBits };
+  }
+
+  // Reads a Huffman tree description. Returns [table, bytes read]
+  function readHuffmanTable(data, start, end) {
+    const header = data[start];
+    const weights = [];
+    if (header >= 128) {
+      // Weights written directly, 4 bits each
+      const n = header - 127;
+      const size = (n + 1) >> 1;
+      if (start + 1 + size > end) fail("truncated Huffman weights");
+      for (let i = 0; i < n; i++) {
+        const byte = data[start + 1 + (i >> 1)];
+        weights.push(i & 1 ? byte & 15 : byte >> 4);
+      }
+      return [buildHuffmanTable(weights), 1 + size];
+    }
+    // Weights compressed with FSE, decoded with two interleaved states
+    const wEnd = start + 1 + header;
+    if (wEnd > end) fail("truncated Huffman weights");
+    const [norm, accuracyLog, descSize] = readFseDescription(data, start + 1, wEnd, 255, 6);
+    const table = buildFseTable(norm, accuracyLog);
+    const bits = new BackwardBitReader(data, start + 1 + descSize, wEnd);
+    let state1 = bits.read(accuracyLog);
+    let state2 = bits.read(accuracyLog);
+    for (;;) {
+      if (weights.length > 255) fail("too many Huffman weights");
+      weights.push(table.symbol[state1]);
+      state1 = table.baseline[state1] + bits.read(table.nbBits[state1]);
+      if (bits.overflowed()) {
+        weights.push(table.symbol[state2]);
+        break;
+      }
+      weights.push(table.symbol[state2]);
+      state2 = table.baseline[state2] + bits.read(table.nbBits[state2]);
+      if (bits.overflowed()) {
+        weights.push(table.symbol[state1]);
+        break;
+      }
+    }
+    return [buildHuffmanTable(weights), 1 + header];
+  }
+
+  function decodeHuffmanStream(huffman, data, start, end, out, outPos, count) {
+    const bits = new BackwardBitReader(data, start, end);
+    const { maxBits, symbol, nbBits } = huffman;
+    for (let i = 0; i < count; i++) {
+      const index = bits.peek(maxBits);
+      out[outPos + i] = symbol[index];
+      bits.skip(nbBits[index]);
+    }
+    if (bits.pos !== 0) fail("corrupted Huffman stream");
+  }
+
+  // Decodes the literals section of a compressed block. Returns [literals, bytes read]
+  function readLiterals(data, start, end, frame) {
+    const b0 = data[start];
+    const type = b0 & 3;
+    const sizeFormat = (b0 >> 2) & 3;
+    if (type < 2) {
+      // Raw or RLE literals
+      let size, headerSize;
+      if (sizeFormat === 0 || sizeFormat === 2) {
+        size = b0 >> 3;
+        headerSize = 1;
+      } else if (sizeFormat === 1) {
+        size = (b0 >> 4) + (data[start + 1] << 4);
+        headerSize = 2;
+      } else {
+        size = (b0 >> 4) + (data[start + 1] << 4) + (data[start + 2] << 12);
+        headerSize = 3;
+      }
+      if (type === 0) {
+        if (start + headerSize + size > end) fail("truncated literals");
+        return [data.subarray(start + headerSize, start + headerSize + size), headerSize + size];
+      }
+      return [new Uint8Array(size).fill(data[start + headerSize]), headerSize + 1];
+    }
+
+    // Huffman compressed literals, with a new tree or the one of the previous block
+    let regenerated, compressed, headerSize;
+    const streams = sizeFormat === 0 ? 1 : 4;
+    if (sizeFormat < 2) {
+      const v = b0 | (data[start + 1] << 8) | (data[start + 2] << 16);
+      regenerated = (v >> 4) & 0x3ff;
+      compressed = (v >> 14) & 0x3ff;
+      headerSize = 3;
+    } else if (sizeFormat === 2) {
+      const v = (b0 | (data[start + 1] << 8) | (data[start + 2] << 16) | (data[start + 3] << 24)) >>> 0;
+      regenerated = (v >>> 4) & 0x3fff;
+      compressed = (v >>> 18) & 0x3fff;
+      headerSize = 4;
+    } else {
+      regenerated = (b0 >> 4) | (data[start + 1] << 4) | ((data[start + 2] & 0x3f) << 12);
+      compressed = (data[start + 2] >> 6) | (data[start + 3] << 2) | (data[start + 4] << 10);
+      headerSize = 5;
+    }
+    let pos = start + headerSize;
+    const litEnd = pos + compressed;
+    if (litEnd > end) fail("truncated literals");
+    if (type === 2) {
+      const [table, size] = readHuffmanTable(data, pos, litEnd);
+      frame.huffman = table;
+      pos += size;
+    } else if (!frame.huffman) {
+      fail("missing Huffman tree");
+    }
+    const literals = new Uint8Array(regenerated);
+    if (streams === 1) {
+      decodeHuffmanStream(frame.huffman, data, pos, litEnd, literals, 0, regenerated);
+    } else {
+      const size1 = data[pos] | (data[pos + 1] << 8);
+      const size2 = data[pos + 2] | (data[pos + 3] << 8);
+      const size3 = data[pos + 4] | (data[pos + 5] << 8);
+      pos += 6;
+      const perStream = (regenerated + 3) >> 2;
+      const ends = [pos + size1, pos + size1 + size2, pos + size1 + size2 + size3, litEnd];
+      if (ends[2] > litEnd) fail("invalid jump table");
+      let streamStart = pos;
+      for (let i = 0; i < 4; i++) {
+        const count = i < 3 ? perStream : regenerated - 3 * perStream;
+        decodeHuffmanStream(frame.huffman, data, streamStart, ends[i], literals, i * perStream, count);
+        streamStart = ends[i];
+      }
+    }
+    return [literals, litEnd - start];
+  }
+
+  // Reads the FSE table of a sequence code in the given mode. Returns the number of bytes read
+  function readSequenceTable(data, pos, end, mode, frame, key, defaultTable, maxSymbol, maxLog) {
+    if (mode === 0) {
+      frame[key] = defaultTable;
+      return 0;
+    }
+    if (mode === 1) {
+      if (pos >= end) fail("truncated sequences header");
+      frame[key] = rleFseTable(data[pos]);
+      return 1;
+    }
+    if (mode === 2) {
+      const [norm, accuracyLog, size] = readFseDescription(data, pos, end, maxSymbol, maxLog);
+      frame[key] = buildFseTable(norm, accuracyLog);
+      return size;
+    }
+    if (!frame[key]) fail("missing sequence table to repeat");
+    return 0;
+  }
+
+  function decodeBlock(data, start, end, frame, out) {
+    const [literals, literalsSize] = readLiterals(data, start, end, frame);
+    let pos = start + literalsSize;
+
+    // Sequences section header
+    if (pos >= end) fail("truncated sequences section");
+    let nbSeq = data[pos++];
+    if (nbSeq >= 128) {
+      if (nbSeq === 255) {
+        nbSeq = data[pos] + (data[pos + 1] << 8) + 0x7f00;
+        pos += 2;
+      } else {
+        nbSeq = ((nbSeq - 128) << 8) + data[pos++];
+      }
+    }
+    if (nbSeq === 0) {
+      out.append(literals);
+      return;
+    }
+    const modes = data[pos++];
+    pos += readSequenceTable(data, pos, end, modes >> 6, frame, "llTable", LL_DEFAULT_TABLE, 35, 9);
+    pos += readSequenceTable(data, pos, end, (modes >> 4) & 3, frame, "ofTable", OF_DEFAULT_TABLE, 31, 8);
+    pos += readSequenceTable(data, pos, end, (modes >> 2) & 3, frame, "mlTable", ML_DEFAULT_TABLE, 52, 9);
+
+    const ll = frame.llTable;
+    const of = frame.ofTable;
+    const ml = frame.mlTable;
+    const bits = new BackwardBitReader(data, pos, end);
+    let llState = bits.read(ll.accuracyLog);
+    let ofState = bits.read(of.accuracyLog);
+    let mlState = bits.read(ml.accuracyLog);
+    const rep = frame.repeatOffsets;
+    let litPos = 0;
+    for (let i = 0; i < nbSeq; i++) {
+      const ofCode = of.symbol[ofState];
+      const mlCode = ml.symbol[mlState];
+      const llCode = ll.symbol[llState];
+      if (ofCode > 31 || mlCode > 52 || llCode > 35) fail("invalid sequence code");
+      let offsetValue = 2 ** ofCode + bits.read(ofCode);
+      const matchLength = ML_BASE[mlCode] + bits.read(ML_BITS[mlCode]);
+      const literalsLength = LL_BASE[llCode] + bits.read(LL_BITS[llCode]);
+
+      // Repeat offsets
+      let offset;
+      if (offsetValue > 3) {
+        offset = offsetValue - 3;
+        rep[2] = rep[1];
+        rep[1] = rep[0];
+        rep[0] = offset;
+      } else {
+        if (literalsLength === 0) offsetValue++;
+        if (offsetValue === 1) {
+          offset = rep[0];
+        } else {
+          offset = offsetValue === 4 ? rep[0] - 1 : rep[offsetValue - 1];
+          if (offsetValue !== 2) rep[2] = rep[1];
+          rep[1] = rep[0];
+          rep[0] = offset;
+        }
+      }
+
+      if (litPos + literalsLength > literals.length) fail("literals out of range");
+      out.append(literals.subarray(litPos, litPos + literalsLength));
+      litPos += literalsLength;
+      out.copyMatch(offset, matchLength);
+
+      if (i < nbSeq - 1) {
+        llState = ll.baseline[llState] + bits.read(ll.nbBits[llState]);
+        mlState = ml.baseline[mlState] + bits.read(ml.nbBits[mlState]);
+        ofState = of.baseline[ofState] + bits.read(of.nbBits[ofState]);
+      }
+    }
+    if (bits.pos !== 0) fail("corrupted sequences bitstream");
+    out.append(literals.subarray(litPos));
+  }
+
+  // Decodes a frame into `out`. Returns the position after the frame
+  function decodeFrame(data, pos, out) {
+    const descriptor = data[pos++];
+    const fcsFlag = descriptor >> 6;
+    const singleSegment = (descriptor >> 5) & 1;
+    const hasChecksum = (descriptor >> 2) & 1;
+    const dictIdFlag = descriptor & 3;
+    if (descriptor & 8) fail("reserved frame header bit set");
+    if (!singleSegment) pos++; // window descriptor, the whole output is kept in memory anyway
+    const dictIdSize = [0, 1, 2, 4][dictIdFlag];
+    let dictId = 0;
+    for (let i = 0; i < dictIdSize; i++) dictId += data[pos++] * 2 ** (8 * i);
+    if (dictId !== 0) fail("dictionaries are not supported");
+    const fcsSize = [singleSegment, 2, 4, 8][fcsFlag];
+    let contentSize = 0;
+    for (let i = 0; i < fcsSize; i++) contentSize += data[pos + i] * 2 ** (8 * i);
+    if (fcsSize === 2) contentSize += 256;
+    pos += fcsSize;
+    if (fcsSize) out.reserve(contentSize);
+
+    const frame = { huffman: null, llTable: null, ofTable: null, mlTable: null, repeatOffsets: [1, 4, 8] };
+    for (;;) {
+      if (pos + 3 > data.length) fail("truncated block header");
+      const header = data[pos] | (data[pos + 1] << 8) | (data[pos + 2] << 16);
+      pos += 3;
+      const last = header & 1;
+      const type = (header >> 1) & 3;
+      const size = header >> 3;
+      if (type === 0) {
+        if (pos + size > data.length) fail("truncated raw block");
+        out.append(data.subarray(pos, pos + size));
+        pos += size;
+      } else if (type === 1) {
+        out.reserve(size);
+        out.buf.fill(data[pos], out.len, out.len + size);
+        out.len += size;
+        pos += 1;
+      } else if (type === 2) {
+        if (pos + size > data.length) fail("truncated compressed block");
+        decodeBlock(data, pos, pos + size, frame, out);
+        pos += size;
+      } else {
+        fail("reserved block type");
+      }
+      if (last) break;
+    }
+    return pos + (hasChecksum ? 4 : 0);
+  }
+
+  return function zstdDecompress(data) {
+    const out = new Output(data.length * 4);
+    let pos = 0;
+    while (pos < data.length) {
+      if (pos + 4 > data.length) fail("truncated frame");
+      const magic = (data[pos] | (data[pos + 1] << 8) | (data[pos + 2] << 16) | (data[pos + 3] << 24)) >>> 0;
+      pos += 4;
+      if (magic === 0xfd2fb528) {
+        pos = decodeFrame(data, pos, out);
+      } else if ((magic & 0xfffffff0) === 0x184d2a50) {
+        // Skippable frame
+        pos += 4 + ((data[pos] | (data[pos + 1] << 8) | (data[pos + 2] << 16) | (data[pos + 3] << 24)) >>> 0);
+      } else {
+        fail("unknown frame magic number");
+      }
+    }
+    return out.buf.slice(0, out.len);
+  };
+})();
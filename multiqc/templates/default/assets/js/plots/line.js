@@ -1,4 +1,27 @@
 class LinePlot extends Plot {
+  constructor(dump) {
+    super(dump);
+    // Series come as x and y columns, numeric columns possibly as typed arrays
+    this.datasets.forEach((dataset) => {
+      dataset.lines.forEach((line) => {
+        line.x = decodeTypedArray(line.x);
+        line.y = decodeTypedArray(line.y);
+      });
+    });
+  }
+
+  toJSON() {
+    // Typed array columns are exported as plain arrays, as JSON.stringify writes them as objects keyed by index
+    const plain = (column) => (ArrayBuffer.isView(column) ? Array.from(column) : column);
+    return {
+      ...this,
+      datasets: this.datasets.map((dataset) => ({
+        ...dataset,
+        lines: dataset.lines.map((line) => ({ ...line, x: plain(line.x), y: plain(line.y) })),
+      })),
+    };
+  }
+
   activeDatasetSize() {
     if (this.datasets.length === 0) return 0; // no datasets
     return this.datasets[this.activeDatasetIdx].lines.length; // no samples in a dataset
@@ -69,10 +92,10 @@ class LinePlot extends Plot {
 
       return {
         type: "scatter",
-        x: line.pairs.map((x) => x[0]),
-        y: line.pairs.map((x) => x[1]),
+        x: line.x,
+        y: line.y,
         name: line.name,
-        text: line.pairs.map(() => line.name),
+        text: Array(line.y.length).fill(line.name),
         ...params,
       };
     });
@@ -88,7 +111,7 @@ class LinePlot extends Plot {
     let x = null;
     lines.forEach((line) => {
       let thisX;
-      thisX = line.pairs.map((x) => x[0]);
+      thisX = line.x;
       if (x === null) {
         x = thisX;
       } else if (x.length !== thisX.length) {
@@ -103,12 +126,12 @@ class LinePlot extends Plot {
     if (sharedX) {
       csv += "Sample" + sep + x.join(sep) + "\n";
       lines.forEach((line) => {
-        csv += line.name + sep + line.pairs.map((x) => x[1]).join(sep) + "\n";
+        csv += line.name + sep + line.y.join(sep) + "\n";
       });
     } else {
       lines.forEach((line) => {
-        csv += line.name + sep + "X" + sep + line.pairs.map((x) => x[0]).join(sep) + "\n";
-        csv += line.name + sep + "Y" + sep + line.pairs.map((x) => x[1]).join(sep) + "\n";
+        csv += line.name + sep + "X" + sep + line.x.join(sep) + "\n";
+        csv += line.name + sep + "Y" + sep + line.y.join(sep) + "\n";
       });
     }
     return csv;
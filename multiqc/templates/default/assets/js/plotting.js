@@ -2,7 +2,7 @@
 // Plotly Plotting Code
 ////////////////////////////////////////////////
 
-// Global plot data variable. Accessed in many other JavaScript files.
+// Global plot data variable, filled in as plots are loaded with loadPlot(). Accessed in many other JavaScript files.
 let mqc_plots = {};
 
 // Initialise the toolbox filters
@@ -142,6 +142,43 @@ function initPlot(dump) {
   return null;
 }
 
+// Promises of the plots being decompressed, to decompress each plot only once
+let mqc_plots_loading = {};
+
+// Decompress the data of a plot and initialise it, unless already done. Resolves with the plot, or
+// with undefined if there's no data for the anchor or it can't be decompressed.
+function loadPlot(anchor) {
+  if (anchor in mqc_plots) return Promise.resolve(mqc_plots[anchor]);
+  if (!(anchor in mqc_compressed_plotdata)) return Promise.resolve(undefined);
+  if (!(anchor in mqc_plots_loading)) {
+    mqc_plots_loading[anchor] = new Promise(function (resolve) {
+      decompressPlotData(mqc_compressed_plotdata[anchor], mqc_config.plot_data_compression, (data, err) => {
+        delete mqc_plots_loading[anchor];
+        if (err) {
+          console.error("Could not load data for plot " + anchor, err);
+          resolve(undefined);
+          return;
+        }
+        mqc_plots[anchor] = initPlot(data);
+        resolve(mqc_plots[anchor]);
+      });
+    });
+  }
+  return mqc_plots_loading[anchor];
+}
+
+// Show a plot: either render it, or show the "Show plot" button if it's heavy
+function loadPlotContainer(container) {
+  let anchor = container.attr("id");
+  if (!container.hasClass("not_loaded")) return Promise.resolve();
+  if (container.hasClass("defer_render")) {
+    // Not decompressing the data until the button is clicked
+    container.removeClass("not_loaded").html('<button class="btn btn-default btn-lg render_plot">Show plot</button>');
+    return Promise.resolve();
+  }
+  return Promise.resolve(renderPlot(anchor));
+}
+
 let loadingWarning;
 
 $(function () {
@@ -149,32 +186,42 @@ $(function () {
   loadingWarning = $(".mqc_loading_warning").show();
 });
 
-callAfterDecompressed.push(function (mqc_plotdata) {
-  mqc_plots = Object.fromEntries(Object.values(mqc_plotdata).map((data) => [data.anchor, initPlot(data)]));
-
-  let shouldLoad = $(".hc-plot.not_loaded:visible");
-
-  // Show plots on page load: either render, or show the "Show Plot" button
-  shouldLoad.each(function () {
-    let anchor = $(this).attr("id");
-    let plot = mqc_plots[anchor];
-    setTimeout(function () {
-      // Deferring each plot call prevents browser from locking up
-      if (plot.deferRender) {
-        $("#" + anchor)
-          .removeClass("not_loaded")
-          .html('<button class="btn btn-default btn-lg render_plot">Show plot</button>');
-      } else {
-        renderPlot(anchor);
-      }
-      if ($(".hc-plot.not_loaded:visible").length === 0)
-        // All plots loaded successfully (rendered or deferred with "Show Plot"), so hiding the warning
-        $(".mqc_loading_warning").hide();
-    }, 50);
-  });
-
-  // All plots loaded successfully, so hiding the warning
-  if (shouldLoad.length === 0) loadingWarning.hide();
+callAfterDecompressed.push(function () {
+  let notLoaded = $(".hc-plot.not_loaded");
+  if (notLoaded.length === 0 || !("IntersectionObserver" in window)) {
+    // Show plots on page load
+    let shouldLoad = notLoaded.filter(":visible").toArray();
+    Promise.allSettled(shouldLoad.map((el) => loadPlotContainer($(el)))).then(() => loadingWarning.hide());
+  } else {
+    // Plot data is only decompressed when the plot scrolls into view, as decompressing all plots
+    // at once freezes the browser on large reports. Hidden plots don't intersect with the viewport,
+    // so they are loaded once shown as well.
+    let firstBatch = true;
+    let observer = new IntersectionObserver(
+      function (entries) {
+        let loading = [];
+        entries.forEach(function (entry) {
+          if (!entry.isIntersecting) return;
+          observer.unobserve(entry.target);
+          loading.push(
+            new Promise(function (resolve) {
+              // Deferring each plot call prevents browser from locking up
+              setTimeout(() => loadPlotContainer($(entry.target)).finally(resolve), 50);
+            }),
+          );
+        });
+        if (firstBatch) {
+          // The plots on the screen are loaded, so hiding the warning
+          firstBatch = false;
+          Promise.allSettled(loading).then(() => loadingWarning.hide());
+        }
+      },
+      { rootMargin: "200px 0px" },
+    );
+    notLoaded.each(function () {
+      observer.observe(this);
+    });
+  }
 
   // Render a plot when clicked (heavy plots are not automatically rendered by default)
   $("body").on("click", ".render_plot", function (e) {
@@ -204,12 +251,16 @@ callAfterDecompressed.push(function (mqc_plotdata) {
     let plotAnchor = $(this).data("plot-anchor");
 
     // Toggling flags
-    mqc_plots[plotAnchor].pActive = !$(this).hasClass("active");
+    let pActive = !$(this).hasClass("active");
     $(this).toggleClass("active");
 
-    if (mqc_plots[plotAnchor].rendered) {
-      renderPlot(plotAnchor); // re-render
-    }
+    loadPlot(plotAnchor).then((plot) => {
+      if (!plot) return;
+      plot.pActive = pActive;
+      if (plot.rendered) {
+        renderPlot(plotAnchor); // re-render
+      }
+    });
   });
 
   // A "Log" button above a plot is clicked
@@ -218,12 +269,16 @@ callAfterDecompressed.push(function (mqc_plotdata) {
     let plotAnchor = $(this).data("plot-anchor");
 
     // Toggling flags
-    mqc_plots[plotAnchor].lActive = !$(this).hasClass("active");
+    let lActive = !$(this).hasClass("active");
     $(this).toggleClass("active");
 
-    if (mqc_plots[plotAnchor].rendered) {
-      renderPlot(plotAnchor); // re-render
-    }
+    loadPlot(plotAnchor).then((plot) => {
+      if (!plot) return;
+      plot.lActive = lActive;
+      if (plot.rendered) {
+        renderPlot(plotAnchor); // re-render
+      }
+    });
   });
 
   // Switch data source
@@ -234,14 +289,17 @@ callAfterDecompressed.push(function (mqc_plotdata) {
     el.siblings("button.active").removeClass("active");
     el.addClass("active");
     let plotAnchor = el.data("plot-anchor");
-    let activeDatasetIdx = mqc_plots[plotAnchor].activeDatasetIdx;
     let newDatasetIdx = el.data("datasetIndex");
-    mqc_plots[plotAnchor].activeDatasetIdx = newDatasetIdx;
-    if (activeDatasetIdx === newDatasetIdx) return;
-
-    if (mqc_plots[plotAnchor].rendered) {
-      renderPlot(plotAnchor); // re-render
-    }
+    loadPlot(plotAnchor).then((plot) => {
+      if (!plot) return;
+      let activeDatasetIdx = plot.activeDatasetIdx;
+      plot.activeDatasetIdx = newDatasetIdx;
+      if (activeDatasetIdx === newDatasetIdx) return;
+
+      if (plot.rendered) {
+        renderPlot(plotAnchor); // re-render
+      }
+    });
   });
 
   // Make divs height-draggable
@@ -359,10 +417,15 @@ function applyToolboxSettings(samples, plotAnchor) {
   return objects;
 }
 
-// Call to render any plot
+// Call to render any plot. Returns a promise if the plot data has to be decompressed first
 function renderPlot(plotAnchor) {
+  if (!(plotAnchor in mqc_plots)) {
+    return loadPlot(plotAnchor).then((plot) => {
+      if (plot !== undefined) renderPlot(plotAnchor);
+    });
+  }
   let plot = mqc_plots[plotAnchor];
-  if (plot === undefined) return false;
+  if (!plot) return false;
   if (plot.datasets.length === 0) return false;
 
   let container = $("#" + plotAnchor);
@@ -484,3 +547,13 @@ function updateObject(target, source, nullOnly = false) {
     }
   }
 }
+
+function decodeTypedArray(column) {
+  // Numeric columns of the plot data can be encoded as base64 little-endian typed arrays,
+  // see multiqc/plots/plotly/typed_array.py. Other columns are plain arrays.
+  if (column === null || column === undefined || Array.isArray(column)) return column;
+  const bytes = Uint8Array.from(atob(column["b64"]), (m) => m.codePointAt(0));
+  if (column["dtype"] === "i4") return new Int32Array(bytes.buffer);
+  if (column["dtype"] === "f8") return new Float64Array(bytes.buffer);
+  throw new Error("Unknown typed array type: " + column["dtype"]);
+}
@@ -3,13 +3,8 @@
 ////////////////////////////////////////////////
 
 $(function () {
-  decompressPlotData(mqc_compressed_plotdata, (mqc_plotdata, err) => {
-    if (err) {
-      console.error(err);
-      return;
-    }
-    callAfterDecompressed.forEach(function (fn) {
-      fn(mqc_plotdata);
-    });
+  // The plot data is decompressed lazily for each plot, see loadPlot() in plotting.js
+  callAfterDecompressed.forEach(function (fn) {
+    fn(mqc_compressed_plotdata);
   });
 });
@@ -159,13 +159,15 @@ $(function () {
 
       // Also update the violin plot
       if (violinAnchor !== undefined) {
-        let plot = mqc_plots[violinAnchor];
-        plot.datasets.map((dataset) => {
-          dataset["metrics"].map((metric) => {
-            dataset["header_by_metric"][metric]["hidden"] = metricsHidden[metric];
+        loadPlot(violinAnchor).then((plot) => {
+          if (!plot) return;
+          plot.datasets.map((dataset) => {
+            dataset["metrics"].map((metric) => {
+              dataset["header_by_metric"][metric]["hidden"] = metricsHidden[metric];
+            });
           });
+          renderPlot(violinAnchor);
         });
-        renderPlot(violinAnchor);
       }
     }
 
@@ -429,55 +429,59 @@ $(function () {
       else if ($("#mqc_data_download").is(":visible")) {
         const format = $("#mqc_export_data_ft").val();
         console.log("Exporting data in " + format + " format");
-        let skipped_plots = 0;
-        checked_plots.each(function () {
-          try {
-            const target = $(this).val();
-            const fname = target + "." + format;
-            // If JSON then just dump everything
-            if (format === "json") {
-              const json_str = JSON.stringify(mqc_plots[target], null, 2);
-              const blob = new Blob([json_str], { type: "text/plain;charset=utf-8" });
-              if (checked_plots.length <= zip_threshold) {
-                // Not many plots to export, just trigger a download for each
-                saveAs(blob, fname);
-              } else {
-                // Lots of plots - add to a zip file for download
-                zip.file(fname, blob);
-              }
-            } else if (format === "tsv" || format === "csv") {
-              let plot = mqc_plots[target];
-              if (plot !== undefined) {
-                let text = plot.exportData(format);
-                const blob = new Blob([text], { type: "text/plain;charset=utf-8" });
+        // The data of plots that weren't shown yet is decompressed first
+        const loading = checked_plots.toArray().map((el) => loadPlot($(el).val()));
+        Promise.all(loading).then(() => {
+          let skipped_plots = 0;
+          checked_plots.each(function () {
+            try {
+              const target = $(this).val();
+              const fname = target + "." + format;
+              // If JSON then just dump everything
+              if (format === "json") {
+                const json_str = JSON.stringify(mqc_plots[target], null, 2);
+                const blob = new Blob([json_str], { type: "text/plain;charset=utf-8" });
                 if (checked_plots.length <= zip_threshold) {
                   // Not many plots to export, just trigger a download for each
                   saveAs(blob, fname);
                 } else {
-                  // Lots of plots - generate a zip file for download.
-                  // Add to a zip archive
+                  // Lots of plots - add to a zip file for download
                   zip.file(fname, blob);
                 }
+              } else if (format === "tsv" || format === "csv") {
+                let plot = mqc_plots[target];
+                if (plot !== undefined) {
+                  let text = plot.exportData(format);
+                  const blob = new Blob([text], { type: "text/plain;charset=utf-8" });
+                  if (checked_plots.length <= zip_threshold) {
+                    // Not many plots to export, just trigger a download for each
+                    saveAs(blob, fname);
+                  } else {
+                    // Lots of plots - generate a zip file for download.
+                    // Add to a zip archive
+                    zip.file(fname, blob);
+                  }
+                } else {
+                  skipped_plots += 1;
+                }
               } else {
                 skipped_plots += 1;
               }
-            } else {
+            } catch (e) {
+              console.error(e);
               skipped_plots += 1;
             }
-          } catch (e) {
-            console.error(e);
-            skipped_plots += 1;
+          });
+          if (skipped_plots > 0) {
+            alert("Warning: Could not export data from " + skipped_plots + " plots.");
+          }
+          // Save the zip and trigger a download
+          if (checked_plots.length > zip_threshold) {
+            zip.generateAsync({ type: "blob" }).then(function (content) {
+              saveAs(content, "multiqc_data.zip");
+            });
           }
         });
-        if (skipped_plots > 0) {
-          alert("Warning: Could not export data from " + skipped_plots + " plots.");
-        }
-        // Save the zip and trigger a download
-        if (checked_plots.length > zip_threshold) {
-          zip.generateAsync({ type: "blob" }).then(function (content) {
-            saveAs(content, "multiqc_data.zip");
-          });
-        }
       } else {
         alert("Error - don't know what to export!");
       }
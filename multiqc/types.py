@@ -1,6 +1,9 @@
 import io
 from enum import Enum
-from typing import NewType, Optional, TypedDict, Union
+from typing import TYPE_CHECKING, NewType, Optional, TypedDict, Union
+
+if TYPE_CHECKING:
+    from multiqc.core.loaded_file import LoadedFile
 
 Anchor = NewType("Anchor", str)
 ModuleId = NewType("ModuleId", str)
@@ -19,7 +22,7 @@ class FileDict(TypedDict):
 class LoadedFileDict(FileDict):
     sp_key: str
     s_name: str
-    f: Optional[Union[str, io.IOBase]]
+    f: Optional[Union[str, io.IOBase, "LoadedFile"]]
 
 
 class PlotType(Enum):
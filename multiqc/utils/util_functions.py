@@ -8,8 +8,9 @@ import shutil
 import sys
 import time
 from collections import OrderedDict, defaultdict
+from json.encoder import encode_basestring_ascii  # type: ignore
 from pathlib import Path
-from typing import Dict
+from typing import Dict, Iterator
 
 from pydantic import BaseModel
 
@@ -84,64 +85,113 @@ def replace_defaultdicts(data):
     return _replace(data)
 
 
+def replace_nan(obj):
+    """
+    Recursively replace NaNs and Infinities with None
+    """
+    # Do checking in order of likelihood of occurrence
+    if isinstance(obj, float):
+        if math.isnan(obj) or math.isinf(obj):
+            return None
+        return obj
+    if isinstance(obj, (tuple, set)):
+        # JSON only knows list so convert tuples and sets to list.
+        obj = list(obj)
+    if isinstance(obj, list):
+        for i, item in enumerate(obj):
+            if isinstance(item, float) and (math.isnan(item) or math.isinf(item)):
+                obj[i] = None
+            elif isinstance(item, (dict, list, tuple, set)):
+                obj[i] = replace_nan(item)
+        return obj
+    if isinstance(obj, dict):
+        for key, value in obj.items():
+            if isinstance(value, float) and (math.isnan(value) or math.isinf(value)):
+                obj[key] = None
+            elif isinstance(value, (dict, list, tuple, set)):
+                obj[key] = replace_nan(value)
+        return obj
+    return obj
+
+
+def _without_nan(obj):
+    """
+    Like `replace_nan`, but returns new containers instead of changing `obj` in place
+    """
+    if isinstance(obj, float):
+        return None if math.isnan(obj) or math.isinf(obj) else obj
+    if isinstance(obj, dict):
+        return {key: _without_nan(value) for key, value in obj.items()}
+    if isinstance(obj, (list, tuple, set)):
+        return [_without_nan(item) for item in obj]
+    return obj
+
+
+class JsonEncoderWithArraySupport(json.JSONEncoder):
+    """
+    Encode array.array instances to list. Use the default method
+    for this as it gets called only when an array instance is encountered
+    and is then immediately serialized into a string. This saves memory
+    compared to unpacking all arrays to list at once.
+    """
+
+    def default(self, o):
+        if isinstance(o, array.array):
+            return replace_nan(o.tolist())
+        if callable(o):
+            return None
+        if isinstance(o, BaseModel):  # special handling for pydantic models
+            return o.model_dump_json()
+        return super().default(o)
+
+
 def dump_json(data, filehandle=None, **kwargs):
     """
     Recursively replace non-JSON-conforming NaNs and lambdas with None.
     Note that a custom JSONEncoder would not work for NaNs:
     https://stackoverflow.com/a/28640141
     """
-
-    def replace_nan(obj):
-        """
-        Recursively replace NaNs and Infinities with None
-        """
-        # Do checking in order of likelihood of occurrence
-        if isinstance(obj, float):
-            if math.isnan(obj) or math.isinf(obj):
-                return None
-            return obj
-        if isinstance(obj, (tuple, set)):
-            # JSON only knows list so convert tuples and sets to list.
-            obj = list(obj)
-        if isinstance(obj, list):
-            for i, item in enumerate(obj):
-                if isinstance(item, float) and (math.isnan(item) or math.isinf(item)):
-                    obj[i] = None
-                elif isinstance(item, (dict, list, tuple, set)):
-                    obj[i] = replace_nan(item)
-            return obj
-        if isinstance(obj, dict):
-            for key, value in obj.items():
-                if isinstance(value, float) and (math.isnan(value) or math.isinf(value)):
-                    obj[key] = None
-                elif isinstance(value, (dict, list, tuple, set)):
-                    obj[key] = replace_nan(value)
-            return obj
-        return obj
-
-    class JsonEncoderWithArraySupport(json.JSONEncoder):
-        """
-        Encode array.array instances to list. Use the default method
-        for this as it gets called only when an array instance is encountered
-        and is then immediately serialized into a string. This saves memory
-        compared to unpacking all arrays to list at once.
-        """
-
-        def default(self, o):
-            if isinstance(o, array.array):
-                return replace_nan(o.tolist())
-            if callable(o):
-                return None
-            if isinstance(o, BaseModel):  # special handling for pydantic models
-                return o.model_dump_json()
-            return super().default(o)
-
     if filehandle:
         json.dump(replace_nan(data), filehandle, cls=JsonEncoderWithArraySupport, **kwargs)
     else:
         return json.dumps(replace_nan(data), cls=JsonEncoderWithArraySupport, **kwargs)
 
 
+def iter_json(data, max_depth: int = 5) -> Iterator[str]:
+    """
+    Yield the same JSON as `dump_json(data)` in pieces, without building the whole string, and
+    without replacing the NaNs in `data` in place. Dicts with string keys and lists are written
+    item by item down to `max_depth` levels, and deeper values are encoded in one go. Values
+    with NaNs, sets or tuples are copied with the NaNs replaced before encoding, so only the
+    values that need it are copied.
+    """
+    strict_encoder = JsonEncoderWithArraySupport(allow_nan=False)
+    encoder = JsonEncoderWithArraySupport()
+
+    def _iter(obj, depth: int) -> Iterator[str]:
+        if depth < max_depth and isinstance(obj, dict) and all(isinstance(k, str) for k in obj):
+            yield "{"
+            for i, (key, value) in enumerate(obj.items()):
+                yield (", " if i else "") + encode_basestring_ascii(key) + ": "
+                yield from _iter(value, depth + 1)
+            yield "}"
+        elif depth < max_depth and isinstance(obj, list):
+            yield "["
+            for i, item in enumerate(obj):
+                if i:
+                    yield ", "
+                yield from _iter(item, depth + 1)
+            yield "]"
+        else:
+            try:
+                yield strict_encoder.encode(obj)
+            except (ValueError, TypeError):
+                # NaNs, or sets that `replace_nan` would have turned into lists
+                yield encoder.encode(_without_nan(obj))
+
+    yield from _iter(data, 0)
+
+
 def is_running_in_notebook() -> bool:
     try:
         from IPython import get_ipython  # type: ignore
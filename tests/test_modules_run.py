@@ -1,11 +1,19 @@
+import importlib
+import json
+import pickle
+import sqlite3
 import tempfile
+import time
 from pathlib import Path
-from typing import Callable, List, Union
+from typing import Any, Callable, Dict, List, Optional, Union
 
 import pytest
 
 from multiqc import BaseMultiqcModule, config, report, reset, parse_logs
 from multiqc.base_module import ModuleNoSamplesFound
+from multiqc.core import search_cache, tracing
+from multiqc.core.exec_modules import exec_modules
+from multiqc.core.file_search import file_search
 from multiqc.core.update_config import update_config, ClConfig
 
 modules = [(k, entry_point) for k, entry_point in config.avail_modules.items() if k != "custom_content"]
@@ -180,3 +188,275 @@ def test_path_filters(multiqc_reset, tmp_path, data_dir):
     }
     assert report.general_stats_data[0].keys() == {Path(fn).name for fn in expected_se_files}
     assert report.general_stats_data[1].keys() == {Path(fn).name for fn in expected_pe_files}
+
+
+def _write_logs_for_module_workers(path: Path):
+    for s_name, aligned in [("sample1", 9284), ("sample2", 8123)]:
+        (path / f"{s_name}.bowtie2.log").write_text(
+            f"""\
+10000 reads; of these:
+  10000 (100.00%) were unpaired; of these:
+    {10000 - aligned - 120} ({(10000 - aligned - 120) / 100:.2f}%) aligned 0 times
+    {aligned} ({aligned / 100:.2f}%) aligned exactly 1 time
+    120 (1.20%) aligned >1 times
+{(aligned + 120) / 100:.2f}% overall alignment rate
+"""
+        )
+        (path / f"{s_name}.flagstat").write_text(
+            f"""\
+10000 + 0 in total (QC-passed reads + QC-failed reads)
+0 + 0 secondary
+0 + 0 supplementary
+0 + 0 duplicates
+{aligned} + 0 mapped ({aligned / 100:.2f}% : N/A)
+10000 + 0 paired in sequencing
+5000 + 0 read1
+5000 + 0 read2
+{aligned - 200} + 0 properly paired ({(aligned - 200) / 100:.2f}% : N/A)
+{aligned - 100} + 0 with itself and mate mapped
+20 + 0 singletons (0.20% : N/A)
+10 + 0 with mate mapped to a different chr
+5 + 0 with mate mapped to a different chr (mapQ>=5)
+"""
+        )
+    (path / "table_mqc.tsv").write_text("Sample\tvalue\nsample1\t1\nsample2\t2\n")
+
+
+def test_module_workers(tmp_path):
+    """
+    Running modules in worker processes gives the same report as running them one by one
+    """
+    _write_logs_for_module_workers(tmp_path)
+
+    results: List[Dict[str, Any]] = []
+    for module_workers in [1, 2]:
+        reset()
+        update_config(tmp_path, cfg=ClConfig(module_workers=module_workers))
+        report.reset_file_search()
+        exec_modules(file_search())
+        results.append(
+            {
+                "modules": [(m.name, m.anchor) for m in report.modules],
+                "sections": [[s.anchor for s in m.sections] for m in report.modules],
+                "general_stats_data": report.general_stats_data,
+                "general_stats_headers": report.general_stats_headers,
+                "data_sources": report.data_sources,
+                "software_versions": report.software_versions,
+                "saved_raw_data": report.saved_raw_data,
+                "plot_by_id": list(report.plot_by_id),
+                "html_ids_by_scope": {str(scope): sorted(ids) for scope, ids in report.html_ids_by_scope.items()},
+                "data_files": sorted(p.name for p in report.data_tmp_dir().iterdir()),
+            }
+        )
+
+    assert len(results[0]["modules"]) == 3
+    for key, value in results[0].items():
+        # Comparing dumps, as parsed values can be NaN, which is not equal to itself
+        assert json.dumps(results[1][key], sort_keys=True, default=repr) == json.dumps(
+            value, sort_keys=True, default=repr
+        ), key
+
+
+def _import_samtools():
+    """
+    Modules are excluded from type checking, so import Samtools dynamically to keep mypy
+    from following the import into the module code
+    """
+    return importlib.import_module("multiqc.modules.samtools")
+
+
+def test_two_phase_module(tmp_path):
+    """
+    A module with separate parse and build phases gives the same result when the sections
+    are built from data parsed beforehand, e.g. in a worker process
+    """
+    SamtoolsModule = _import_samtools().MultiqcModule
+
+    assert SamtoolsModule.is_two_phase()
+    assert not BaseMultiqcModule.is_two_phase()
+    _write_logs_for_module_workers(tmp_path)
+
+    def _run(preparsed_data=None):
+        reset()
+        update_config(tmp_path)
+        report.reset_file_search()
+        file_search()
+        SamtoolsModule.preparsed_data = preparsed_data
+        try:
+            m = SamtoolsModule()
+        finally:
+            SamtoolsModule.preparsed_data = None
+        # Comparing dumps, as parsed values can be NaN, which is not equal to itself
+        return json.dumps(
+            {
+                "sections": [s.anchor for s in m.sections],
+                "general_stats_data": report.general_stats_data,
+                "data_sources": report.data_sources,
+                "saved_raw_data": report.saved_raw_data,
+                "plot_by_id": list(report.plot_by_id),
+            },
+            sort_keys=True,
+            default=repr,
+        )
+
+    expected = _run()
+
+    # Parse only: the report is left untouched
+    reset()
+    update_config(tmp_path)
+    report.reset_file_search()
+    file_search()
+    SamtoolsModule.parse_only = True
+    try:
+        parsed = SamtoolsModule().parsed_data
+    finally:
+        SamtoolsModule.parse_only = False
+    assert len(parsed.data["flagstat"]) == 2
+    assert len(parsed.data_sources) == 2
+    assert not report.data_sources
+    assert not report.plot_by_id
+
+    assert _run(pickle.loads(pickle.dumps(parsed))) == expected
+
+
+def test_parse_cache(tmp_path, monkeypatch):
+    """
+    With the parse cache enabled, unchanged files are loaded from the cache instead of parsed again
+    """
+    from multiqc.core import parse_cache
+
+    SamtoolsModule = _import_samtools().MultiqcModule
+    flagstat = importlib.import_module("multiqc.modules.samtools.flagstat")
+
+    logs_dir = tmp_path / "logs"
+    logs_dir.mkdir()
+    _write_logs_for_module_workers(logs_dir)
+
+    parsed_files: List[str] = []
+    parse_single_report = flagstat.parse_single_report
+
+    def _parse_single_report(file_obj):
+        parsed_files.append(file_obj)
+        return parse_single_report(file_obj)
+
+    monkeypatch.setattr(flagstat, "parse_single_report", _parse_single_report)
+
+    def _run(use_cache: bool, fn_clean_trim: Optional[List[str]] = None) -> str:
+        parsed_files.clear()
+        reset()
+        update_config(logs_dir, cfg=ClConfig(parse_cache=use_cache, extra_fn_clean_trim=fn_clean_trim or []))
+        config.search_cache_dir = str(tmp_path / "cache")
+        report.reset_file_search()
+        file_search()
+        SamtoolsModule()
+        parse_cache.prune()
+        parse_cache.close()
+        return json.dumps(
+            {"saved_raw_data": report.saved_raw_data, "data_sources": report.data_sources},
+            sort_keys=True,
+            default=repr,
+        )
+
+    expected = _run(use_cache=False)
+    assert len(parsed_files) == 2
+    assert not (tmp_path / "cache" / "parse_cache.sqlite").exists()
+
+    assert _run(use_cache=True) == expected
+    assert len(parsed_files) == 2
+    assert (tmp_path / "cache" / "parse_cache.sqlite").exists()
+
+    # Nothing changed: all files are loaded from the cache
+    assert _run(use_cache=True) == expected
+    assert len(parsed_files) == 0
+
+    # Only the changed file is parsed again
+    with (logs_dir / "sample1.flagstat").open("a") as fh:
+        fh.write("\n")
+    assert _run(use_cache=True) == expected
+    assert len(parsed_files) == 1
+
+    # Sample names are made on every run, so changing them still loads the files from the cache
+    renamed = _run(use_cache=False, fn_clean_trim=["sample"])
+    assert renamed != expected
+    assert _run(use_cache=True, fn_clean_trim=["sample"]) == renamed
+    assert len(parsed_files) == 0
+
+    # Results not used for longer than MAX_AGE_DAYS are dropped, the ones used by the run are kept
+    con = sqlite3.connect(tmp_path / "cache" / "parse_cache.sqlite")
+    expired = int(time.time()) - (search_cache.MAX_AGE_DAYS + 1) * 24 * 60 * 60
+    with con:
+        con.execute("UPDATE parse_results SET last_used = ?", (expired,))
+        con.execute(
+            "INSERT INTO parse_results (fingerprint, path, size, mtime_ns, result, last_used) "
+            "VALUES ('old version', 'sample1.flagstat', 0, 0, x'', ?)",
+            (expired,),
+        )
+    assert _run(use_cache=True) == expected
+    assert len(parsed_files) == 0
+    fingerprints = [row[0] for row in con.execute("SELECT fingerprint FROM parse_results")]
+    con.close()
+    assert len(fingerprints) == 2
+    assert "old version" not in fingerprints
+
+    # Removing the cache parses all files again
+    config.search_cache_dir = str(tmp_path / "cache")
+    parse_cache.reset()
+    assert not (tmp_path / "cache" / "parse_cache.sqlite").exists()
+    assert _run(use_cache=True) == expected
+    assert len(parsed_files) == 2
+
+
+@pytest.mark.parametrize("module_workers", [1, 2])
+def test_profile_rss(tmp_path, module_workers):
+    """
+    With `config.profile_rss`, the memory of the process and the size of the data kept by each module are recorded
+    """
+    _write_logs_for_module_workers(tmp_path)
+
+    reset()
+    update_config(tmp_path, cfg=ClConfig(profile_rss=True, module_workers=module_workers))
+    assert config.profile_runtime
+    report.reset_file_search()
+    exec_modules(file_search())
+
+    assert set(report.runtimes.memory_mods) == {"bowtie2", "samtools", "custom_content"}
+    for usage in report.runtimes.memory_mods.values():
+        assert usage.peak_rss is not None and usage.peak_rss > 0
+        assert usage.plot_bytes > 0
+    assert report.runtimes.memory_mods["samtools"].data_bytes > 0
+
+
+@pytest.mark.parametrize("module_workers", [1, 2])
+def test_trace(tmp_path, module_workers):
+    """
+    With `config.trace`, the spans of the run are recorded, including those of the worker processes,
+    and exported as balanced Chrome trace and speedscope timelines
+    """
+    _write_logs_for_module_workers(tmp_path)
+
+    reset()
+    update_config(tmp_path, cfg=ClConfig(trace=True, module_workers=module_workers))
+    report.reset_file_search()
+    exec_modules(file_search())
+
+    events = report.runtimes.trace_events
+    names = {e.name for e in events}
+    assert {"file search", "run modules", "bowtie2", "samtools", "read file", "add_section"} <= names
+    assert any(e.cat == "plot" for e in events)
+    assert (len({e.pid for e in events}) > 1) == (module_workers > 1)
+    module_span = next(e for e in events if e.name == "samtools")
+    read_span = next(e for e in events if e.name == "read file" and e.args["fn"].endswith(".flagstat"))
+    assert module_span.start <= read_span.start <= module_span.start + module_span.duration
+
+    tracing.write_trace_files(tmp_path)
+    chrome = json.loads((tmp_path / "multiqc_trace.json").read_text())
+    assert sum(e["ph"] == "X" for e in chrome["traceEvents"]) == len(events)
+    ss = json.loads((tmp_path / "multiqc_trace.speedscope.json").read_text())
+    for profile in ss["profiles"]:
+        stack = []
+        for e in profile["events"]:
+            if e["type"] == "O":
+                stack.append(e["frame"])
+            else:
+                assert stack.pop() == e["frame"]
+        assert not stack
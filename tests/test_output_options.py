@@ -1,8 +1,19 @@
+import base64
+import copy
+import gzip
+import json
+import math
 import os
+import re
+from typing import Any, Callable, Dict, Optional, Tuple
 
 import pytest
 
-from multiqc import report, BaseMultiqcModule, write_report
+from multiqc import report, BaseMultiqcModule, load_config, write_report
+from multiqc.core import plot_data_compression
+from multiqc.core.exceptions import RunError
+from multiqc.types import Anchor
+from multiqc.utils import util_functions
 
 
 @pytest.fixture()
@@ -48,3 +59,149 @@ def test_write_stdout(stub_modules, tmp_path, capsys):
 
     files_after = set(os.listdir(tmp_path))
     assert files_before == files_after
+
+
+def test_compressed_plot_data(stub_modules, tmp_path):
+    """
+    Verify that the plot data is streamed into the report compressed separately for each plot, with
+    NaNs written as null, and without changing the plot data in place
+    """
+    report.plot_data = {
+        Anchor("plot"): {
+            "datasets": [{"lines": [{"name": "s", "pairs": [[1, float("nan")], (2, 3.5)]}]}],
+            "cats": {"a"},  # one value, as a set and its copy may iterate in a different order
+        },
+        Anchor("other"): {1: float("inf"), "ü": []},
+    }
+    expected = {anchor: util_functions.dump_json(data) for anchor, data in copy.deepcopy(report.plot_data).items()}
+    write_report(output_dir=tmp_path, make_data_dir=False)
+
+    html = (tmp_path / "multiqc_report.html").read_text(encoding="utf-8")
+    match = re.search(r'id="mqc_compressed_plotdata">([^<]*)</script>', html)
+    assert match is not None
+    index = json.loads(match.group(1))
+    assert list(index) == ["plot", "other"]
+    for anchor, compressed in index.items():
+        assert gzip.decompress(base64.b64decode(compressed)).decode("utf-8") == expected[anchor]
+    assert math.isnan(report.plot_data[Anchor("plot")]["datasets"][0]["lines"][0]["pairs"][0][1])
+    assert "".join(report.iter_compressed_json(report.plot_data, chunk_size=10)) == report.compress_json(
+        report.plot_data
+    )
+
+
+def test_report_streamed_to_file(stub_modules, tmp_path, monkeypatch):
+    """
+    Verify that the report is rendered straight into the file, and a partly written report is removed on errors
+    """
+    file_exists = []
+
+    def _failing_plot_data(data, new_compressor):
+        # The report file is already being written when the plot data is compressed
+        file_exists.append((tmp_path / "multiqc_report.html").exists())
+        yield "abc"
+        raise RuntimeError("compression failed")
+
+    monkeypatch.setattr(report, "iter_compressed_plot_data", _failing_plot_data)
+    with pytest.raises(RuntimeError):
+        write_report(output_dir=tmp_path, make_data_dir=False)
+    assert file_exists == [True]
+    assert not (tmp_path / "multiqc_report.html").exists()
+    assert report.plot_compressed_json == ""
+
+
+def _zstd_decompress(data: bytes) -> bytes:
+    import zstandard  # type: ignore
+
+    # The data is compressed as a stream, so the frame doesn't record the size `ZstdDecompressor.decompress` needs
+    return zstandard.ZstdDecompressor().decompressobj().decompress(data)
+
+
+def _brotli_decompress(data: bytes) -> bytes:
+    import brotli  # type: ignore
+
+    return brotli.decompress(data)
+
+
+# Python decoder of each codec, and the package it needs
+DECOMPRESS: Dict[str, Tuple[Optional[str], Callable[[bytes], bytes]]] = {
+    "gzip": (None, gzip.decompress),
+    "zstd": ("zstandard", _zstd_decompress),
+    "brotli": ("brotli", _brotli_decompress),
+    "none": (None, lambda b: b),
+}
+
+# Global function that each decoder bundled with the report defines
+DECODER_SCRIPTS = {"zstd": "var zstdDecompress =", "brotli": "var brotliDecompress ="}
+
+
+@pytest.mark.parametrize(
+    "compression,level,codec",
+    [
+        ("gzip", None, "gzip"),
+        ("gzip", 1, "gzip"),
+        ("gzip", 9, "gzip"),
+        ("zstd", None, "zstd"),
+        ("zstd", 19, "zstd"),
+        ("brotli", None, "brotli"),
+        ("brotli", 11, "brotli"),
+        ("none", None, "none"),
+        ("lz4", None, "gzip"),  # not supported, falls back to gzip
+    ],
+)
+def test_plot_data_compression(stub_modules, tmp_path, compression, level, codec):
+    """
+    Verify that the plot data is compressed with the codec and level set in the config, and the report
+    tells the JavaScript how to decode it and includes the decoder it needs
+    """
+    package, decompress = DECOMPRESS[codec]
+    if package is not None:
+        pytest.importorskip(package)
+    report.plot_data = {Anchor("plot"): {"datasets": [[1, 2.5, float("nan")] * 100]}}
+    expected = util_functions.dump_json(copy.deepcopy(report.plot_data[Anchor("plot")]))
+    options: Dict[str, Any] = {"plot_data_compression": compression}
+    if level is not None:
+        options["plot_data_compression_level"] = level
+    write_report(output_dir=tmp_path, make_data_dir=False, **options)
+
+    html = (tmp_path / "multiqc_report.html").read_text(encoding="utf-8")
+    match = re.search(r'id="mqc_compressed_plotdata">([^<]*)</script>', html)
+    assert match is not None
+    index = json.loads(match.group(1))
+    assert decompress(base64.b64decode(index["plot"])).decode("utf-8") == expected
+    assert f'"plot_data_compression": "{codec}"' in html
+    for name, script in DECODER_SCRIPTS.items():
+        assert (script in html) == (name == codec)
+
+
+def test_plot_data_compression_level_out_of_range(stub_modules, tmp_path, capsys):
+    """
+    Verify that a level out of the range of the codec is an error when it's passed, and falls back to the
+    default level with a single warning for all plots when it's set in a config file
+    """
+    with pytest.raises(RunError, match="must be from 0 to 9, got '12'"):
+        write_report(output_dir=tmp_path, plot_data_compression="gzip", plot_data_compression_level=12)
+
+    config_path = tmp_path / "multiqc_config.yaml"
+    config_path.write_text("plot_data_compression_level: 12\n")
+    load_config(config_path)
+    report.plot_data = {Anchor(f"plot{i}"): {"datasets": [[i]]} for i in range(3)}
+    write_report(output_dir=tmp_path, make_data_dir=False, plot_data_compression="gzip")
+
+    html = (tmp_path / "multiqc_report.html").read_text(encoding="utf-8")
+    match = re.search(r'id="mqc_compressed_plotdata">([^<]*)</script>', html)
+    assert match is not None
+    assert len(json.loads(match.group(1))) == 3
+    assert str(capsys.readouterr().err).count("must be from 0 to 9, got '12', using 6") == 1
+
+
+def test_plot_data_compression_missing_package(stub_modules, tmp_path, monkeypatch):
+    """
+    Verify that a codec falls back to gzip when its Python package is not installed
+    """
+    monkeypatch.setattr(plot_data_compression, "_CODEC_PACKAGES", {"zstd": (None, "zstandard", "zstd")})
+    report.plot_data = {Anchor("plot"): {"datasets": [[1, 2]]}}
+    write_report(output_dir=tmp_path, make_data_dir=False, plot_data_compression="zstd")
+
+    html = (tmp_path / "multiqc_report.html").read_text(encoding="utf-8")
+    assert '"plot_data_compression": "gzip"' in html
+    assert DECODER_SCRIPTS["zstd"] not in html
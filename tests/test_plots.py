@@ -1,11 +1,18 @@
+import json
+import shutil
+import subprocess
 import tempfile
+from pathlib import Path
+from typing import Dict
 from unittest.mock import patch
 
 import pytest
 
+import multiqc
 from multiqc import Plot, config, report
 from multiqc.core.exceptions import RunError
 from multiqc.plots import bargraph, box, heatmap, linegraph, scatter, table, violin
+from multiqc.plots.plotly import typed_array
 from multiqc.plots.plotly.line import LinePlotConfig, Series
 from multiqc.types import Anchor
 from multiqc.validation import ConfigValidationError
@@ -52,7 +59,7 @@ def test_linegraph():
     )
 
     for in_series, out_series in zip(dataset.values(), report.plot_data[plot.anchor]["datasets"][0]["lines"]):
-        assert len(in_series) == len(out_series["pairs"])
+        assert len(in_series) == len(out_series["x"])
 
 
 def test_table():
@@ -215,7 +222,67 @@ def test_linegraph_smooth():
     )
 
     for in_series, out_series in zip(dataset.values(), report.plot_data[plot.anchor]["datasets"][0]["lines"]):
-        assert min(len(in_series), SMOOTH_TO) == len(out_series["pairs"])
+        assert min(len(in_series), SMOOTH_TO) == len(out_series["x"])
+
+
+def test_linegraph_typed_arrays():
+    dataset: Dict[str, Dict[int, float]] = {
+        "Ints": {i: i * 1000 for i in range(100)},
+        "Floats": {i: i / 7 for i in range(100)},
+        "Rounded": {i: round(i / 7, 1) for i in range(100)},
+        "Short": {i: i / 7 for i in range(3)},
+    }
+    plot = _verify_rendered(linegraph.plot(dataset, {"id": "test_linegraph_typed_arrays", "title": "Line Graph"}))
+
+    lines = {line["name"]: line for line in report.plot_data[plot.anchor]["datasets"][0]["lines"]}
+    assert "pairs" not in lines["Ints"]
+    assert lines["Ints"]["x"]["dtype"] == "i4"
+    assert lines["Ints"]["y"]["dtype"] == "i4"
+    assert lines["Floats"]["y"]["dtype"] == "f8"
+    # Floats with few digits compress better as JSON text
+    assert isinstance(lines["Rounded"]["y"], list)
+    assert isinstance(lines["Short"]["y"], list)
+    for name, in_series in dataset.items():
+        assert typed_array.decode(lines[name]["x"]) == list(in_series.keys())
+        assert typed_array.decode(lines[name]["y"]) == list(in_series.values())
+
+
+# Loads the report JavaScript of the line plot, and prints the JSON export of the plot data read from stdin
+_EXPORT_JSON_SCRIPT = """
+const fs = require("fs"), path = require("path"), vm = require("vm");
+const context = vm.createContext({ atob, window: {}, $: () => {}, callAfterDecompressed: [] });
+for (const fn of ["plotting.js", "plots/line.js"]) {
+  vm.runInContext(fs.readFileSync(path.join(process.argv[1], fn), "utf8"), context);
+}
+context.dump = JSON.parse(fs.readFileSync(0, "utf8"));
+process.stdout.write(vm.runInContext("JSON.stringify(new LinePlot(dump))", context));
+"""
+
+
+@pytest.mark.skipif(shutil.which("node") is None, reason="Node.js is not installed")
+def test_linegraph_typed_arrays_export_json():
+    """
+    Verify that the JSON export of the report writes the typed array columns as plain arrays
+    """
+    dataset: Dict[str, Dict[int, float]] = {
+        "Ints": {i: i * 1000 for i in range(100)},
+        "Floats": {i: i / 7 for i in range(100)},
+    }
+    plot = _verify_rendered(linegraph.plot(dataset, {"id": "test_linegraph_typed_arrays", "title": "Line Graph"}))
+    assert report.plot_data[plot.anchor]["datasets"][0]["lines"][0]["x"]["dtype"] == "i4"
+
+    js_dir = Path(multiqc.__file__).parent / "templates" / "default" / "assets" / "js"
+    result = subprocess.run(
+        ["node", "-e", _EXPORT_JSON_SCRIPT, str(js_dir)],
+        input=json.dumps(report.plot_data[plot.anchor]),
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    lines = {line["name"]: line for line in json.loads(result.stdout)["datasets"][0]["lines"]}
+    for name, in_series in dataset.items():
+        assert lines[name]["x"] == list(in_series.keys())
+        assert lines[name]["y"] == list(in_series.values())
 
 
 def test_linegraph_multiple_datasets():
@@ -373,14 +440,14 @@ def test_extra_series_multiple_datasets():
 
     anchor = Anchor(plot_id)
     assert len(report.plot_data[anchor]["datasets"][0]["lines"]) == 2
-    assert len(report.plot_data[anchor]["datasets"][0]["lines"][0]["pairs"]) == 2
-    assert len(report.plot_data[anchor]["datasets"][0]["lines"][1]["pairs"]) == 1
+    assert len(report.plot_data[anchor]["datasets"][0]["lines"][0]["x"]) == 2
+    assert len(report.plot_data[anchor]["datasets"][0]["lines"][1]["x"]) == 1
     assert report.plot_data[anchor]["datasets"][0]["lines"][0]["name"] == "Sample1"
     assert report.plot_data[anchor]["datasets"][0]["lines"][1]["name"] == "Extra1"
 
     assert len(report.plot_data[anchor]["datasets"][1]["lines"]) == 2
-    assert len(report.plot_data[anchor]["datasets"][1]["lines"][0]["pairs"]) == 2
-    assert len(report.plot_data[anchor]["datasets"][1]["lines"][1]["pairs"]) == 1
+    assert len(report.plot_data[anchor]["datasets"][1]["lines"][0]["x"]) == 2
+    assert len(report.plot_data[anchor]["datasets"][1]["lines"][1]["x"]) == 1
     assert report.plot_data[anchor]["datasets"][1]["lines"][0]["name"] == "Sample1"
     assert report.plot_data[anchor]["datasets"][1]["lines"][1]["name"] == "Extra1"
 
@@ -402,9 +469,9 @@ def test_multiple_extra_series():
     anchor = Anchor(plot_id)
     assert len(report.plot_data[anchor]["datasets"]) == 1
     assert len(report.plot_data[anchor]["datasets"][0]["lines"]) == 3
-    assert len(report.plot_data[anchor]["datasets"][0]["lines"][0]["pairs"]) == 2
-    assert len(report.plot_data[anchor]["datasets"][0]["lines"][1]["pairs"]) == 1
-    assert len(report.plot_data[anchor]["datasets"][0]["lines"][2]["pairs"]) == 1
+    assert len(report.plot_data[anchor]["datasets"][0]["lines"][0]["x"]) == 2
+    assert len(report.plot_data[anchor]["datasets"][0]["lines"][1]["x"]) == 1
+    assert len(report.plot_data[anchor]["datasets"][0]["lines"][2]["x"]) == 1
     assert report.plot_data[anchor]["datasets"][0]["lines"][0]["name"] == "Sample1"
     assert report.plot_data[anchor]["datasets"][0]["lines"][1]["name"] == "Extra1"
     assert report.plot_data[anchor]["datasets"][0]["lines"][2]["name"] == "Extra2"
@@ -429,8 +496,8 @@ def test_extra_series_multiple_datasets_different_series():
     assert len(report.plot_data[anchor]["datasets"]) == 2
     for ds in report.plot_data[anchor]["datasets"]:
         assert len(ds["lines"]) == 2
-        assert len(ds["lines"][0]["pairs"]) == 2
-        assert len(ds["lines"][1]["pairs"]) == 1
+        assert len(ds["lines"][0]["x"]) == 2
+        assert len(ds["lines"][1]["x"]) == 1
         assert ds["lines"][0]["name"] == "Sample1"
     assert report.plot_data[anchor]["datasets"][0]["lines"][1]["name"] == "Extra1"
     assert report.plot_data[anchor]["datasets"][1]["lines"][1]["name"] == "Extra2"
@@ -454,9 +521,9 @@ def test_extra_series_multiple_datasets_multiple_series():
     assert len(report.plot_data[anchor]["datasets"]) == 2
     for ds in report.plot_data[anchor]["datasets"]:
         assert len(ds["lines"]) == 3
-        assert len(ds["lines"][0]["pairs"]) == 2
-        assert len(ds["lines"][1]["pairs"]) == 1
-        assert len(ds["lines"][2]["pairs"]) == 1
+        assert len(ds["lines"][0]["x"]) == 2
+        assert len(ds["lines"][1]["x"]) == 1
+        assert len(ds["lines"][2]["x"]) == 1
         assert ds["lines"][0]["name"] == "Sample1"
         assert ds["lines"][1]["name"] == "Extra1"
         assert ds["lines"][2]["name"] == "Extra2"
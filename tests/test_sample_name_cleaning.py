@@ -1,12 +1,14 @@
 """Test that the sample cleaning logic works as expected."""
 
 import pytest
-from multiqc import config
-from multiqc.base_module import BaseMultiqcModule
+from multiqc import config, report
+from multiqc.base_module import BaseMultiqcModule, SampleGroupingConfig
+from multiqc.core import sample_name_cleaning
+from multiqc.types import ColumnKey
 
 
 @pytest.fixture
-def base_module():
+def base_module() -> BaseMultiqcModule:
     return BaseMultiqcModule()
 
 
@@ -29,3 +31,56 @@ def test_regex_keep(base_module):
     config.fn_clean_exts = [{"type": "regex_keep", "pattern": "abc..X"}]
     assert base_module.clean_s_name("foo_abc12X_bar") == "abc12X"
     assert base_module.clean_s_name("foo_abc123_bar") == "foo_abc123_bar"
+
+
+def test_memoized_names(base_module):
+    config.fn_clean_exts = [{"type": "regex", "pattern": r"_L\d{3}"}, ".fastq"]
+    assert base_module.clean_s_name("foo_L001.fastq.gz") == "foo"
+    hits = report.runtimes.clean_s_name_hits
+    assert base_module.clean_s_name("foo_L001.fastq.gz") == "foo"
+    assert report.runtimes.clean_s_name_hits == hits + 1
+
+    # Replacing the config options compiles the rules again
+    config.fn_clean_exts = [".fastq"]
+    assert base_module.clean_s_name("foo_L001.fastq.gz") == "foo_L001"
+    config.prepend_dirs = True
+    assert base_module.clean_s_name("foo_L001.fastq.gz", root="run1") == "run1 | foo_L001"
+    config.sample_names_replace = {"foo": "bar"}
+    assert base_module.clean_s_name("foo_L001.fastq.gz", root="run1") == "run1 | bar_L001"
+
+    # Changes made in place take effect when the config is updated
+    config.fn_clean_exts.append("_L001")
+    config.sample_names_replace["foo"] = "baz"
+    assert base_module.clean_s_name("foo_L001.fastq.gz", root="run1") == "run1 | bar_L001"
+    sample_name_cleaning.clear()
+    assert base_module.clean_s_name("foo_L001.fastq.gz", root="run1") == "run1 | baz"
+
+
+def test_module_specific_clean_ext(base_module):
+    config.fn_clean_exts = [{"type": "truncate", "pattern": "_R1", "module": "other"}]
+    assert base_module.clean_s_name("foo_R1.txt") == "foo_R1.txt"
+    config.fn_clean_exts = [{"type": "truncate", "pattern": "_R1", "module": ["other", "base"]}]
+    assert base_module.clean_s_name("foo_R1.txt") == "foo"
+
+
+def test_group_samples_and_average_metrics(base_module):
+    config.table_sample_merge = {"R1": ["_R1"], "R2": ["_R2"]}
+    data = {
+        "a_R1": {"reads": 100, "gc": 40.0, "len": 150, "status": "pass"},
+        "a_R2": {"reads": 300, "gc": 50.0, "len": "NA", "status": "fail"},
+        "b": {"reads": 10, "gc": 30.0, "len": 100, "status": "pass"},
+    }
+    rows = base_module.group_samples_and_average_metrics(
+        data,
+        SampleGroupingConfig(
+            cols_to_weighted_average=[(ColumnKey("gc"), ColumnKey("reads"))],
+            cols_to_average=[ColumnKey("len")],
+            cols_to_sum=[ColumnKey("reads"), ColumnKey("status")],
+        ),
+    )
+    assert list(rows) == ["a", "b"]
+    merged = rows["a"][0]
+    assert merged.sample == "a"
+    assert merged.data == {"gc": 47.5, "len": 75.0, "reads": 400.0, "status": 0}
+    assert [r.sample for r in rows["a"][1:]] == ["a R1", "a R2"]
+    assert [r.sample for r in rows["b"]] == ["b"]
@@ -2,6 +2,12 @@
 Tests for discovering and excluding files
 """
 
+import bz2
+import gzip
+import os
+import sqlite3
+import sys
+import time
 from pathlib import Path
 from typing import Dict, Set, Union
 
@@ -10,8 +16,20 @@ import yaml
 from importlib_metadata import EntryPoint
 
 from multiqc import config, report
+from multiqc.base_module import BaseMultiqcModule
+from multiqc.core import search_cache
 from multiqc.core.exceptions import RunError
 from multiqc.core.file_search import file_search
+from multiqc.core.loaded_file import LoadedFile
+from multiqc.core.read_ahead import read_ahead
+from multiqc.core.walk_dirs import walk_analysis_paths
+from multiqc.report import ContentMatcher, ContentScan, SearchFile, SearchPattern
+from multiqc.types import FileDict, ModuleId
+
+try:
+    import zstandard  # type: ignore
+except ImportError:
+    zstandard = None  # type: ignore[assignment]
 
 
 def _test_search_files(
@@ -211,3 +229,481 @@ tool2:
             "tool2": {tool2.name},
         },
     )
+
+
+def test_parallel_search_same_as_serial(tmp_path):
+    """
+    Test that searching files in worker processes finds the same files in the same order
+    """
+    for i in range(400):
+        if i % 3 == 0:
+            (tmp_path / f"sample{i}.tool1.txt").write_text("tool1_metric: 1\n")
+        elif i % 3 == 1:
+            (tmp_path / f"sample{i}.log").write_text(f"header\nthis is tool2 output for {i}\n")
+        else:
+            (tmp_path / f"sample{i}.other").write_text("nothing to see\n")
+
+    search_patterns = {
+        "tool1": {"fn": "*.tool1.txt"},
+        "tool2": {"contents": "tool2 output"},
+    }
+
+    def _search(search_workers: int):
+        report.reset()
+        config.sp = search_patterns
+        config.run_modules = list(search_patterns.keys())
+        config.avail_modules = {k: EntryPoint(k, k, k) for k in config.run_modules}
+        config.analysis_dir = [str(tmp_path)]
+        config.search_workers = search_workers
+        file_search()
+        return report.files, {k: len(v) for k, v in report.file_search_stats.items()}
+
+    serial_files, serial_stats = _search(search_workers=1)
+    parallel_files, parallel_stats = _search(search_workers=4)
+
+    assert len(serial_files["tool1"]) == 134
+    assert len(serial_files["tool2"]) == 133
+    assert parallel_files == serial_files
+    assert parallel_stats == serial_stats
+
+
+def test_contents_num_lines(tmp_path):
+    """
+    Test that contents are only matched within the num_lines of each search pattern,
+    when multiple patterns look for the same strings at different depths
+    """
+    (tmp_path / "shallow.txt").write_text("header\nkeyword 1\n" + "filler\n" * 100)
+    (tmp_path / "deep.txt").write_text("header\n" + "filler\n" * 100 + "keyword 1\n")
+
+    sp_patterns: Dict = yaml.safe_load("""
+tool_lines:
+  contents: "keyword"
+  num_lines: 2
+  shared: true
+tool_re_lines:
+  contents_re: "^keyword \\\\d$"
+  num_lines: 2
+  shared: true
+tool_all:
+  contents: "keyword"
+  contents_re: "^keyword \\\\d$"
+  shared: true
+""")
+
+    _test_search_files(
+        search_patterns=sp_patterns,
+        analysis_dir=tmp_path,
+        extra_config={},
+        expected_paths_by_module={
+            "tool_lines": {"shallow.txt"},
+            "tool_re_lines": {"shallow.txt"},
+            "tool_all": {"shallow.txt", "deep.txt"},
+        },
+    )
+
+
+def test_filename_index(tmp_path):
+    """
+    Test that files are only tested against the search patterns that can match their names,
+    and files that no pattern can match are skipped without reading them
+    """
+    for fn in ["exact.txt", "sample.ext", "sample_suffix.log", "prefix_sample.csv", "regex_1.tsv", "other.txt"]:
+        (tmp_path / fn).write_text("contents\n")
+
+    _test_search_files(
+        search_patterns={
+            "exact": {"fn": "exact.txt"},
+            "ext": {"fn": "*.ext", "contents": "contents"},
+            "suffix": {"fn": "*_suffix.log"},
+            "glob": {"fn": "prefix_*.csv"},
+            "regex": {"fn_re": r"regex_\d\.tsv"},
+        },
+        analysis_dir=tmp_path,
+        extra_config={},
+        expected_paths_by_module={
+            "exact": {"exact.txt"},
+            "ext": {"sample.ext"},
+            "suffix": {"sample_suffix.log"},
+            "glob": {"prefix_sample.csv"},
+            "regex": {"regex_1.tsv"},
+        },
+    )
+    assert report.file_search_stats["skipped_no_filename_match"] == {tmp_path / "other.txt"}
+
+
+def test_search_cache(tmp_path):
+    """
+    Test that search results are reused for unchanged files, and new or changed files are searched
+    """
+    analysis_dir = tmp_path / "analysis"
+    analysis_dir.mkdir()
+    unchanged = analysis_dir / "unchanged.txt"
+    unchanged.write_text("tool1 output\n")
+    changed = analysis_dir / "changed.txt"
+    changed.write_text("tool1 output\n")
+
+    search_patterns = {"tool1": {"contents": "tool1 output"}}
+    extra_config = {"search_cache": True, "search_cache_dir": str(tmp_path / "cache")}
+    _test_search_files(search_patterns, analysis_dir, extra_config, {"tool1": {"unchanged.txt", "changed.txt"}})
+    assert (tmp_path / "cache" / "search_cache.sqlite").exists()
+
+    # Same size and modification time, so the cached result is used even though the contents changed
+    st = unchanged.stat()
+    unchanged.write_text("xxxxx output\n")
+    os.utime(unchanged, ns=(st.st_atime_ns, st.st_mtime_ns))
+    changed.write_text("other output\n")
+    (analysis_dir / "new.txt").write_text("tool1 output\n")
+
+    report.reset()
+    _test_search_files(search_patterns, analysis_dir, extra_config, {"tool1": {"unchanged.txt", "new.txt"}})
+
+    # Not using or resetting the cache searches all files again
+    report.reset()
+    _test_search_files(search_patterns, analysis_dir, {"search_cache": False}, {"tool1": {"new.txt"}})
+    report.reset()
+    extra_config["search_cache_reset"] = True
+    _test_search_files(search_patterns, analysis_dir, extra_config, {"tool1": {"new.txt"}})
+
+
+def test_search_cache_expires_unused_results(tmp_path):
+    """
+    Test that the results of different search patterns are kept side by side, and results that
+    haven't been used for a while are removed
+    """
+    analysis_dir = tmp_path / "analysis"
+    analysis_dir.mkdir()
+    (analysis_dir / "log.txt").write_text("tool1 output\n")
+    extra_config = {"search_cache": True, "search_cache_dir": str(tmp_path / "cache")}
+    cache_path = tmp_path / "cache" / "search_cache.sqlite"
+
+    def _cached_fingerprints():
+        con = sqlite3.connect(cache_path)
+        try:
+            return {row[0] for row in con.execute("SELECT fingerprint FROM search_results")}
+        finally:
+            con.close()
+
+    _test_search_files({"tool1": {"contents": "tool1 output"}}, analysis_dir, extra_config, {"tool1": {"log.txt"}})
+    old_fingerprints = _cached_fingerprints()
+    assert len(old_fingerprints) == 1
+
+    # Alternating search patterns don't evict each other's results
+    report.reset()
+    _test_search_files({"tool1": {"contents": "tool1"}}, analysis_dir, extra_config, {"tool1": {"log.txt"}})
+    new_fingerprints = _cached_fingerprints() - old_fingerprints
+    assert len(new_fingerprints) == 1
+
+    # Results not used for longer than MAX_AGE_DAYS are dropped on the next save
+    con = sqlite3.connect(cache_path)
+    with con:
+        con.execute(
+            "UPDATE search_results SET last_used = ? WHERE fingerprint = ?",
+            (int(time.time()) - (search_cache.MAX_AGE_DAYS + 1) * 24 * 60 * 60, old_fingerprints.pop()),
+        )
+    con.close()
+    report.reset()
+    _test_search_files({"tool1": {"contents": "tool1"}}, analysis_dir, extra_config, {"tool1": {"log.txt"}})
+    assert _cached_fingerprints() == new_fingerprints
+
+
+def test_deep_directory_tree(tmp_path):
+    """
+    Test that directory trees deeper than the recursion limit are walked
+    """
+    recursion_limit = 1000
+    depth = recursion_limit + 100
+    deep_dir = tmp_path
+    for _ in range(depth):
+        deep_dir = deep_dir / "d"
+        deep_dir.mkdir()
+    (deep_dir / "deep.txt").write_text("contents\n")
+
+    orig_recursion_limit = sys.getrecursionlimit()
+    sys.setrecursionlimit(recursion_limit)
+    try:
+        _test_search_files(
+            search_patterns={"module": {"fn": "deep.txt"}},
+            analysis_dir=tmp_path,
+            extra_config={},
+            expected_paths_by_module={"module": {"deep.txt"}},
+        )
+    finally:
+        sys.setrecursionlimit(orig_recursion_limit)
+        # Remove the tree bottom-up, as shutil.rmtree used by pytest to clean up is recursive
+        (deep_dir / "deep.txt").unlink()
+        while deep_dir != tmp_path:
+            deep_dir.rmdir()
+            deep_dir = deep_dir.parent
+    assert report.file_walk_stats["dirs_visited"] == depth + 1
+    assert report.file_walk_stats["entries_visited"] == depth + 2
+
+
+def test_threaded_walk(tmp_path):
+    """
+    Test that listing directories in threads gives the same result as a serial walk
+    """
+    for i in range(5):
+        for j in range(5):
+            d = tmp_path / f"dir{i}" / f"sub{j}"
+            d.mkdir(parents=True)
+            (d / "file.txt").write_text("contents\n")
+        (tmp_path / f"dir{i}" / "file.txt").write_text("contents\n")
+        (tmp_path / f"dir{i}" / "ignored_dir" / "nested").mkdir(parents=True)
+        (tmp_path / f"dir{i}" / "ignored_dir" / "nested" / "file.txt").write_text("contents\n")
+        (tmp_path / f"dir{i}" / "link").symlink_to(tmp_path / f"dir{i}" / "sub0")
+    config.fn_ignore_dirs = ["ignored_dir"]
+    config.ignore_symlinks = True
+
+    serial = walk_analysis_paths([str(tmp_path)])
+    threaded = walk_analysis_paths([str(tmp_path)], threads=4)
+    assert len(serial.files) == 30
+    assert len(serial.skipped_dirs) == 5
+    assert len(serial.skipped_symlinks) == 5
+    assert threaded == serial
+
+
+def test_binary_and_non_utf8_files(tmp_path):
+    """
+    Test that binary files are not searched for contents, while text files with a few
+    non-unicode characters or with old Mac line breaks are
+    """
+    (tmp_path / "binary.txt").write_bytes(b"\x1f\x8b\x08\x04\x00\x00tool1 output\n")
+    (tmp_path / "latin1.txt").write_bytes("café\ntool1 output\n".encode("latin-1"))
+    (tmp_path / "mac.txt").write_bytes(b"header\rtool1 output\r")
+    (tmp_path / "mac_too_far.txt").write_bytes(b"header\rheader\rtool1 output\r")
+
+    _test_search_files(
+        search_patterns={"tool1": {"contents_re": r"tool1 \w+$", "num_lines": 2}},
+        analysis_dir=tmp_path,
+        extra_config={},
+        expected_paths_by_module={"tool1": {"latin1.txt", "mac.txt"}},
+    )
+
+
+@pytest.mark.parametrize(
+    "ext,open_fn",
+    [
+        (".gz", gzip.open),
+        (".bz2", bz2.open),
+        pytest.param(
+            ".zst",
+            zstandard and zstandard.open,
+            marks=pytest.mark.skipif(zstandard is None, reason="zstandard is not installed"),
+        ),
+    ],
+)
+def test_compressed_files(tmp_path, ext, open_fn):
+    """
+    Test that compressed files are matched by the name without the compression extension,
+    searched and read decompressed
+    """
+    with open_fn(tmp_path / f"sample1.stats{ext}", "wt") as fh:
+        fh.write("# tool1 stats\nvalue\t1\n")
+    with open_fn(tmp_path / f"sample2.stats{ext}", "wt") as fh:
+        fh.write("# tool2 stats\nvalue\t2\n")
+
+    _test_search_files(
+        search_patterns={"tool1": {"fn": "*.stats", "contents": "# tool1 stats"}},
+        analysis_dir=tmp_path,
+        extra_config={},
+        expected_paths_by_module={"tool1": {f"sample1.stats{ext}"}},
+    )
+
+    module = BaseMultiqcModule()
+    (f,) = module.find_log_files("tool1")
+    assert f["s_name"] == "sample1"
+    assert f["f"] == "# tool1 stats\nvalue\t1\n"
+    lines = [f["f"].readline() for f in module.find_log_files("tool1", filehandles=True)]
+    assert lines == ["# tool1 stats\n"]
+
+
+@pytest.mark.parametrize("ext,open_fn", [("", open), (".gz", gzip.open)])
+def test_lazy_loaded_files(tmp_path, ext, open_fn):
+    """
+    Test that with `lazy=True`, files are found as `LoadedFile` objects giving the same
+    contents as the strings found by default
+    """
+    contents = {"sample1": "# tool1 stats\r\nvalue\t1\n\nvalue\t\xe9\n", "empty": "", "data": '{"value": 1}\n'}
+    for s_name, text in contents.items():
+        with open_fn(tmp_path / f"{s_name}.stats{ext}", "wt", encoding="utf-8", newline="") as fh:
+            fh.write(text)
+
+    _test_search_files(
+        search_patterns={"tool1": {"fn": "*.stats"}},
+        analysis_dir=tmp_path,
+        extra_config={},
+        expected_paths_by_module={"tool1": {f"{s_name}.stats{ext}" for s_name in contents}},
+    )
+
+    module = BaseMultiqcModule()
+    expected = {f["s_name"]: f["f"] for f in module.find_log_files("tool1")}
+    assert expected["sample1"] == "# tool1 stats\nvalue\t1\n\nvalue\t\xe9\n"
+    for f in module.find_log_files("tool1", lazy=True):
+        assert isinstance(f["f"], LoadedFile)
+        assert list(f["f"].lines()) == expected[f["s_name"]].splitlines()
+        assert f["f"].bytes[:] == contents[f["s_name"]].encode()
+        assert f["f"].text == expected[f["s_name"]]
+        assert list(f["f"].lines()) == expected[f["s_name"]].splitlines()
+        if f["s_name"] == "data":
+            assert f["f"].json() == {"value": 1}
+        f["f"].close()
+        assert f["f"].text == expected[f["s_name"]]
+
+    if ext == ".gz":
+        # A truncated file is skipped as without `lazy`, instead of raising when the contents are read
+        with gzip.open(tmp_path / "truncated.stats.gz", "wt") as fh:
+            fh.write("".join(f"value\t{i}\n" for i in range(10000)))
+        data = (tmp_path / "truncated.stats.gz").read_bytes()
+        (tmp_path / "truncated.stats.gz").write_bytes(data[: len(data) // 2])
+        files = {ModuleId("tool1"): [FileDict(fn="truncated.stats.gz", root=str(tmp_path))]}
+        assert list(module.find_log_files("tool1", files=files)) == []
+        (f,) = module.find_log_files("tool1", files=files, lazy=True)
+        lines = list(f["f"].lines())
+        assert lines == [f"value\t{i}" for i in range(len(lines))]
+        assert f["f"].bytes == b""
+        assert f["f"].text == ""
+
+
+def test_path_filters(tmp_path):
+    """
+    Test that the compiled path filters select the same files as matching each pattern with fnmatch,
+    including patterns relative to the analysis directory
+    """
+    for path in ["a/s1.log", "a/s2.log", "b/s1.log", "b/s3.log", "b/c/s4.log"]:
+        (tmp_path / path).parent.mkdir(parents=True, exist_ok=True)
+        (tmp_path / path).write_text("tool1 output\n")
+
+    _test_search_files(
+        search_patterns={"tool1": {"fn": "*.log"}},
+        analysis_dir=tmp_path,
+        extra_config={},
+        expected_paths_by_module={"tool1": {"s1.log", "s2.log", "s3.log", "s4.log"}},
+    )
+
+    def selected(mod_cust_config):
+        module = BaseMultiqcModule()
+        module.mod_cust_config = mod_cust_config
+        paths = sorted(
+            os.path.relpath(os.path.join(f["root"], f["fn"]), tmp_path) for f in module.find_log_files("tool1")
+        )
+        # Verdicts are kept for the files already checked
+        assert module._path_filters is not None
+        assert len(module._path_filters.verdicts) == len(report.files[ModuleId("tool1")])
+        assert len(list(module.find_log_files("tool1"))) == len(paths)
+        return paths
+
+    assert selected({"path_filters": ["a/*"]}) == ["a/s1.log", "a/s2.log"]
+    assert selected({"path_filters": "./b/*.log"}) == ["b/c/s4.log", "b/s1.log", "b/s3.log"]
+    assert selected({"path_filters": ["*/s1.log", "*/s?.log"], "path_filters_exclude": ["*/b/*"]}) == [
+        "a/s1.log",
+        "a/s2.log",
+    ]
+    assert selected({"path_filters_exclude": ["*/c/*", "*/s[12].log"]}) == ["b/s3.log"]
+
+
+def test_read_ahead(tmp_path):
+    """
+    Test that reading the files ahead in threads yields the same files in the same order,
+    and closes the files read ahead when the module stops iterating early
+    """
+    for i in range(20):
+        with gzip.open(tmp_path / f"sample{i}.log.gz", "wt") as fh:
+            fh.write(f"tool1 output\n{i}\n")
+    (tmp_path / "sample20.log").write_bytes(b"tool1 output\n\xff\n")
+
+    _test_search_files(
+        search_patterns={"tool1": {"fn": "*.log"}},
+        analysis_dir=tmp_path,
+        extra_config={},
+        expected_paths_by_module={"tool1": {f"sample{i}.log.gz" if i < 20 else "sample20.log" for i in range(21)}},
+    )
+
+    module = BaseMultiqcModule()
+    expected = [(f["fn"], f["f"]) for f in module.find_log_files("tool1")]
+    config.read_ahead_files = 4
+    assert [(f["fn"], f["f"]) for f in module.find_log_files("tool1")] == expected
+    first_lines = [(f["fn"], f["f"].buffer.readline()) for f in module.find_log_files("tool1", filehandles=True)]
+    assert first_lines == [(fn, b"tool1 output\n") for fn, _ in expected]
+
+    handles = []
+    for f in module.find_log_files("tool1", filehandles=True):
+        handles.append(f["f"])
+        if len(handles) == 2:
+            break
+    assert all(fh.closed for fh in handles)
+
+    # Reading ahead pauses while the items read add up to the byte limit
+    read = []
+
+    def _open(i):
+        read.append(i)
+        yield str(i) * 100
+
+    items = read_ahead(range(10), _open, size=len, max_items=4, max_bytes=150)
+    assert next(items) == "0" * 100
+    time.sleep(0.1)
+    assert next(items) == "1" * 100
+    assert len(read) <= 4
+    assert list(items) == [str(i) * 100 for i in range(2, 10)]
+
+
+def test_compressed_file_head_only(tmp_path):
+    """
+    Test that searching a compressed file only decompresses the lines needed by the search patterns
+    """
+    path = tmp_path / "big.log.gz"
+    with gzip.open(path, "wt") as fh:
+        fh.write("header\n")
+        fh.write("line\n" * 1_000_000)
+
+    f = SearchFile(path)
+    scan = ContentScan(ContentMatcher([{ModuleId("tool1"): [SearchPattern(contents={"header"})]}]), f)
+    scan.scan(num_lines=10)
+    f.close()
+    assert scan.string_lines == {"header": 1}
+    assert scan.lines_scanned < 100_000
+
+
+def test_search_pattern_stats(tmp_path):
+    """
+    Test that the file search work is counted per search pattern key when profiling
+    """
+    (tmp_path / "tool1.log").write_text("tool1 output\n" + "line\n" * 10)
+    (tmp_path / "tool2.log").write_text("tool2 output\n")
+    (tmp_path / "other.txt").write_text("other\n")
+
+    _test_search_files(
+        search_patterns={
+            "tool1": {"fn": "*.log", "contents": "tool1 output", "num_lines": 1},
+            "tool2": {"fn": "*.log", "contents": "tool2 output", "num_lines": 1},
+        },
+        analysis_dir=tmp_path,
+        extra_config={"profile_runtime": True},
+        expected_paths_by_module={"tool1": {"tool1.log"}, "tool2": {"tool2.log"}},
+    )
+    tool1, tool2 = report.runtimes.sp_stats["tool1"], report.runtimes.sp_stats["tool2"]
+    assert (tool1.files_tested, tool1.files_opened, tool1.matches) == (2, 2, 1)
+    assert tool1.lines_read == 12
+    assert tool1.bytes_read == len("tool1 output\n" + "line\n" * 10 + "tool2 output\n")
+    assert tool1.blocks_from_disk == 2 and tool1.blocks_from_cache == 0
+    # tool2.log was already read and scanned for both search patterns when testing for tool1
+    assert (tool2.files_tested, tool2.files_opened, tool2.matches) == (1, 0, 1)
+    assert tool2.bytes_read == 0 and tool2.blocks_from_disk == 0
+    assert report.runtimes.sp_filesizes == {"<1 KB": 2}
+
+
+def test_search_file_bounded_cache(tmp_path, monkeypatch):
+    """
+    Test that only the blocks with the first lines of a file are cached, and that iterating
+    again past them reads the rest of the file again
+    """
+    path = tmp_path / "big.txt"
+    path.write_text("".join(f"line {i}\n" for i in range(100_000)))
+    monkeypatch.setattr(SearchFile, "read_size", 1024)
+
+    f = SearchFile(path, max_cached_lines=100)
+    blocks = list(f.line_block_iterator())
+    assert sum(n for n, _ in blocks) == 100_000
+    assert 100 <= sum(n for n, _ in f._blocks) < 300
+    assert list(f.line_block_iterator()) == blocks
+    f.close()